@@ -0,0 +1,158 @@
+"""
+Times the CLI-facing BL methods against synthetic datasets of growing size.
+
+Usage: python -m benchmarks.bench_bl [--sizes 30 150 600] [--database-url URL --reset] [--output results.json]
+
+Each size loads a fresh dataset with `db.seed`, then runs every
+method `--repeat` times, each run in its own unit of work as a CLI command
+would. The default database is an in-memory SQLite stand-in; a PostgreSQL URL
+is only used with `--reset`, since its tables are dropped and recreated.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+
+import sqlalchemy
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from bl.client_bl import ClientBLL
+from bl.collaborator_bl import CollaboratorBL
+from bl.contract_bl import ContractBL
+from bl.event_bl import EventBL
+from db.seed import SEED_DOMAIN, SeedSpec, seed_database
+from db.session import create_engine_from_settings, unit_of_work
+from models import Base
+
+DEFAULT_SPEC = SeedSpec()
+
+# name, BL class, call; `data` holds the payload of one collaborator per role and the id of
+# one existing client, contract and event
+CASES = (
+    ("ClientBLL.get_all_clients", ClientBLL, lambda bl, data: bl.get_all_clients()),
+    ("ClientBLL.get_clients_page", ClientBLL, lambda bl, data: bl.get_clients_page()),
+    ("ClientBLL.get_client", ClientBLL, lambda bl, data: bl.get_client(data["client_id"])),
+    ("CollaboratorBL.get_all_collaborators", CollaboratorBL, lambda bl, data: bl.get_all_collaborators()),
+    ("ContractBL.list_all_contracts", ContractBL, lambda bl, data: bl.list_all_contracts()),
+    ("ContractBL.list_contracts_page", ContractBL, lambda bl, data: bl.list_contracts_page()),
+    ("ContractBL.list_signed_contracts", ContractBL, lambda bl, data: bl.list_signed_contracts(data["commercial"])),
+    ("ContractBL.list_unsigned_contracts", ContractBL,
+     lambda bl, data: bl.list_unsigned_contracts(data["commercial"])),
+    ("ContractBL.list_unpaid_contract", ContractBL, lambda bl, data: bl.list_unpaid_contract(data["commercial"])),
+    ("ContractBL.get_contract", ContractBL, lambda bl, data: bl.get_contract(data["contract_id"])),
+    ("EventBL.list_all_events", EventBL, lambda bl, data: bl.list_all_events()),
+    ("EventBL.list_events_page", EventBL, lambda bl, data: bl.list_events_page()),
+    ("EventBL.list_events_without_support", EventBL,
+     lambda bl, data: bl.list_events_without_support(data["gestion"])),
+    ("EventBL.list_events_for_current_support", EventBL,
+     lambda bl, data: bl.list_events_for_current_support(data["support"])),
+    ("EventBL.get_event", EventBL, lambda bl, data: bl.get_event(data["event_id"])),
+    ("EventBL.auto_assign_support", EventBL, lambda bl, data: bl.auto_assign_support(data["gestion"], dry_run=True)),
+)
+
+
+def _rows(result) -> int:
+    items = getattr(result, "items", result)
+    return len(items) if isinstance(items, list) else 1
+
+
+def _revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_cases(session_factory, data: dict, repeat: int) -> list[dict]:
+    results = []
+    for name, bl_class, call in CASES:
+        timings = []
+        # The first run warms the connection and the statement caches, and is not kept
+        for run in range(repeat + 1):
+            with unit_of_work(session_factory) as db:
+                start = time.perf_counter()
+                rows = _rows(call(bl_class(db), data))
+                elapsed = (time.perf_counter() - start) * 1000
+            if run:
+                timings.append(elapsed)
+        results.append({"method": name, "rows": rows, "min_ms": round(min(timings), 3),
+                        "median_ms": round(statistics.median(timings), 3), "max_ms": round(max(timings), 3)})
+    return results
+
+
+def run(database_url: str, sizes: list[int], repeat: int, spec: SeedSpec, workers: int = 1) -> dict:
+    runs = []
+    for size in sizes:
+        engine = create_engine_from_settings(database_url)
+        try:
+            Base.metadata.drop_all(bind=engine)
+            Base.metadata.create_all(bind=engine)
+            session_factory = sessionmaker(bind=engine, autoflush=False)
+
+            start = time.perf_counter()
+            dataset = seed_database(engine, replace(spec, collaborators=size), workers=workers)
+            load_seconds = time.perf_counter() - start
+
+            data = {role: {"id": user_id, "sub": f"{role}{user_id}@{SEED_DOMAIN}",
+                           "email": f"{role}{user_id}@{SEED_DOMAIN}", "role": role}
+                    for role, user_id in dataset["users"].items()}
+            with unit_of_work(session_factory) as db:
+                data["client_id"] = ClientBLL(db).get_clients_page(limit=1).items[0].id
+                data["contract_id"] = ContractBL(db).list_contracts_page(limit=1).items[0].id
+                data["event_id"] = EventBL(db).list_events_page(limit=1).items[0].id
+            runs.append({"collaborators": size, "counts": dataset["counts"], "load_seconds": round(load_seconds, 3),
+                         "results": time_cases(session_factory, data, repeat)})
+        finally:
+            engine.dispose()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": _revision(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "database": make_url(database_url).get_backend_name(),
+            "repeat": repeat,
+            "spec": {key: value for key, value in asdict(spec).items() if key != "collaborators"},
+        },
+        "runs": runs,
+    }
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite://", help="database to load, in-memory SQLite by default")
+    parser.add_argument("--reset", action="store_true", help="allow dropping the tables of a non in-memory database")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 150, 600],
+                        help="numbers of collaborators, one dataset per size")
+    parser.add_argument("--clients-per-commercial", type=int, default=DEFAULT_SPEC.clients_per_commercial)
+    parser.add_argument("--contracts-per-client", type=int, default=DEFAULT_SPEC.contracts_per_client)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per method")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SPEC.seed)
+    parser.add_argument("--workers", type=int, default=1, help="loading processes, 1 for an in-memory database")
+    parser.add_argument("--output", help="JSON results file, standard output by default")
+    args = parser.parse_args(argv)
+
+    if make_url(args.database_url).database not in (None, "", ":memory:") and not args.reset:
+        parser.error("the tables of --database-url are dropped and recreated: pass --reset to confirm")
+
+    spec = SeedSpec(clients_per_commercial=args.clients_per_commercial,
+                    contracts_per_client=args.contracts_per_client, seed=args.seed)
+    report = json.dumps(run(args.database_url, args.sizes, args.repeat, spec, args.workers), indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures password hashing throughput with the hashing executors.
+
+Usage: python -m benchmarks.bench_password_hashing [--count N] [--workers 1 2 4 ...]
+
+The sequential run is the baseline; each executor run reports its throughput
+and its speed-up over the baseline. With bcrypt releasing the GIL, the thread
+pool is expected to scale with the number of cores.
+"""
+import argparse
+import json
+import os
+import time
+
+from security.password import create_hashing_executor, hash_many, hash_password, verify_many
+
+
+def _measure(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(count: int, workers: list[int], kinds: list[str]) -> list[dict]:
+    passwords = [f"password-{i}" for i in range(count)]
+    hashes = [hash_password(password) for password in passwords]
+    credentials = list(zip(passwords, hashes))
+
+    baseline = _measure(lambda: [hash_password(password) for password in passwords])
+    results = [{"executor": "sequential", "workers": 1, "operation": "hash",
+                "seconds": round(baseline, 4), "per_second": round(count / baseline, 2), "speedup": 1.0}]
+
+    for kind in kinds:
+        for worker_count in workers:
+            with create_hashing_executor(kind, worker_count) as executor:
+                # Starts the workers before timing
+                hash_many(passwords[:worker_count], executor)
+                for operation, fn in (("hash", lambda: hash_many(passwords, executor)),
+                                      ("verify", lambda: verify_many(credentials, executor))):
+                    seconds = _measure(fn)
+                    results.append({"executor": kind, "workers": worker_count, "operation": operation,
+                                    "seconds": round(seconds, 4), "per_second": round(count / seconds, 2),
+                                    "speedup": round(baseline / seconds, 2)})
+    return results
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=32, help="passwords per run")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, cpus}), help="pool sizes to measure")
+    parser.add_argument("--executor", choices=["thread", "process"], nargs="+", default=["thread", "process"])
+    args = parser.parse_args()
+
+    results = run(args.count, args.workers, args.executor)
+    print(json.dumps({"cpus": cpus, "count": args.count, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from collections.abc import Iterator
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from bl.client_bl import ClientBLL
+from bl.collaborator_bl import CollaboratorBL
+from bl.contract_bl import ContractBL
+from bl.event_bl import EventBL
+from bl.role_bl import RoleBL
+from db.async_session import async_unit_of_work
+
+
+class AsyncBL:
+    """
+    Asyncio twin of a synchronous BL.
+
+    Every public method of `bl_class` is exposed as a coroutine running in its
+    own unit of work, with its own session. Independent calls can therefore be
+    awaited together with `asyncio.gather`. Streaming methods are refused, as
+    their session is closed before they could be iterated: use the async DAL.
+    """
+    bl_class: type
+
+    def __init__(self, session_factory: async_sessionmaker | None = None):
+        self.session_factory = session_factory
+
+    async def _run(self, fn):
+        async with async_unit_of_work(self.session_factory) as db:
+            return await db.run_sync(fn)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(self.bl_class, name, None)):
+            raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+        async def method(*args, **kwargs):
+            result = await self._run(lambda session: getattr(self.bl_class(session), name)(*args, **kwargs))
+            if isinstance(result, Iterator):
+                raise TypeError(f"{name} streams its rows after its session is closed: use the async DAL")
+            return result
+
+        method.__name__ = name
+        return method
+
+
+class AsyncClientBLL(AsyncBL):
+    bl_class = ClientBLL
+
+
+class AsyncCollaboratorBL(AsyncBL):
+    bl_class = CollaboratorBL
+
+
+class AsyncContractBL(AsyncBL):
+    bl_class = ContractBL
+
+
+class AsyncRoleBL(AsyncBL):
+    bl_class = RoleBL
+
+
+class AsyncEventBL(AsyncBL):
+    bl_class = EventBL
@@ -3,19 +3,25 @@ from sqlalchemy.orm import Session
 from dal.client_dal import ClientDAL
 from dal.collaborator_dal import CollaboratorDAL
 from security.permissions import is_commercial
+from security.principal import resolve_principal
 from datetime import date
+from typing import Iterator
 from dtos.client_dto import ClientDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import DEFAULT_PAGE_SIZE
+from monitoring.tracing import traced_methods
 
 
+@traced_methods("bl")
 class ClientBLL:
     def __init__(self, db: Session):
-        self.dal = ClientDAL(db)
+        self.dal = ClientDAL(db, projection=True)
         self.collaborator_dal = CollaboratorDAL(db)
 
     def create_client(self, data: dict, current_user: dict) -> ClientDTO:
         if not is_commercial(current_user):
             raise PermissionError("Seuls les commerciaux peuvent créer un client")
-        collaborator = self.collaborator_dal.get_by_email_raw(current_user["sub"])
+        collaborator = resolve_principal(current_user, self.collaborator_dal)
         if not collaborator:
             raise ValueError("collaborateur introuvable")
 
@@ -38,7 +44,7 @@ class ClientBLL:
         if self.dal.get_by_email(email):
             raise ValueError("Un client avec cet email existe déjà.")
 
-        commercial = self.collaborator_dal.get_by_email_raw(current_user["sub"])
+        commercial = resolve_principal(current_user, self.collaborator_dal)
         if not commercial:
             raise ValueError("collaborateur introuvable")
 
@@ -62,7 +68,7 @@ class ClientBLL:
         if not is_commercial(current_user):
             raise PermissionError("Seuls les commerciaux peuvent modifier un client")
 
-        commercial = self.collaborator_dal.get_by_email_raw(current_user["sub"])
+        commercial = resolve_principal(current_user, self.collaborator_dal)
         if not commercial:
             raise ValueError("collaborateur introuvable")
 
@@ -84,7 +90,7 @@ class ClientBLL:
         if not is_commercial(current_user):
             raise PermissionError("Seuls les commerciaux peuvent modifier un client")
 
-        current_collab = self.collaborator_dal.get_by_email_raw(current_user["sub"])
+        current_collab = resolve_principal(current_user, self.collaborator_dal)
         if not current_collab:
             raise ValueError("collaborateur introuvable")
 
@@ -110,6 +116,12 @@ class ClientBLL:
     def get_all_clients(self) -> list[ClientDTO]:
         return self.dal.get_all()
 
+    def get_clients_page(self, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE) -> PageDTO[ClientDTO]:
+        return self.dal.get_page(after=after, limit=limit)
+
+    def stream_clients(self, chunk_size: int = 1000) -> Iterator[ClientDTO]:
+        return self.dal.stream(chunk_size=chunk_size)
+
     def get_client(self, client_id: int) -> ClientDTO:
         client = self.dal.get(client_id)
         if not client:
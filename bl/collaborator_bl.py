@@ -4,10 +4,15 @@ from dal.collaborator_dal import CollaboratorDAL
 from dal.role_dal import RoleDAL
 from security.permissions import can_manage_collaborators
 from dtos.collaborator_dto import CollaboratorDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import DEFAULT_PAGE_SIZE
 from security.password import hash_password
+from security.principal import invalidate_principal
 from monitoring.sentry_logging import log_sentry
+from monitoring.tracing import traced_methods
 
 
+@traced_methods("bl")
 class CollaboratorBL:
     def __init__(self, db: Session):
         self.dal = CollaboratorDAL(db)
@@ -76,12 +81,18 @@ class CollaboratorBL:
     def get_all_collaborators(self) -> list[CollaboratorDTO]:
         return self.dal.get_all()
 
+    def get_collaborators_page(self, after: int | None = None,
+                               limit: int = DEFAULT_PAGE_SIZE) -> PageDTO[CollaboratorDTO]:
+        return self.dal.get_page(after=after, limit=limit)
+
     def update_collaborator(self, collaborator_id: int, updates: dict, current_user: dict) -> CollaboratorDTO:
         if not can_manage_collaborators(current_user):
             raise PermissionError("Vous n'avez pas le droit de modifier un collaborateur")
         updated_collaborator = self.dal.update_by_id(collaborator_id, updates)
         if not updated_collaborator:
             raise ValueError("collaborateur introuvable")
+        # Tokens already issued must not keep the former role
+        invalidate_principal(collaborator_id)
 
         log_sentry(f"Collaborateur modifié : "
                    f"{updated_collaborator.name} (ID: {updated_collaborator.id})", current_user)
@@ -94,3 +105,4 @@ class CollaboratorBL:
         success = self.dal.delete_by_id(collaborator_id)
         if not success:
             raise ValueError("collaborateur introuvable")
+        invalidate_principal(collaborator_id)
@@ -1,13 +1,19 @@
+from typing import Iterator
 from sqlalchemy.orm import Session
 from dal.contract_dal import ContractDAL
 from security.permissions import can_manage_contracts, is_commercial
+from dtos.contract_batch import ContractBatch
 from dtos.contract_dto import ContractDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import DEFAULT_PAGE_SIZE
 from sentry_sdk import capture_message, set_user
+from monitoring.tracing import traced_methods
 
 
+@traced_methods("bl")
 class ContractBL:
     def __init__(self, db: Session):
-        self.dal = ContractDAL(db)
+        self.dal = ContractDAL(db, projection=True)
 
     def create_contract(self, contract_data: dict, current_user: dict) -> ContractDTO:
         if not can_manage_contracts(current_user):
@@ -40,6 +46,31 @@ class ContractBL:
 
         return updated_contract
 
+    def update_contracts(self, contract_ids, updates: dict, current_user: dict) -> int:
+        if not can_manage_contracts(current_user):
+            raise PermissionError("Vous n'avez pas les droits pour modifier ce contrat.")
+
+        contract_ids = set(contract_ids)
+        contracts = self.dal.get_by_ids(contract_ids)
+        missing = contract_ids - {c.id for c in contracts}
+        if missing:
+            raise ValueError(f"Contrats introuvables : {', '.join(map(str, sorted(missing)))}.")
+
+        if is_commercial(current_user):
+            if any(c.commercial_id != current_user["id"] for c in contracts):
+                raise PermissionError("Vous ne pouvez modifier que les contrats de vos clients.")
+
+        updated = self.dal.update_many(contract_ids, updates)
+
+        # Same log as update_contract, once for the whole batch
+        signed = [c.id for c in contracts if not c.status and updates.get("status", c.status)]
+        if signed:
+            set_user({"email": current_user["email"]})
+            capture_message(f"Contrats {', '.join(f'#{i}' for i in signed)} signés par {current_user['email']}",
+                            level="info")
+
+        return updated
+
     def get_contract(self, contract_id: int) -> ContractDTO:
         contract = self.dal.get(contract_id)
         if not contract:
@@ -59,7 +90,18 @@ class ContractBL:
     def list_unpaid_contract(self, current_user: dict) -> list[ContractDTO]:
         if not is_commercial(current_user):
             raise PermissionError("Seuls les commerciaux peuvent filtrer les contrats.")
-        return [c for c in self.dal.get_all() if c.amount_left > 0]
+        return self.dal.filter_unpaid()
+
+    def stream_contracts(self, current_user: dict, signed: bool | None = None, unpaid: bool = False,
+                         chunk_size: int = 1000) -> Iterator[ContractBatch]:
+        # Same rule as the list filters; the check runs before the first row is read
+        if (signed is not None or unpaid) and not is_commercial(current_user):
+            raise PermissionError("Seuls les commerciaux peuvent filtrer les contrats.")
+        return self.dal.stream_batches(signed=signed, unpaid=unpaid, chunk_size=chunk_size)
 
     def list_all_contracts(self) -> list[ContractDTO]:
         return self.dal.get_all()
+
+    def list_contracts_page(self, after: int | None = None,
+                            limit: int = DEFAULT_PAGE_SIZE) -> PageDTO[ContractDTO]:
+        return self.dal.get_page(after=after, limit=limit)
@@ -1,16 +1,63 @@
+from typing import Iterator
+from datetime import datetime
 from sqlalchemy.orm import Session
+from bl.interval_index import IntervalIndex
+from bl.support_scheduler import plan_assignments
 from dal.event_dal import EventDAL
 from dal.contract_dal import ContractDAL
 from dal.collaborator_dal import CollaboratorDAL
+from dtos.assignment_dto import AutoAssignmentDTO
+from dtos.collaborator_dto import CollaboratorDTO
+from dtos.contract_dto import ContractDTO
 from dtos.event_dto import EventDTO
-from security.permissions import can_manage_events, is_commercial, is_support
+from dtos.page_dto import PageDTO
+from dal.pagination import DEFAULT_PAGE_SIZE
+from security.permissions import can_manage_events, has_permission, is_commercial, is_support
+from security.principal import Principal, resolve_principal
+from monitoring.tracing import traced_methods
 
+SCHEDULE_FIELDS = {"support_id", "start_date", "end_date"}
 
+
+class SchedulingConflictError(ValueError):
+    """
+    Raised when a support collaborator would be assigned to overlapping
+    events. `conflicts` holds the ids of the events already on the slot.
+    """
+
+    def __init__(self, support_id: int, conflicts: list[int]):
+        self.support_id = support_id
+        self.conflicts = conflicts
+        super().__init__(f"Le support #{support_id} est déjà assigné sur ce créneau : "
+                         f"évènement(s) {', '.join(f'#{c}' for c in conflicts)}.")
+
+
+@traced_methods("bl")
 class EventBL:
     def __init__(self, db: Session):
-        self.dal = EventDAL(db)
-        self.contract_dal = ContractDAL(db)
+        self.dal = EventDAL(db, projection=True)
+        self.contract_dal = ContractDAL(db, projection=True)
         self.collaborator_dal = CollaboratorDAL(db)
+        # Schedules of the support collaborators, loaded for the batch checks of the unit of work
+        self._schedules: dict[int, IntervalIndex] = {}
+
+    def _support_schedule(self, support_id: int) -> IntervalIndex:
+        schedule = self._schedules.get(support_id)
+        if schedule is None:
+            schedule = IntervalIndex((e.start_date, e.end_date, e.id) for e in self.dal.get_by_support_id(support_id)
+                                     if e.start_date and e.end_date)
+            self._schedules[support_id] = schedule
+        return schedule
+
+    def check_support_availability(self, support_id: int, start: datetime, end: datetime,
+                                   exclude_event_id: int | None = None) -> list[int]:
+        """
+        Returns the ids of the events of the support overlapping `[start, end)`.
+
+        A single slot is checked with one indexed query; the whole schedule is
+        only loaded to check a batch of events (see `_check_batch_schedule`).
+        """
+        return self.dal.find_overlapping(support_id, start, end, exclude_event_id=exclude_event_id)
 
     def get_event(self, event_id: int) -> EventDTO:
         event = self.dal.get(event_id)
@@ -21,12 +68,25 @@ class EventBL:
     def list_all_events(self) -> list[EventDTO]:
         return self.dal.get_all()
 
+    def list_events_page(self, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE) -> PageDTO[EventDTO]:
+        return self.dal.get_page(after=after, limit=limit)
+
     def create_event(self, event_data: dict, current_user: dict) -> EventDTO:
         if not is_commercial(current_user):
             raise PermissionError("Seuls les commerciaux peuvent créer un évènements")
 
-        # Checks that the contract exists
         contract = self.contract_dal.get(event_data["contract_id"])
+        user = resolve_principal(current_user, self.collaborator_dal)
+        self.check_contract_for_event(contract, user)
+
+        if event_data["end_date"] < event_data["start_date"]:
+            raise ValueError("La date de fin doit être postérieure à la date de début.")
+
+        return self.dal.create(event_data)
+
+    @staticmethod
+    def check_contract_for_event(contract: ContractDTO | None, user: Principal) -> None:
+        # Checks that the contract exists
         if not contract:
             raise ValueError("Le contrat introuvable.")
 
@@ -35,40 +95,147 @@ class EventBL:
             raise PermissionError("Impossible de créer un évènement pour un contrat non signé.")
 
         # Checks that the collaborator manages the contract
-        user = self.collaborator_dal.get_by_email_raw(current_user["sub"])
         if contract.commercial_id != user.id:
             raise PermissionError("Vous ne pouvez créer un évènement que pour vos propres contrats.")
 
-        return self.dal.create(event_data)
-
-    def update_event(self, event_id: int, updates: dict, current_user: dict) -> EventDTO:
+    def update_event(self, event_id: int, updates: dict, current_user: dict,
+                     allow_conflicts: bool = False) -> EventDTO:
         event = self.dal.get(event_id)
         if not event:
             raise ValueError("Évènement introuvable.")
 
-        # Management can modify all events
-        if can_manage_events(current_user):
-            return self.dal.update_by_id(event_id, updates)
-
-        # Support can update its own event
-        if is_support(current_user):
-            user = self.collaborator_dal.get_by_email_raw(current_user["sub"])
+        # Management can modify all events, support can update its own event
+        if not can_manage_events(current_user):
+            if not is_support(current_user):
+                raise PermissionError("Vous n'avez pas les droits pour modifier cet évènement.")
+            user = resolve_principal(current_user, self.collaborator_dal)
             if event.support_id != user.id:
                 raise PermissionError("Vous ne pouvez modifier que les événements qui vous sont attribués.")
-            return self.dal.update_by_id(event_id, updates)
 
-        raise PermissionError("Vous n'avez pas les droits pour modifier cet évènement.")
+        if SCHEDULE_FIELDS & updates.keys():
+            self._check_schedule(event, updates, allow_conflicts)
+
+        updated = self.dal.update_by_id(event_id, updates)
+        # The cached schedules of the former and the new support are out of date
+        self._schedules.pop(event.support_id, None)
+        self._schedules.pop(updated.support_id, None)
+        return updated
+
+    def _check_schedule(self, event: EventDTO, updates: dict, allow_conflicts: bool) -> None:
+        support_id = updates.get("support_id", event.support_id)
+        start = updates.get("start_date", event.start_date)
+        end = updates.get("end_date", event.end_date)
+        if start and end and end < start:
+            raise ValueError("La date de fin doit être postérieure à la date de début.")
+        if support_id is None or allow_conflicts or not (start and end):
+            return
+
+        conflicts = self.check_support_availability(support_id, start, end, exclude_event_id=event.id)
+        if conflicts:
+            raise SchedulingConflictError(support_id, conflicts)
+
+    def assign_support(self, event_ids, support_id: int | None, current_user: dict,
+                       allow_conflicts: bool = False) -> int:
+        # Same rule as the interactive update: only management reassigns the support
+        if not has_permission(current_user, ["gestion"]):
+            raise PermissionError("Seuls les gestionnaires peuvent assigner un support.")
+
+        event_ids = set(event_ids)
+        if not event_ids:
+            raise ValueError("Aucun évènement sélectionné.")
+
+        events = self.dal.get_by_ids(event_ids)
+        missing = event_ids - {e.id for e in events}
+        if missing:
+            raise ValueError(f"Évènements introuvables : {', '.join(map(str, sorted(missing)))}.")
+
+        if support_id is not None:
+            support = self.collaborator_dal.get_by_id(support_id)
+            if not support or support.role_name != "support":
+                raise ValueError("Collaborateur support introuvable.")
+            if not allow_conflicts:
+                self._check_batch_schedule(events, support_id)
+
+        count = self.dal.update_many(event_ids, {"support_id": support_id})
+        self._schedules.clear()
+        return count
+
+    def _check_batch_schedule(self, events: list[EventDTO], support_id: int) -> None:
+        # The events of the batch must neither overlap the schedule of the support nor each other
+        schedule = self._support_schedule(support_id)
+        batch_ids = {e.id for e in events}
+        batch = IntervalIndex()
+        conflicts = set()
+        for event in events:
+            if not (event.start_date and event.end_date):
+                continue
+            conflicts.update(c for c in schedule.find(event.start_date, event.end_date) if c not in batch_ids)
+            overlapping = batch.find(event.start_date, event.end_date)
+            if overlapping:
+                conflicts.update([event.id, *overlapping])
+            batch.add(event.start_date, event.end_date, event.id)
+        if conflicts:
+            raise SchedulingConflictError(support_id, sorted(conflicts))
+
+    def auto_assign_support(self, current_user: dict, dry_run: bool = False) -> AutoAssignmentDTO:
+        """
+        Assigns every event without support to the least loaded support free
+        on its slot, without creating any scheduling conflict.
+
+        The events without support, the supports and their events over the
+        same period are loaded with three queries, the plan is computed in
+        memory by `plan_assignments`, and written back with one batched update.
+        """
+        if not has_permission(current_user, ["gestion"]):
+            raise PermissionError("Seuls les gestionnaires peuvent assigner un support.")
+
+        events = [(e.start_date, e.end_date, e.id) for e in self.dal.stream(without_support=True)]
+        # Events without valid dates cannot be placed on a schedule
+        dated = [event for event in events if event[0] and event[1] and event[0] <= event[1]]
+        supports = self.collaborator_dal.get_by_role("support")
+        if not dated or not supports:
+            return AutoAssignmentDTO(unassigned=sorted(event_id for _, _, event_id in events))
+
+        busy = {s.id: [] for s in supports}
+        period_start, period_end = min(start for start, _, _ in dated), max(end for _, end, _ in dated)
+        for event in self.dal.get_for_supports(busy, period_start, period_end):
+            busy[event.support_id].append((event.start_date, event.end_date, event.id))
+        schedules = {support_id: IntervalIndex(intervals) for support_id, intervals in busy.items()}
+        loads = {support_id: sum((end - start).total_seconds() for start, end, _ in intervals)
+                 for support_id, intervals in busy.items()}
+
+        plan = plan_assignments(dated, schedules, loads)
+        if plan and not dry_run:
+            self.dal.bulk_update([{"id": event_id, "support_id": support_id} for event_id, support_id in plan.items()])
+            self._schedules.clear()
+        return AutoAssignmentDTO(assignments=plan,
+                                 unassigned=sorted(event_id for _, _, event_id in events if event_id not in plan))
+
+    def find_free_supports(self, start: datetime, end: datetime, current_user: dict) -> list[CollaboratorDTO]:
+        # Availabilities are looked up to assign the support, which only management does
+        if not has_permission(current_user, ["gestion"]):
+            raise PermissionError("Seuls les gestionnaires peuvent acceder à cette fonction.")
+        if end <= start:
+            raise ValueError("La date de fin doit être postérieure à la date de début.")
+        return self.collaborator_dal.get_available("support", start, end)
 
     def list_events_without_support(self, current_user: dict) -> list[EventDTO]:
         if not can_manage_events(current_user):
             raise PermissionError("Seuls les gestionnaires peuvent acceder à cette fonction.")
         return self.dal.get_without_support()
 
+    def stream_events(self, current_user: dict, without_support: bool = False,
+                      chunk_size: int = 1000) -> Iterator[EventDTO]:
+        # Same rule as list_events_without_support; the check runs before the first row is read
+        if without_support and not can_manage_events(current_user):
+            raise PermissionError("Seuls les gestionnaires peuvent acceder à cette fonction.")
+        return self.dal.stream(without_support=without_support, chunk_size=chunk_size)
+
     def list_events_for_current_support(self, current_user: dict) -> list[EventDTO]:
         if not is_support(current_user):
             raise PermissionError("Seuls les membres de l'équipe support peuvent voir leurs évènements.")
 
-        user = self.collaborator_dal.get_by_email_raw(current_user["sub"])
+        user = resolve_principal(current_user, self.collaborator_dal)
         if not user:
             raise ValueError("Utilisateur introuvable.")
         return self.dal.get_by_support_id(user.id)
@@ -0,0 +1,225 @@
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from sqlalchemy.orm import Session
+from bl.event_bl import EventBL
+from dal.client_dal import ClientDAL
+from dal.collaborator_dal import CollaboratorDAL
+from dal.contract_dal import ContractDAL
+from dal.event_dal import EventDAL
+from dtos.import_result_dto import ImportResultDTO, RejectedRowDTO
+from security.permissions import can_manage_contracts, is_commercial
+from security.principal import resolve_principal
+from monitoring.tracing import traced_methods
+
+TRUE_VALUES = {"1", "true", "vrai", "oui", "yes", "signé", "signe"}
+FALSE_VALUES = {"0", "false", "faux", "non", "no", ""}
+
+
+def _value(row: dict, key: str):
+    value = row.get(key)
+    if isinstance(value, str):
+        value = value.strip()
+    return None if value == "" else value
+
+
+def _required(row: dict, key: str):
+    value = _value(row, key)
+    if value is None:
+        raise ValueError(f"Le champ '{key}' est requis.")
+    return value
+
+
+def _int(row: dict, key: str, required: bool = True) -> int | None:
+    value = _required(row, key) if required else _value(row, key)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Le champ '{key}' doit être un entier.")
+
+
+def _decimal(row: dict, key: str) -> Decimal:
+    try:
+        value = Decimal(str(_required(row, key)))
+    except InvalidOperation:
+        value = None
+    if value is None or not value.is_finite():
+        raise ValueError(f"Le champ '{key}' doit être un montant.")
+    return value
+
+
+def _date(row: dict, key: str, default: date | None = None) -> date | None:
+    value = _value(row, key)
+    if value is None:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Le champ '{key}' doit être une date AAAA-MM-JJ.")
+
+
+def _datetime(row: dict, key: str) -> datetime:
+    try:
+        return datetime.fromisoformat(_required(row, key))
+    except (TypeError, ValueError):
+        raise ValueError(f"Le champ '{key}' doit être une date AAAA-MM-JJ HH:MM.")
+
+
+def _bool(row: dict, key: str) -> bool:
+    value = row.get(key)
+    if isinstance(value, bool):
+        return value
+    value = "" if value is None else str(value).strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"Le champ '{key}' doit être un booléen.")
+
+
+@traced_methods("bl")
+class ImportBL:
+    """
+    Validates and inserts one chunk of imported rows.
+
+    The rules are those of the interactive commands: only commercials import
+    clients and events, a client email is unique, a commercial only imports
+    contracts and events for their own clients, and an event requires a signed
+    contract. Lookups are made once per chunk, and valid rows are inserted with
+    a single executemany statement. The caller commits each chunk in its own
+    unit of work.
+
+    Rows are `(line, row)` pairs; `row` is None when the line could not be
+    parsed.
+    """
+
+    def __init__(self, db: Session):
+        self.client_dal = ClientDAL(db, projection=True)
+        self.contract_dal = ContractDAL(db, projection=True)
+        self.event_dal = EventDAL(db)
+        self.collaborator_dal = CollaboratorDAL(db)
+
+    def _validate(self, rows: list[tuple[int, dict | None]], parse) -> tuple[list[dict], list[RejectedRowDTO]]:
+        valid, rejected = [], []
+        for line, row in rows:
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Ligne illisible.")
+                valid.append(parse(row))
+            except (ValueError, PermissionError) as e:
+                rejected.append(RejectedRowDTO(line=line, error=str(e), row=row))
+        return valid, rejected
+
+    def import_clients(self, rows: list[tuple[int, dict | None]], current_user: dict) -> ImportResultDTO:
+        if not is_commercial(current_user):
+            raise PermissionError("Seuls les commerciaux peuvent importer des clients.")
+        commercial = resolve_principal(current_user, self.collaborator_dal)
+        if not commercial:
+            raise ValueError("collaborateur introuvable")
+
+        emails = [_value(row, "email") for _, row in rows if isinstance(row, dict) and _value(row, "email")]
+        taken = self.client_dal.get_existing_emails(emails)
+
+        def parse(row: dict) -> dict:
+            email = _required(row, "email")
+            if email in taken:
+                raise ValueError("Un client avec cet email existe déjà.")
+            client = {
+                "name": _required(row, "name"),
+                "email": email,
+                "phone": _value(row, "phone"),
+                "company": _value(row, "company"),
+                "creation_date": _date(row, "creation_date", date.today()),
+                "last_contact_date": _date(row, "last_contact_date"),
+                "commercial_id": commercial.id,
+            }
+            taken.add(email)
+            return client
+
+        valid, rejected = self._validate(rows, parse)
+        return ImportResultDTO(inserted=self.client_dal.bulk_insert(valid), rejected=rejected)
+
+    def import_contracts(self, rows: list[tuple[int, dict | None]], current_user: dict) -> ImportResultDTO:
+        if not can_manage_contracts(current_user):
+            raise PermissionError("Vous n'avez pas les droits pour créer un contrat.")
+        principal = resolve_principal(current_user, self.collaborator_dal) if is_commercial(current_user) else None
+
+        client_ids, commercial_ids = [], []
+        for _, row in rows:
+            try:
+                client_ids.append(_int(row, "client_id"))
+                commercial_ids.append(_int(row, "commercial_id", required=False))
+            except (AttributeError, ValueError):
+                continue
+        clients = {c.id: c for c in self.client_dal.get_by_ids(client_ids)}
+        # A commercial's contracts are always assigned to them, so only the others are checked
+        commercials = set() if principal else self.collaborator_dal.get_existing_ids(filter(None, commercial_ids))
+
+        def parse(row: dict) -> dict:
+            client = clients.get(_int(row, "client_id"))
+            if not client:
+                raise ValueError("Client introuvable.")
+
+            commercial_id = _int(row, "commercial_id", required=False)
+            if commercial_id and not principal and commercial_id not in commercials:
+                raise ValueError("Commercial introuvable.")
+            commercial_id = commercial_id or client.commercial_id
+            if principal:
+                if client.commercial_id != principal.id:
+                    raise PermissionError("Vous ne pouvez créer des contrats que pour vos propres clients.")
+                commercial_id = principal.id
+
+            total_amount = _decimal(row, "total_amount")
+            amount_left = _decimal(row, "amount_left")
+            if total_amount < 0 or not 0 <= amount_left <= total_amount:
+                raise ValueError("Le montant restant doit être compris entre 0 et le montant total.")
+
+            return {
+                "total_amount": total_amount,
+                "amount_left": amount_left,
+                "creation_date": _date(row, "creation_date", date.today()),
+                "status": _bool(row, "status"),
+                "client_id": client.id,
+                "commercial_id": commercial_id,
+            }
+
+        valid, rejected = self._validate(rows, parse)
+        return ImportResultDTO(inserted=self.contract_dal.bulk_insert(valid), rejected=rejected)
+
+    def import_events(self, rows: list[tuple[int, dict | None]], current_user: dict) -> ImportResultDTO:
+        if not is_commercial(current_user):
+            raise PermissionError("Seuls les commerciaux peuvent créer un évènements")
+        user = resolve_principal(current_user, self.collaborator_dal)
+        if not user:
+            raise ValueError("collaborateur introuvable")
+
+        contract_ids = []
+        for _, row in rows:
+            try:
+                contract_ids.append(_int(row, "contract_id"))
+            except (AttributeError, ValueError):
+                continue
+        contracts = {c.id: c for c in self.contract_dal.get_by_ids(contract_ids)}
+
+        def parse(row: dict) -> dict:
+            contract = contracts.get(_int(row, "contract_id"))
+            EventBL.check_contract_for_event(contract, user)
+
+            start_date = _datetime(row, "start_date")
+            end_date = _datetime(row, "end_date")
+            if end_date < start_date:
+                raise ValueError("La date de fin doit être postérieure à la date de début.")
+
+            return {
+                "start_date": start_date,
+                "end_date": end_date,
+                "location": _value(row, "location"),
+                "attendees": _int(row, "attendees", required=False),
+                "note": _value(row, "note"),
+                "contract_id": contract.id,
+                "support_id": None,
+            }
+
+        valid, rejected = self._validate(rows, parse)
+        return ImportResultDTO(inserted=self.event_dal.bulk_insert(valid), rejected=rejected)
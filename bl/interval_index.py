@@ -0,0 +1,83 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Hashable, Iterable
+
+
+class IntervalIndex:
+    """
+    Half-open `[start, end)` intervals sorted by start, with the running
+    maximum of their ends.
+
+    An empty interval, whose end equals its start, covers no time: it overlaps
+    nothing and is not stored, as an empty `tsrange` on PostgreSQL.
+
+    Since the running maximum never decreases, whether any interval overlaps
+    `[start, end)` is answered with one binary search: among the intervals
+    starting before `end`, the latest end is the running maximum at the last
+    of them. Listing the overlapping intervals only scans those whose running
+    maximum is past `start`. Adding or removing an interval is linear, which
+    suits a schedule read far more often than it changes.
+    """
+
+    __slots__ = ("_starts", "_intervals", "_max_ends")
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime, Hashable]] = ()):
+        self._intervals = sorted((interval for interval in intervals if interval[1] > interval[0]),
+                                 key=lambda interval: interval[:2])
+        self._starts = [start for start, _, _ in self._intervals]
+        self._max_ends = []
+        self._update_max_ends(0)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def _update_max_ends(self, position: int) -> None:
+        del self._max_ends[position:]
+        latest = self._max_ends[-1] if self._max_ends else None
+        for _, end, _ in self._intervals[position:]:
+            latest = end if latest is None or end > latest else latest
+            self._max_ends.append(latest)
+
+    def add(self, start: datetime, end: datetime, key: Hashable) -> None:
+        if end < start:
+            raise ValueError("La date de fin doit être postérieure à la date de début.")
+        if end == start:
+            return
+        interval = (start, end, key)
+        insort(self._intervals, interval, key=lambda item: item[:2])
+        position = bisect_left(self._intervals, interval[:2], key=lambda item: item[:2])
+        self._starts.insert(position, start)
+        self._update_max_ends(position)
+
+    def remove(self, key: Hashable) -> bool:
+        for position, (_, _, other) in enumerate(self._intervals):
+            if other == key:
+                del self._intervals[position]
+                del self._starts[position]
+                self._update_max_ends(position)
+                return True
+        return False
+
+    def overlaps(self, start: datetime, end: datetime, exclude: Hashable | None = None) -> bool:
+        """
+        Tells in logarithmic time whether an interval overlaps `[start, end)`.
+        An excluded key (e.g. the event being moved) falls back to `find`.
+        """
+        if exclude is not None:
+            return bool(self.find(start, end, exclude))
+        if end <= start:
+            return False
+        candidates = bisect_left(self._starts, end)
+        return candidates > 0 and self._max_ends[candidates - 1] > start
+
+    def find(self, start: datetime, end: datetime, exclude: Hashable | None = None) -> list[Hashable]:
+        """
+        Returns the keys of the intervals overlapping `[start, end)`, by start.
+        """
+        if end <= start:
+            return []
+        candidates = bisect_left(self._starts, end)
+        # Before `first`, every interval ends at or before `start`
+        first = bisect_right(self._max_ends, start, 0, candidates)
+        return [key for interval_start, interval_end, key in self._intervals[first:candidates]
+                if interval_end > start and key != exclude]
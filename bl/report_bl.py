@@ -0,0 +1,35 @@
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session
+from dal.report_dal import ReportDAL
+from dtos.report_dto import ContractSummaryDTO, InactiveClientsDTO, SupportMonthDTO
+from security.permissions import has_permission
+from monitoring.tracing import traced_methods
+
+
+@traced_methods("bl")
+class ReportBL:
+    def __init__(self, db: Session):
+        self.dal = ReportDAL(db)
+
+    @staticmethod
+    def _check_access(current_user: dict) -> None:
+        if not has_permission(current_user, ["gestion"]):
+            raise PermissionError("Seuls les gestionnaires peuvent consulter les rapports.")
+
+    def contract_summary(self, current_user: dict) -> tuple[list[ContractSummaryDTO], ContractSummaryDTO]:
+        """Returns the contract figures of each commercial, and their totals."""
+        self._check_access(current_user)
+        return self.dal.contracts_by_commercial(), self.dal.contract_totals()
+
+    def events_per_support(self, current_user: dict, year: int | None = None) -> list[SupportMonthDTO]:
+        self._check_access(current_user)
+        if year is None:
+            return self.dal.events_by_support_month()
+        return self.dal.events_by_support_month(datetime(year, 1, 1), datetime(year + 1, 1, 1))
+
+    def inactive_clients(self, current_user: dict, days: int = 180,
+                         today: date | None = None) -> list[InactiveClientsDTO]:
+        self._check_access(current_user)
+        if days < 0:
+            raise ValueError("Le nombre de jours doit être positif.")
+        return self.dal.inactive_clients_by_commercial((today or date.today()) - timedelta(days=days))
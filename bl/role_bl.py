@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 from dal.role_dal import RoleDAL
 from dtos.role_dto import RoleDTO
+from monitoring.tracing import traced_methods
 
 
+@traced_methods("bl")
 class RoleBL:
     def __init__(self, db: Session):
         self.dal = RoleDAL(db)
@@ -0,0 +1,47 @@
+from bisect import insort
+from datetime import datetime
+from typing import Iterable
+
+from bl.interval_index import IntervalIndex
+
+
+def plan_assignments(events: Iterable[tuple[datetime, datetime, int]], schedules: dict[int, IntervalIndex],
+                     loads: dict[int, float]) -> dict[int, int]:
+    """
+    Assigns events to supports so that no support gets overlapping events,
+    giving each event to the least loaded support free on its slot.
+
+    The events are planned by start date, so an event only overlaps the
+    events already planned for a support if it starts before the latest of
+    their ends: that end is all that is kept per support, next to the
+    interval index of the events the support already had. The supports are
+    kept sorted by load, and the scan for a free one usually stops at the
+    first.
+
+    :param events: The `(start, end, event_id)` of the events to assign.
+    :type events: Iterable[tuple[datetime, datetime, int]]
+    :param schedules: The events each support already has, by support id.
+    :type schedules: dict[int, IntervalIndex]
+    :param loads: The initial load of each support, in seconds of events.
+    :type loads: dict[int, float]
+    :return: The support id of each assigned event, keyed by event id.
+        Events no support is free for are left out.
+    :rtype: dict[int, int]
+    """
+    by_load = sorted((load, support_id) for support_id, load in loads.items())
+    planned_until: dict[int, datetime] = {}
+    plan = {}
+
+    for start, end, event_id in sorted(events):
+        for position, (load, support_id) in enumerate(by_load):
+            until = planned_until.get(support_id)
+            # An empty event covers no time, as in IntervalIndex
+            if (until is not None and until > start and end > start) or schedules[support_id].overlaps(start, end):
+                continue
+            plan[event_id] = support_id
+            planned_until[support_id] = end if until is None or end > until else until
+            del by_load[position]
+            insort(by_load, (load + (end - start).total_seconds(), support_id))
+            break
+
+    return plan
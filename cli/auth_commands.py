@@ -1,14 +1,10 @@
 import click
 import sentry_sdk
-from sqlalchemy.orm import sessionmaker
-from security.auth_service import authenticate_collaborator
 from security.jwt import create_access_token, decode_access_token
 from security.token_store import save_token, load_token, delete_token
-from db.session import engine
 
 
 auth_cli = click.Group("auth")
-Session = sessionmaker(bind=engine)
 
 
 def require_auth() -> dict:
@@ -39,8 +35,12 @@ def login(email, password):
     :type password: str
     :return: None
     """
-    db = Session()
-    payload = authenticate_collaborator(db, email, password)
+    # Imported here so that `auth whoami` and `auth logout` do not load SQLAlchemy.
+    from db.session import SessionLocal as Session, unit_of_work
+    from security.auth_service import authenticate_collaborator
+
+    with unit_of_work(Session) as db:
+        payload = authenticate_collaborator(db, email, password)
 
     if not payload:
         click.echo("Identifiants incorrects.")
@@ -1,13 +1,12 @@
 import click
 import sentry_sdk
-from sqlalchemy.orm import sessionmaker
 from bl.client_bl import ClientBLL
 from cli.auth_decorator import with_auth_payload
-from db.session import engine
+from db.session import SessionLocal as Session, unit_of_work
+from dal.pagination import DEFAULT_PAGE_SIZE
 from datetime import date
 
 client_cli = click.Group("client")
-Session = sessionmaker(bind=engine)
 
 
 @client_cli.command("create")
@@ -17,26 +16,29 @@ Session = sessionmaker(bind=engine)
 @click.option("--company", prompt="Nom de l'entreprise", default="", show_default=False)
 @with_auth_payload
 def create_client(name, email, phone, company, current_user):
-    db = Session()
-    bl = ClientBLL(db)
-
-    try:
-        client = bl.create_client_from_input(
-            name=name,
-            email=email,
-            phone=phone,
-            company=company,
-            current_user=current_user
-        )
-        click.echo(f"Client créé : {client.name} ({client.email})")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+    with unit_of_work(Session) as db:
+        bl = ClientBLL(db)
+
+        try:
+            client = bl.create_client_from_input(
+                name=name,
+                email=email,
+                phone=phone,
+                company=company,
+                current_user=current_user
+            )
+            click.echo(f"Client créé : {client.name} ({client.email})")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @client_cli.command("list")
+@click.option("--limit", type=click.IntRange(min=1), default=None, help="Nombre maximum de clients par page")
+@click.option("--after", type=int, default=None, help="Afficher les clients situés après cet ID")
 @with_auth_payload
-def list_clients(current_user):
+def list_clients(limit=None, after=None, current_user=None):
     """
     Lists all clients associated with the current user.
 
@@ -45,25 +47,35 @@ def list_clients(current_user):
     companies in the command-line interface. If no clients
     are found, a corresponding message is displayed. In case
     of an error during data retrieval, the error message is
-    output.
+    output. When `--limit` or `--after` is given, a single page
+    is displayed along with the cursor of the next page.
 
+    :param limit: Maximum number of clients to display.
+    :param after: Id of the last client of the previous page.
     :param current_user: Current authenticated user.
     :type current_user: Any
     :return: None
     """
-    db = Session()
-    bl = ClientBLL(db)
-
-    try:
-        clients = bl.get_all_clients()
-        if not clients:
-            click.echo("Aucun client trouvé.")
-            return
-        for client in clients:
-            click.echo(f"{client.name} - {client.email} | {client.company or 'Non renseigné'} | Id : {client.id}")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+    with unit_of_work(Session) as db:
+        bl = ClientBLL(db)
+
+        try:
+            page = None
+            if limit or after is not None:
+                page = bl.get_clients_page(after=after, limit=limit or DEFAULT_PAGE_SIZE)
+                clients = page.items
+            else:
+                clients = bl.get_all_clients()
+            if not clients:
+                click.echo("Aucun client trouvé.")
+                return
+            for client in clients:
+                click.echo(f"{client.name} - {client.email} | {client.company or 'Non renseigné'} | Id : {client.id}")
+            if page and page.next_cursor:
+                click.echo(f"Page suivante : --after {page.next_cursor}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @client_cli.command("update")
@@ -92,15 +104,14 @@ def update_client(client_id, name, email, phone, company, current_user):
     :param current_user: Currently authenticated user performing the update.
     :return: None
     """
-    db = Session()
-    bl = ClientBLL(db)
-
-    try:
-        client = bl.get_client(client_id)
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
-        return
+    # The prompts run between two units of work, so no transaction stays open while the user types
+    with unit_of_work(Session) as db:
+        try:
+            client = ClientBLL(db).get_client(client_id)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+            return
 
     click.echo(f"📝 Client actuel : {client.name} ({client.email}) - {client.company or 'N/A'}")
 
@@ -121,9 +132,11 @@ def update_client(client_id, name, email, phone, company, current_user):
         "last_contact_date": date.today()
     }
 
-    try:
-        updated = bl.update_client(client_id, updates, current_user)
-        click.echo(f"Client mis à jour : {updated.name} ({updated.email})")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+    with unit_of_work(Session) as db:
+        try:
+            updated = ClientBLL(db).update_client(client_id, updates, current_user)
+            click.echo(f"Client mis à jour : {updated.name} ({updated.email})")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
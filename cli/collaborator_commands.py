@@ -1,13 +1,12 @@
 import click
 import sentry_sdk
-from sqlalchemy.orm import sessionmaker
 from bl.collaborator_bl import CollaboratorBL
 from cli.auth_decorator import with_auth_payload
-from db.session import engine
+from db.session import SessionLocal as Session, unit_of_work
+from dal.pagination import DEFAULT_PAGE_SIZE
 from security.permissions import can_manage_collaborators
 
 collaborator_cli = click.Group("collaborator")
-Session = sessionmaker(bind=engine)
 
 
 @collaborator_cli.command("create")
@@ -43,57 +42,71 @@ def create_collaborator(name, email, password, role, current_user):
     :type current_user: dict
     :return: None
     """
-    db = Session()
-    bl = CollaboratorBL(db)
-
-    try:
-        collab = bl.create_collaborator_from_input(
-            name=name,
-            email=email,
-            password=password,
-            role_name=role,
-            current_user=current_user
-        )
-        click.echo(f"Collaborateur créé : {collab.name} ({collab.email}) - Rôle : {collab.role_name}")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"ERREUR : {e}")
+    with unit_of_work(Session) as db:
+        bl = CollaboratorBL(db)
+
+        try:
+            collab = bl.create_collaborator_from_input(
+                name=name,
+                email=email,
+                password=password,
+                role_name=role,
+                current_user=current_user
+            )
+            click.echo(f"Collaborateur créé : {collab.name} ({collab.email}) - Rôle : {collab.role_name}")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"ERREUR : {e}")
 
 
 @collaborator_cli.command("list")
+@click.option("--limit", type=click.IntRange(min=1), default=None, help="Nombre maximum de collaborateurs par page")
+@click.option("--after", type=int, default=None, help="Afficher les collaborateurs situés après cet ID")
 @with_auth_payload
-def list_collaborator(current_user):
+def list_collaborator(limit=None, after=None, current_user=None):
     """
     Lists all collaborators associated with the current user.
 
     This command fetches and displays all collaborators tied to the current user's
-    account. Authentication is required to execute this command.
+    account. Authentication is required to execute this command. When `--limit` or
+    `--after` is given, a single page is displayed along with the cursor of the next page.
 
+    :param limit: Maximum number of collaborators to display.
+    :param after: Id of the last collaborator of the previous page.
     :param current_user: The user currently logged into the system, provided by
         the authentication payload.
     :return: A list of collaborators related to the current user's account.
     :rtype: list
     """
-    db = Session()
-    bl = CollaboratorBL(db)
+    with unit_of_work(Session) as db:
+        bl = CollaboratorBL(db)
 
-    if not can_manage_collaborators(current_user):
-        click.echo("Vous n'avez pas le droit d'afficher la liste des collaborateurs.")
-        return
-
-    try:
-        collaborators = bl.get_all_collaborators()
-        if not collaborators:
-            click.echo("Aucun collaborateur trouvé.")
+        if not can_manage_collaborators(current_user):
+            click.echo("Vous n'avez pas le droit d'afficher la liste des collaborateurs.")
             return
 
-        click.echo("Collaborateurs : ")
-        for c in collaborators:
-            click.echo(f" - {c.name} - {c.email} - rôle : {c.role_name} - ID : {c.id}")
+        try:
+            page = None
+            if limit or after is not None:
+                page = bl.get_collaborators_page(after=after, limit=limit or DEFAULT_PAGE_SIZE)
+                collaborators = page.items
+            else:
+                collaborators = bl.get_all_collaborators()
+            if not collaborators:
+                click.echo("Aucun collaborateur trouvé.")
+                return
+
+            click.echo("Collaborateurs : ")
+            for c in collaborators:
+                click.echo(f" - {c.name} - {c.email} - rôle : {c.role_name} - ID : {c.id}")
+
+            if page and page.next_cursor:
+                click.echo(f"Page suivante : --after {page.next_cursor}")
 
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @collaborator_cli.command("update")
@@ -114,15 +127,14 @@ def update_collaborator(collaborator_id, current_user):
         the user performing the operation.
     :return: A confirmation of the update operation or status information.
     """
-    db = Session()
-    bl = CollaboratorBL(db)
-
-    try:
-        collab = bl.get_by_id(collaborator_id)
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
-        return
+    # The prompts run between two units of work, so no transaction stays open while the user types
+    with unit_of_work(Session) as db:
+        try:
+            collab = CollaboratorBL(db).get_by_id(collaborator_id)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+            return
 
     click.echo(f"Collaborateur actuel : {collab.name} ({collab.email}) - rôle : {collab.role_name}")
 
@@ -137,12 +149,14 @@ def update_collaborator(collaborator_id, current_user):
         "role_name": role
     }
 
-    try:
-        updated = bl.update_collaborator(collaborator_id, updates, current_user)
-        click.echo(f"Collaborateur mis à jour : {updated.name} ({updated.email}) - rôle : {updated.role_name}")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur lors de la mise à jour : {e}")
+    with unit_of_work(Session) as db:
+        try:
+            updated = CollaboratorBL(db).update_collaborator(collaborator_id, updates, current_user)
+            click.echo(f"Collaborateur mis à jour : {updated.name} ({updated.email}) - rôle : {updated.role_name}")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur lors de la mise à jour : {e}")
 
 
 @collaborator_cli.command("delete")
@@ -161,24 +175,24 @@ def delete_collaborator(collaborator_id, current_user):
     :type current_user: Any
     :return: None
     """
-    db = Session()
-    bl = CollaboratorBL(db)
-
-    try:
-        collab = bl.get_by_id(collaborator_id)
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
-        return
+    with unit_of_work(Session) as db:
+        try:
+            collab = CollaboratorBL(db).get_by_id(collaborator_id)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+            return
 
     click.echo(f"⚠️ Vous êtes sur le point de supprimer : {collab.name} ({collab.email}) - rôle : {collab.role_name}")
     if not click.confirm("Voulez-vous vraiment supprimer cet utilisateur ?", default=False):
         click.echo("Suppression annulée.")
         return
 
-    try:
-        bl.delete_collaborator(collaborator_id, current_user)
-        click.echo("Collaborateur supprimé avec succès.")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur lors de la suppression : {e}")
+    with unit_of_work(Session) as db:
+        try:
+            CollaboratorBL(db).delete_collaborator(collaborator_id, current_user)
+            click.echo("Collaborateur supprimé avec succès.")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur lors de la suppression : {e}")
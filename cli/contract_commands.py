@@ -1,53 +1,65 @@
 import click
 import sentry_sdk
-from sqlalchemy.orm import sessionmaker
 from bl.contract_bl import ContractBL
 from cli.auth_decorator import with_auth_payload
-from db.session import engine
+from db.session import SessionLocal as Session, unit_of_work
+from dal.pagination import DEFAULT_PAGE_SIZE
 from datetime import date
 
 
 contract_cli = click.Group("contract")
-Session = sessionmaker(bind=engine)
 
 
 @contract_cli.command("list")
 @click.option("--full", is_flag=True, help="Afficher plus de détails sur les contrats")
+@click.option("--limit", type=click.IntRange(min=1), default=None, help="Nombre maximum de contrats par page")
+@click.option("--after", type=int, default=None, help="Afficher les contrats situés après cet ID")
 @with_auth_payload
-def list_contracts(full, current_user):
+def list_contracts(full, limit=None, after=None, current_user=None):
     """
     List all contracts with optional detailed information.
 
     This function fetches all contracts using the business logic layer, displaying their
     basic details. If the `full` option is specified, additional details about the
     contracts (client ID and commercial ID) are included. If no contracts are found,
-    an appropriate message is displayed.
+    an appropriate message is displayed. When `--limit` or `--after` is given, a single
+    page is displayed along with the cursor of the next page.
 
     :param bool full: Flag to indicate whether to show extended details of contracts.
+    :param limit: Maximum number of contracts to display.
+    :param after: Id of the last contract of the previous page.
     :param current_user: The current user executing the command. Provided by the
                          authentication middleware.
     :return: None
     """
-    db = Session()
-    bl = ContractBL(db)
+    with unit_of_work(Session) as db:
+        bl = ContractBL(db)
 
-    try:
-        contracts = bl.list_all_contracts()
-        if not contracts:
-            click.echo("Aucun contrat trouvé.")
-            return
+        try:
+            page = None
+            if limit or after is not None:
+                page = bl.list_contracts_page(after=after, limit=limit or DEFAULT_PAGE_SIZE)
+                contracts = page.items
+            else:
+                contracts = bl.list_all_contracts()
+            if not contracts:
+                click.echo("Aucun contrat trouvé.")
+                return
+
+            for c in contracts:
+                status_label = "✅ Signé" if c.status else "❌ Non signé"
+                base = f"Contrat #{c.id} | {status_label} | Montant : {c.total_amount}€ / restant : {c.amount_left}€"
 
-        for c in contracts:
-            status_label = "✅ Signé" if c.status else "❌ Non signé"
-            base = f"Contrat #{c.id} | {status_label} | Montant : {c.total_amount}€ / restant : {c.amount_left}€"
+                if full:
+                    base += f" | ID du client : {c.client_id} | Id du commercial : {c.commercial_id}"
 
-            if full:
-                base += f" | ID du client : {c.client_id} | Id du commercial : {c.commercial_id}"
+                click.echo(base)
 
-            click.echo(base)
+            if page and page.next_cursor:
+                click.echo(f"Page suivante : --after {page.next_cursor}")
 
-    except Exception as e:
-        click.echo(f"Erreur : {e}")
+        except Exception as e:
+            click.echo(f"Erreur : {e}")
 
 
 @contract_cli.command("signed")
@@ -59,21 +71,21 @@ def list_signed_contracts(current_user):
     :param current_user: Represents the currently authenticated user; required argument.
     :return: A list of signed contracts associated with the authenticated user.
     """
-    db = Session()
-    bl = ContractBL(db)
+    with unit_of_work(Session) as db:
+        bl = ContractBL(db)
 
-    try:
-        contracts = bl.list_signed_contracts(current_user)
-        if not contracts:
-            click.echo("Aucun contrat signé trouvé.")
-            return
+        try:
+            contracts = bl.list_signed_contracts(current_user)
+            if not contracts:
+                click.echo("Aucun contrat signé trouvé.")
+                return
 
-        click.echo(" Contrats signés :")
-        for c in contracts:
-            click.echo(f" - #{c.id} | {c.total_amount}€ / {c.amount_left} | Client : {c.client_id} |"
-                       f" Date de création : {c.creation_date}")
-    except Exception as e:
-        click.echo(f"Erreur : {e}")
+            click.echo(" Contrats signés :")
+            for c in contracts:
+                click.echo(f" - #{c.id} | {c.total_amount}€ / {c.amount_left} | Client : {c.client_id} |"
+                           f" Date de création : {c.creation_date}")
+        except Exception as e:
+            click.echo(f"Erreur : {e}")
 
 
 @contract_cli.command("unpaid")
@@ -93,21 +105,21 @@ def list_unpaid_contracts(current_user):
     :return: Returns a list of contracts that are currently unpaid
         for the given user.
     """
-    db = Session()
-    bl = ContractBL(db)
+    with unit_of_work(Session) as db:
+        bl = ContractBL(db)
 
-    try:
-        contracts = bl.list_unpaid_contract(current_user)
-        if not contracts:
-            click.echo("Aucun contrat non payé trouvé.")
-            return
+        try:
+            contracts = bl.list_unpaid_contract(current_user)
+            if not contracts:
+                click.echo("Aucun contrat non payé trouvé.")
+                return
 
-        click.echo("Contrats non payés :")
-        for c in contracts:
-            click.echo(f" - #{c.id} | {c.total_amount}€ / restant : {c.amount_left}€ | Client : {c.client_id} |"
-                       f" Date de création : {c.creation_date}")
-    except Exception as e:
-        click.echo(f"Erreur : {e}")
+            click.echo("Contrats non payés :")
+            for c in contracts:
+                click.echo(f" - #{c.id} | {c.total_amount}€ / restant : {c.amount_left}€ | Client : {c.client_id} |"
+                           f" Date de création : {c.creation_date}")
+        except Exception as e:
+            click.echo(f"Erreur : {e}")
 
 
 @contract_cli.command("unsigned")
@@ -125,21 +137,21 @@ def list_unsigned_contracts(current_user):
     :return: A list of unsigned contracts associated with the current user.
     :rtype: List[Contract]
     """
-    db = Session()
-    bl = ContractBL(db)
+    with unit_of_work(Session) as db:
+        bl = ContractBL(db)
 
-    try:
-        contracts = bl.list_unsigned_contracts(current_user)
-        if not contracts:
-            click.echo("Aucun contrat non signé trouvé.")
-            return
+        try:
+            contracts = bl.list_unsigned_contracts(current_user)
+            if not contracts:
+                click.echo("Aucun contrat non signé trouvé.")
+                return
 
-        click.echo("Contrat non signé")
-        for c in contracts:
-            click.echo(f" - #{c.id} | {c.total_amount}€ / Restant : {c.amount_left} | Client : {c.client_id} |"
-                       f" Date de création : {c.creation_date}")
-    except Exception as e:
-        click.echo(f"Erreur : {e}")
+            click.echo("Contrat non signé")
+            for c in contracts:
+                click.echo(f" - #{c.id} | {c.total_amount}€ / Restant : {c.amount_left} | Client : {c.client_id} |"
+                           f" Date de création : {c.creation_date}")
+        except Exception as e:
+            click.echo(f"Erreur : {e}")
 
 
 @contract_cli.command("create")
@@ -171,24 +183,25 @@ def create_contract(client_id, commercial_id, total_amount, amount_left, current
     :type current_user: object
     :return: None
     """
-    db = Session()
-    bl = ContractBL(db)
+    with unit_of_work(Session) as db:
+        bl = ContractBL(db)
 
-    try:
-        contract_data = {
-            "client_id": client_id,
-            "commercial_id": commercial_id,
-            "total_amount": total_amount,
-            "amount_left": amount_left,
-            "creation_date": date.today(),
-            "status": False
-        }
+        try:
+            contract_data = {
+                "client_id": client_id,
+                "commercial_id": commercial_id,
+                "total_amount": total_amount,
+                "amount_left": amount_left,
+                "creation_date": date.today(),
+                "status": False
+            }
 
-        contract = bl.create_contract(contract_data, current_user)
-        click.echo(f"Contrat créé : #{contract.id} -  Montant : {contract.total_amount}€, Statut : Non Signé")
+            contract = bl.create_contract(contract_data, current_user)
+            click.echo(f"Contrat créé : #{contract.id} -  Montant : {contract.total_amount}€, Statut : Non Signé")
 
-    except Exception as e:
-        click.echo(f"Erreur : {e}")
+        except Exception as e:
+            db.rollback()
+            click.echo(f"Erreur : {e}")
 
 
 @contract_cli.command("update")
@@ -209,16 +222,15 @@ def update_contract(contract_id, current_user):
     :type current_user: User
     :return: None
     """
-    db = Session()
-    bl = ContractBL(db)
-
     click.echo(f"Payload reçu : {current_user}")  # DEBUG temporaire
 
-    try:
-        contract = bl.get_contract(contract_id)
-    except Exception as e:
-        click.echo(f"Erreur : {e}")
-        return
+    # The prompts run between two units of work, so no transaction stays open while the user types
+    with unit_of_work(Session) as db:
+        try:
+            contract = ContractBL(db).get_contract(contract_id)
+        except Exception as e:
+            click.echo(f"Erreur : {e}")
+            return
 
     status_label = "✅ Signé" if contract.status else "❌ Non signé"
     click.echo(f"Contrat Actuel : #{contract.id}")
@@ -226,24 +238,26 @@ def update_contract(contract_id, current_user):
     click.echo(f" - Montant restant : {contract.amount_left}")
     click.echo(f" - Statut          : {status_label}")
 
-    try:
-        total_amount = click.prompt("Nouveau montant du contrat", default=contract.total_amount, type=float)
-        amount_left = click.prompt("Nouveau montant restant", default=contract.amount_left, type=float)
-        status = click.confirm("Nouveau statut du contrat", default=contract.status)
+    total_amount = click.prompt("Nouveau montant du contrat", default=contract.total_amount, type=float)
+    amount_left = click.prompt("Nouveau montant restant", default=contract.amount_left, type=float)
+    status = click.confirm("Nouveau statut du contrat", default=contract.status)
 
-        updates = {
-            "total_amount": total_amount,
-            "amount_left": amount_left,
-            "status": status
-        }
+    updates = {
+        "total_amount": total_amount,
+        "amount_left": amount_left,
+        "status": status
+    }
 
-        updated = bl.update_contract(contract_id, updates, current_user)
+    with unit_of_work(Session) as db:
+        try:
+            updated = ContractBL(db).update_contract(contract_id, updates, current_user)
 
-        label = "✅ Signé" if updated.status else "❌ Non signé"
-        click.echo(f"Contrat mis à jour : #{updated.id} | Total : {updated.total_amount}€, Statut : {label}")
+            label = "✅ Signé" if updated.status else "❌ Non signé"
+            click.echo(f"Contrat mis à jour : #{updated.id} | Total : {updated.total_amount}€, Statut : {label}")
 
-    except Exception as e:
-        click.echo(f"Erreur pendant la mis à jour: {e}")
+        except Exception as e:
+            db.rollback()
+            click.echo(f"Erreur pendant la mis à jour: {e}")
 
 
 @contract_cli.command("show")
@@ -262,19 +276,19 @@ def show_contract_detail(contract_id, current_user):
         the contract details.
     :return: None
     """
-    db = Session()
-    bl = ContractBL(db)
-
-    try:
-        contract = bl.get_contract(contract_id)
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
-        return
+    with unit_of_work(Session) as db:
+        bl = ContractBL(db)
+
+        try:
+            contract = bl.get_contract(contract_id)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+            return
 
-    click.echo(f"Contrat #{contract.id} :")
-    click.echo(f" - Montant total   : {contract.total_amount}")
-    click.echo(f" - Montant restant : {contract.amount_left}")
-    click.echo(f" - Statut          : {'✅ Signé' if contract.status else '❌ Non signé'}")
-    click.echo(f"  - ID du client   : {contract.client_id}")
-    click.echo(f"  - ID du commercial : {contract.commercial_id}")
+        click.echo(f"Contrat #{contract.id} :")
+        click.echo(f" - Montant total   : {contract.total_amount}")
+        click.echo(f" - Montant restant : {contract.amount_left}")
+        click.echo(f" - Statut          : {'✅ Signé' if contract.status else '❌ Non signé'}")
+        click.echo(f"  - ID du client   : {contract.client_id}")
+        click.echo(f"  - ID du commercial : {contract.commercial_id}")
@@ -0,0 +1,183 @@
+import io
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+
+import click
+import sentry_sdk
+from click.testing import CliRunner
+
+from cli.daemon_client import DEFAULT_SOCKET_PATH
+
+# Groups whose commands stream bulk data, possibly binary, to the standard
+# output when no `--output` file is given
+STDOUT_STREAMING_GROUPS = {"export"}
+
+
+class _ForwardedInput(io.BytesIO):
+    """
+    Standard input of a forwarded command, which raises EOFError once it is exhausted.
+
+    CliRunner keeps answering an exhausted input with empty lines, which makes a
+    required prompt loop forever; click turns the EOFError into an Abort.
+    `exhausted` records it, for the commands that catch the Abort themselves.
+    """
+    exhausted = False
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if not data and size:
+            self.exhausted = True
+            raise EOFError
+        return data
+
+    def read1(self, size=-1):
+        data = super().read1(size)
+        if not data:
+            self.exhausted = True
+            raise EOFError
+        return data
+
+
+def _streams_to_stdout(root: click.Command, argv: list[str]) -> bool:
+    # The command line is parsed without running any callback, to find the invoked command and its options
+    ctx = root.make_context("epicevents", list(argv), resilient_parsing=True)
+    path, command = [], root
+    while isinstance(command, click.Group):
+        args = [*ctx.protected_args, *ctx.args]
+        if not args:
+            break
+        name, command, args = command.resolve_command(ctx, args)
+        if command is None:
+            return False
+        path.append(name)
+        ctx = command.make_context(name, args, parent=ctx, resilient_parsing=True)
+    return bool(path) and path[0] in STDOUT_STREAMING_GROUPS and ctx.params.get("output") is None
+
+
+def run_command(root: click.Command, argv: list[str], cwd: str | None = None) -> dict:
+    """
+    Runs a CLI command inside the daemon process and captures its output.
+
+    The command runs against the modules and connection pool already loaded by
+    the daemon. The client does not forward its standard input: a command
+    that reads it, e.g. to answer a prompt, is aborted and reported as
+    `fallback`, so that the client runs it in its own terminal instead. So is
+    an export to the standard output: the captured output is sent back as
+    text in a single answer, which would corrupt binary formats and hold the
+    whole export in memory. The command runs in the working directory of the client,
+    so that relative paths (`import`, `export -o`, `--errors`) resolve as they
+    would locally.
+
+    :param root: The root click group of the CLI.
+    :param argv: The command line arguments, without the program name.
+    :param cwd: The working directory of the client.
+    :return: A dictionary holding `output`, `exit_code` and `fallback`.
+    :rtype: dict
+    """
+    if argv and argv[0] == "serve" or _streams_to_stdout(root, argv):
+        return {"output": "", "exit_code": 0, "fallback": True}
+
+    daemon_cwd = os.getcwd()
+    try:
+        if cwd:
+            os.chdir(cwd)
+    except OSError:
+        return {"output": "", "exit_code": 1, "fallback": True}
+    # Commands run one at a time, so the process-wide directory is restored before the next one
+    try:
+        forwarded_input = _ForwardedInput()
+        result = CliRunner().invoke(root, argv, input=forwarded_input, standalone_mode=False, prog_name="epicevents")
+    finally:
+        os.chdir(daemon_cwd)
+    output = result.output
+    exception = result.exception
+
+    if isinstance(exception, click.exceptions.Abort) or forwarded_input.exhausted:
+        return {"output": "", "exit_code": 1, "fallback": True}
+    if isinstance(exception, click.ClickException):
+        output += f"Error: {exception.format_message()}\n"
+        return {"output": output, "exit_code": exception.exit_code, "fallback": False}
+    if exception is not None and not isinstance(exception, SystemExit):
+        sentry_sdk.capture_exception(exception)
+        output += f"Erreur : {exception}\n"
+    return {"output": output, "exit_code": result.exit_code, "fallback": False}
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            response = run_command(self.server.root, request.get("argv", []), request.get("cwd"))
+        except ValueError:
+            response = {"output": "", "exit_code": 1, "fallback": True}
+        try:
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away: there is nobody left to answer
+            pass
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server running the forwarded commands one at a time.
+
+    Commands are not run concurrently: click swaps the standard streams of the
+    process while a command runs.
+    """
+
+    def __init__(self, socket_path: Path, root: click.Command):
+        self.root = root
+        self.socket_path = Path(socket_path)
+        _remove_stale_socket(self.socket_path)
+        super().__init__(str(self.socket_path), _CommandHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise click.ClickException(f"Un démon est déjà à l'écoute sur {socket_path}.")
+
+
+@click.command("serve")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), default=DEFAULT_SOCKET_PATH,
+              show_default=True, help="Socket Unix sur lequel le démon écoute")
+@click.pass_context
+def serve(ctx, socket_path):
+    """
+    Starts a daemon keeping the CRM modules and the connection pool loaded.
+
+    While it runs, `python main.py ...` forwards its commands to the daemon
+    over a Unix socket instead of paying the start-up cost again.
+    """
+    from db.session import engine
+
+    try:
+        with engine.connect():
+            pass
+    except Exception as e:
+        sentry_sdk.capture_exception(e)
+        click.echo(f"Base de données injoignable, connexion différée : {e}")
+
+    server = DaemonServer(socket_path, ctx.find_root().command)
+    click.echo(f"Démon démarré sur {socket_path} (Ctrl+C pour arrêter)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        click.echo("Démon arrêté.")
@@ -0,0 +1,51 @@
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Only the standard library is imported here: this module runs before the CLI
+# loads SQLAlchemy, passlib or sentry, so that forwarding a command stays cheap.
+
+DEFAULT_SOCKET_PATH = Path(os.getenv("EPICEVENTS_SOCKET", Path.home() / ".epicevents.sock"))
+
+
+def forward_to_daemon(argv: list[str], socket_path: Path = DEFAULT_SOCKET_PATH) -> int | None:
+    """
+    Sends a command to the `serve` daemon when it is running and prints its output.
+
+    The working directory is forwarded so that relative paths resolve as they
+    would locally. The standard input is never read here: a command that needs
+    it, to answer a prompt or read piped data, is reported as `fallback` by the
+    daemon and runs locally with its input untouched. When the daemon is not
+    running or cannot be reached, None is returned as well and the command
+    must run locally. Setting `EPICEVENTS_NO_DAEMON` disables forwarding.
+
+    :param argv: The command line arguments, without the program name.
+    :type argv: list[str]
+    :param socket_path: The Unix socket the daemon listens on.
+    :type socket_path: Path
+    :return: The exit code of the command, or None if it was not handled.
+    :rtype: int | None
+    """
+    if os.getenv("EPICEVENTS_NO_DAEMON") or not argv or argv[0] == "serve":
+        return None
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+
+    request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode() + b"\n"
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(request)
+            with sock.makefile("rb") as stream:
+                response = json.loads(stream.readline() or b"null")
+    except (OSError, ValueError):
+        return None
+
+    if not response or response.get("fallback"):
+        return None
+    sys.stdout.write(response["output"])
+    sys.stdout.flush()
+    return response["exit_code"]
@@ -1,13 +1,21 @@
 import click
 import sentry_sdk
-from sqlalchemy.orm import sessionmaker
-from bl.event_bl import EventBL
+from bl.event_bl import EventBL, SchedulingConflictError
 from cli.auth_decorator import with_auth_payload
-from db.session import engine
+from db.session import SessionLocal as Session, unit_of_work
+from dal.pagination import DEFAULT_PAGE_SIZE
 from datetime import datetime
+from collections import Counter
 
 event_cli = click.Group("event")
-Session = sessionmaker(bind=engine)
+
+
+def parse_ids(ctx, param, values) -> list[int]:
+    # Accepts "--ids 1,2,3" as well as a repeated "--ids 1 --ids 2"
+    try:
+        return [int(part) for value in values for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise click.BadParameter("les identifiants doivent être des entiers séparés par des virgules.")
 
 
 @event_cli.command("create")
@@ -24,9 +32,7 @@ def create_event(current_user):
     :type current_user: Any
     :return: None
     """
-    db = Session()
-    bl = EventBL(db)
-
+    # The prompts run before the unit of work, so no transaction stays open while the user types
     try:
         contract_id = click.prompt("ID du contrat signé", type=int)
         start_str = click.prompt("Date de début (AAAA-MM-JJ HH:MM)")
@@ -37,22 +43,31 @@ def create_event(current_user):
 
         start_date = datetime.strptime(start_str, "%Y-%m-%d %H:%M")
         end_date = datetime.strptime(end_str, "%Y-%m-%d %H:%M")
-
-        data = {
-            "contract_id": contract_id,
-            "start_date": start_date,
-            "end_date": end_date,
-            "location": location,
-            "attendees": attendees,
-            "note": note or None,
-        }
-
-        event = bl.create_event(data, current_user)
-        click.echo(f"Évènement crée (ID #{event.id}) pour le contrat {event.contract_id}")
-
+    except click.exceptions.Abort:
+        # A prompt without input: the daemon then runs the command in a terminal
+        raise
     except Exception as e:
         sentry_sdk.capture_exception(e)
         click.echo(f"Erreur : {e}")
+        return
+
+    data = {
+        "contract_id": contract_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "location": location,
+        "attendees": attendees,
+        "note": note or None,
+    }
+
+    with unit_of_work(Session) as db:
+        try:
+            event = EventBL(db).create_event(data, current_user)
+            click.echo(f"Évènement crée (ID #{event.id}) pour le contrat {event.contract_id}")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @event_cli.command("update")
@@ -76,15 +91,14 @@ def update_event(event_id, current_user):
                          from the authentication mechanism.
     :return: None
     """
-    db = Session()
-    bl = EventBL(db)
-
-    try:
-        event = bl.get_event(event_id)
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
-        return
+    # The prompts run between the units of work, so no transaction stays open while the user types
+    with unit_of_work(Session) as db:
+        try:
+            event = EventBL(db).get_event(event_id)
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+            return
 
     click.echo(f"Évènement actuel (ID #{event.id}) pour le contrat {event.contract_id}")
     click.echo(f" - Début : {event.start_date.strftime('%Y-%m-%d %H:%M')}")
@@ -130,12 +144,151 @@ def update_event(event_id, current_user):
         click.echo("Aucune modification sélectionnée")
         return
 
-    try:
-        updated = bl.update_event(event_id, updates, current_user)
-        click.echo(f"Événement mis à jour (ID #{updated.id})")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+    conflict = None
+    with unit_of_work(Session) as db:
+        try:
+            updated = EventBL(db).update_event(event_id, updates, current_user)
+        except SchedulingConflictError as e:
+            # Raised before anything is written
+            conflict = e
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+            return
+
+    if conflict:
+        click.echo(f"Conflit de planning : {conflict}")
+        if not click.confirm("Enregistrer malgré le conflit ?", default=False):
+            click.echo("Modification annulée.")
+            return
+        with unit_of_work(Session) as db:
+            try:
+                updated = EventBL(db).update_event(event_id, updates, current_user, allow_conflicts=True)
+            except Exception as e:
+                db.rollback()
+                sentry_sdk.capture_exception(e)
+                click.echo(f"Erreur : {e}")
+                return
+
+    click.echo(f"Événement mis à jour (ID #{updated.id})")
+
+
+@event_cli.command("assign-support")
+@click.option("--ids", multiple=True, required=True, callback=parse_ids,
+              help="Identifiants des évènements, séparés par des virgules")
+@click.option("--support-id", type=int, default=None, help="ID du support, omis pour désassigner")
+@click.option("--force", is_flag=True, help="Assigner même si le support est déjà pris sur ces créneaux")
+@with_auth_payload
+def assign_support(ids, support_id, force, current_user):
+    """
+    Assigns a support collaborator to many events at once, with a single
+    update statement. Only management can assign the support, and events
+    overlapping the schedule of the support are refused unless `--force`
+    is given.
+
+    :param ids: Identifiers of the events to update.
+    :param support_id: Identifier of the support collaborator, None to
+                       remove the current assignment.
+    :param force: Assign the events even when they overlap.
+    :param current_user: The authenticated user running the command.
+    :return: None
+    """
+    with unit_of_work(Session) as db:
+        bl = EventBL(db)
+
+        try:
+            count = bl.assign_support(ids, support_id, current_user, allow_conflicts=force)
+            if support_id is None:
+                click.echo(f"{count} évènement(s) désassigné(s).")
+            else:
+                click.echo(f"{count} évènement(s) assigné(s) au support #{support_id}.")
+
+        except PermissionError as pe:
+            db.rollback()
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+
+
+@event_cli.command("auto-assign")
+@click.option("--dry-run", is_flag=True, help="Afficher les assignations sans les enregistrer")
+@with_auth_payload
+def auto_assign_support(dry_run, current_user):
+    """
+    Assigns a support collaborator to every event without one, balancing the
+    load between the supports and never giving a support overlapping events.
+    Only management can assign the support.
+
+    :param dry_run: Display the assignments without saving them.
+    :param current_user: The authenticated user running the command.
+    :return: None
+    """
+    with unit_of_work(Session) as db:
+        bl = EventBL(db)
+
+        try:
+            result = bl.auto_assign_support(current_user, dry_run=dry_run)
+            if not result.assignments and not result.unassigned:
+                click.echo("Tous les événements ont un support assigné.")
+                return
+
+            verb = "seraient assigné(s)" if dry_run else "assigné(s)"
+            click.echo(f"{len(result.assignments)} évènement(s) {verb}.")
+            per_support = Counter(result.assignments.values())
+            for support_id, count in sorted(per_support.items()):
+                click.echo(f" - Support #{support_id} : {count} évènement(s)")
+
+            if result.unassigned:
+                shown = ", ".join(map(str, result.unassigned[:20]))
+                more = "…" if len(result.unassigned) > 20 else ""
+                click.echo(f"{len(result.unassigned)} évènement(s) sans support disponible : {shown}{more}")
+
+        except PermissionError as pe:
+            db.rollback()
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            db.rollback()
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+
+
+@event_cli.command("free")
+@click.option("--start", "start_str", required=True, help="Début du créneau (AAAA-MM-JJ HH:MM)")
+@click.option("--end", "end_str", required=True, help="Fin du créneau (AAAA-MM-JJ HH:MM)")
+@with_auth_payload
+def list_free_supports(start_str, end_str, current_user):
+    """
+    Lists the support collaborators without any event between two dates.
+    Only management can look up the availabilities.
+
+    :param start_str: Start of the slot, formatted as "AAAA-MM-JJ HH:MM".
+    :param end_str: End of the slot, formatted as "AAAA-MM-JJ HH:MM".
+    :param current_user: The authenticated user running the command.
+    :return: None
+    """
+    with unit_of_work(Session) as db:
+        bl = EventBL(db)
+
+        try:
+            start = datetime.strptime(start_str, "%Y-%m-%d %H:%M")
+            end = datetime.strptime(end_str, "%Y-%m-%d %H:%M")
+            supports = bl.find_free_supports(start, end, current_user)
+            if not supports:
+                click.echo("Aucun support disponible sur ce créneau.")
+                return
+
+            click.echo("Supports disponibles :")
+            for s in supports:
+                click.echo(f" - ID #{s.id} | {s.name} | {s.email}")
+
+        except PermissionError as pe:
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @event_cli.command("nosupport")
@@ -152,25 +305,25 @@ def list_events_without_support(current_user):
         with the system.
     :return: A list of events without support associated for the given user.
     """
-    db = Session()
-    bl = EventBL(db)
+    with unit_of_work(Session) as db:
+        bl = EventBL(db)
 
-    try:
-        events = bl.list_events_without_support(current_user)
-        if not events:
-            click.echo("Tous les événements ont un support assigné.")
-            return
+        try:
+            events = bl.list_events_without_support(current_user)
+            if not events:
+                click.echo("Tous les événements ont un support assigné.")
+                return
 
-        click.echo("Événements sans support :")
-        for e in events:
-            click.echo(f" - ID #{e.id} | Début : {e.start_date.strftime('%Y-%m-%d %H:%M')} "
-                       f"| {e.end_date.strftime('%Y-%m-%d %H:%M')} | Lieu : {e.location}")
+            click.echo("Événements sans support :")
+            for e in events:
+                click.echo(f" - ID #{e.id} | Début : {e.start_date.strftime('%Y-%m-%d %H:%M')} "
+                           f"| {e.end_date.strftime('%Y-%m-%d %H:%M')} | Lieu : {e.location}")
 
-    except PermissionError as pe:
-        click.echo(f"Accès refusé : {pe}")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+        except PermissionError as pe:
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @event_cli.command("myevents")
@@ -189,57 +342,71 @@ def list_my_events(current_user):
     :return: Events associated with the current user.
     :rtype: list
     """
-    db = Session()
-    bl = EventBL(db)
+    with unit_of_work(Session) as db:
+        bl = EventBL(db)
 
-    try:
-        events = bl.list_events_for_current_support(current_user)
-        if not events:
-            click.echo("Aucun événement ne vous est assigné.")
-            return
+        try:
+            events = bl.list_events_for_current_support(current_user)
+            if not events:
+                click.echo("Aucun événement ne vous est assigné.")
+                return
 
-        click.echo("Vos événements à venir :")
-        for e in events:
-            click.echo(f" - ID #{e.id} | Début : {e.start_date.strftime('%Y-%m-%d %H:%M')} "
-                       f"| Fin : {e.end_date.strftime('%Y-%m-%d %H:%M')} | Lieu : {e.location}")
+            click.echo("Vos événements à venir :")
+            for e in events:
+                click.echo(f" - ID #{e.id} | Début : {e.start_date.strftime('%Y-%m-%d %H:%M')} "
+                           f"| Fin : {e.end_date.strftime('%Y-%m-%d %H:%M')} | Lieu : {e.location}")
 
-    except PermissionError as pe:
-        click.echo(f"Accès refusé : {pe}")
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+        except PermissionError as pe:
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
 
 
 @event_cli.command("list")
+@click.option("--limit", type=click.IntRange(min=1), default=None, help="Nombre maximum d'événements par page")
+@click.option("--after", type=int, default=None, help="Afficher les événements situés après cet ID")
 @with_auth_payload
-def list_all_events(current_user):
+def list_all_events(limit=None, after=None, current_user=None):
     """
     Lists all events available to the current user. This function retrieves and
-    displays a list of events that the authenticated user has access to.
+    displays a list of events that the authenticated user has access to. When
+    `--limit` or `--after` is given, a single page is displayed along with the
+    cursor of the next page.
 
+    :param limit: Maximum number of events to display.
+    :param after: Id of the last event of the previous page.
     :param current_user: The currently authenticated user requesting the list of
                          events.
     :type current_user: User
     :return: A list of events accessible to the authenticated user.
     :rtype: list
     """
-    db = Session()
-    bl = EventBL(db)
-
-    try:
-        events = bl.list_all_events()
-        if not events:
-            click.echo("Aucun événement enregistré.")
-            return
-
-        click.echo("Tous les événements :")
-        for e in events:
-            label_support = f"Support : {e.support_id}" if e.support_id else "Aucun support"
-            click.echo(
-                f" - ID #{e.id} | {e.start_date.strftime('%Y-%m-%d %H:%M')} → {e.end_date.strftime('%Y-%m-%d %H:%M')}"
-                f" | Lieu : {e.location} | Participants : {e.attendees} | {label_support}"
-            )
-
-    except Exception as e:
-        sentry_sdk.capture_exception(e)
-        click.echo(f"Erreur : {e}")
+    with unit_of_work(Session) as db:
+        bl = EventBL(db)
+
+        try:
+            page = None
+            if limit or after is not None:
+                page = bl.list_events_page(after=after, limit=limit or DEFAULT_PAGE_SIZE)
+                events = page.items
+            else:
+                events = bl.list_all_events()
+            if not events:
+                click.echo("Aucun événement enregistré.")
+                return
+
+            click.echo("Tous les événements :")
+            for e in events:
+                label_support = f"Support : {e.support_id}" if e.support_id else "Aucun support"
+                click.echo(
+                    f" - ID #{e.id} | {e.start_date.strftime('%Y-%m-%d %H:%M')} → {e.end_date.strftime('%Y-%m-%d %H:%M')}"
+                    f" | Lieu : {e.location} | Participants : {e.attendees} | {label_support}"
+                )
+
+            if page and page.next_cursor:
+                click.echo(f"Page suivante : --after {page.next_cursor}")
+
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import click
+import sentry_sdk
+from bl.client_bl import ClientBLL
+from bl.contract_bl import ContractBL
+from bl.event_bl import EventBL
+from cli.auth_decorator import with_auth_payload
+from cli.export_writers import COMPRESSIONS, FORMATS, detect_format, export_rows
+from db.session import SessionLocal as Session, unit_of_work
+from dtos.client_dto import ClientDTO
+from dtos.contract_dto import ContractDTO
+from dtos.event_dto import EventDTO
+from models import Client, Contract, Event
+
+DEFAULT_CHUNK_SIZE = 1000
+
+export_cli = click.Group("export")
+
+
+def export_options(f):
+    f = click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path), default=None,
+                     help="Fichier de sortie, sortie standard par défaut")(f)
+    f = click.option("--format", "fmt", type=click.Choice(FORMATS), default=None,
+                     help="Format de sortie, déduit de l'extension du fichier (CSV par défaut)")(f)
+    f = click.option("--compress", type=click.Choice(COMPRESSIONS), default=None, help="Compression de la sortie")(f)
+    f = click.option("--chunk-size", type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE, show_default=True,
+                     help="Lignes lues par aller-retour avec la base (et par groupe de lignes Parquet)")(f)
+    return f
+
+
+def run_export(stream_rows, dto_class: type, model: type, output: Path | None, fmt: str | None,
+               compress: str | None, chunk_size: int) -> None:
+    """
+    Streams the rows returned by `stream_rows(db)` to the output, inside one
+    unit of work so that the server-side cursor stays open while writing.
+    The summary goes to the standard error, to keep the standard output clean.
+    """
+    fmt = detect_format(output, fmt)
+    try:
+        with unit_of_work(Session) as db:
+            count = export_rows(stream_rows(db), dto_class, fmt, output, compress, chunk_size, model)
+    except click.ClickException:
+        raise
+    except PermissionError as e:
+        click.echo(f"Erreur : {e}", err=True)
+        return
+    except Exception as e:
+        sentry_sdk.capture_exception(e)
+        click.echo(f"Erreur lors de l'export : {e}", err=True)
+        return
+    click.echo(f"{count} lignes exportées.", err=True)
+
+
+@export_cli.command("clients")
+@export_options
+@with_auth_payload
+def export_clients(output, fmt, compress, chunk_size, current_user):
+    """
+    Exports all clients.
+    """
+    run_export(lambda db: ClientBLL(db).stream_clients(chunk_size),
+               ClientDTO, Client, output, fmt, compress, chunk_size)
+
+
+@export_cli.command("contracts")
+@export_options
+@click.option("--signed/--unsigned", default=None, help="Uniquement les contrats signés / non signés")
+@click.option("--unpaid", is_flag=True, help="Uniquement les contrats restant à payer")
+@with_auth_payload
+def export_contracts(output, fmt, compress, chunk_size, signed, unpaid, current_user):
+    """
+    Exports contracts, optionally filtered like `contract signed`, `unsigned`
+    and `unpaid`.
+    """
+    run_export(lambda db: ContractBL(db).stream_contracts(current_user, signed, unpaid, chunk_size),
+               ContractDTO, Contract, output, fmt, compress, chunk_size)
+
+
+@export_cli.command("events")
+@export_options
+@click.option("--without-support", is_flag=True, help="Uniquement les évènements sans support")
+@with_auth_payload
+def export_events(output, fmt, compress, chunk_size, without_support, current_user):
+    """
+    Exports events, optionally only those without support like `event nosupport`.
+    """
+    run_export(lambda db: EventBL(db).stream_events(current_user, without_support, chunk_size),
+               EventDTO, Event, output, fmt, compress, chunk_size)
@@ -0,0 +1,201 @@
+import csv
+import gzip
+import io
+import json
+import typing
+from contextlib import ExitStack, contextmanager
+from dataclasses import fields
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+import click
+
+FORMATS = ("csv", "jsonl", "parquet")
+COMPRESSIONS = ("gzip", "zstd")
+
+# Parquet decimal type of an unconstrained NUMERIC column: 10 decimal places,
+# the scale SQLAlchemy itself returns such columns with
+DEFAULT_DECIMAL_PRECISION = 38
+DEFAULT_DECIMAL_SCALE = 10
+
+
+def detect_format(path: Path | None, fmt: str | None = None) -> str:
+    """
+    Returns the export format, from `fmt` or from the output file extension
+    (ignoring a .gz/.zst suffix), CSV by default.
+    """
+    if fmt:
+        return fmt
+    suffixes = [s.lower() for s in path.suffixes] if path else []
+    if suffixes and suffixes[-1] in (".gz", ".zst"):
+        suffixes.pop()
+    return {".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}.get(suffixes[-1] if suffixes else "", "csv")
+
+
+def _optional_import(module: str, feature: str):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise click.ClickException(f"{feature} nécessite le paquet '{module}' (pip install {module}).")
+
+
+@contextmanager
+def open_output(path: Path | None, compression: str | None = None) -> Iterator[BinaryIO]:
+    """
+    Opens the binary export stream: the output file, or the standard output,
+    wrapped in a gzip or zstd compressor. The standard output is never closed.
+    """
+    with ExitStack() as stack:
+        stream = stack.enter_context(open(path, "wb")) if path else click.get_binary_stream("stdout")
+        if compression == "gzip":
+            stream = stack.enter_context(gzip.GzipFile(fileobj=stream, mode="wb"))
+        elif compression == "zstd":
+            zstandard = _optional_import("zstandard", "La compression zstd")
+            stream = stack.enter_context(zstandard.ZstdCompressor().stream_writer(stream, closefd=False))
+        yield stream
+        stream.flush()
+
+
+@contextmanager
+def _text(stream: BinaryIO) -> Iterator[io.TextIOWrapper]:
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        yield text
+    finally:
+        text.flush()
+        # The binary stream belongs to open_output
+        text.detach()
+
+
+def _rows(items: Iterable) -> Iterator:
+    # Columnar batches, such as ContractBatch, are written row by row by the text formats
+    for item in items:
+        if hasattr(item, "to_columns"):
+            yield from item
+        else:
+            yield item
+
+
+def _json_default(value):
+    # Amounts are written as strings, a JSON number would be read back as a float
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} n'est pas sérialisable en JSON.")
+
+
+def write_csv(rows: Iterable, dto_class: type, stream: BinaryIO) -> int:
+    names = [f.name for f in fields(dto_class)]
+    count = 0
+    with _text(stream) as text:
+        writer = csv.writer(text)
+        writer.writerow(names)
+        for row in _rows(rows):
+            writer.writerow([getattr(row, name) for name in names])
+            count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable, dto_class: type, stream: BinaryIO) -> int:
+    names = [f.name for f in fields(dto_class)]
+    count = 0
+    with _text(stream) as text:
+        for row in _rows(rows):
+            text.write(json.dumps({name: getattr(row, name) for name in names}, default=_json_default,
+                                  ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def _arrow_decimal(pa, column_type):
+    precision = getattr(column_type, "precision", None) or DEFAULT_DECIMAL_PRECISION
+    scale = getattr(column_type, "scale", None)
+    return pa.decimal128(precision, DEFAULT_DECIMAL_SCALE if scale is None else scale)
+
+
+def _arrow_schema(pa, dto_class: type, model: type | None = None):
+    hints = typing.get_type_hints(dto_class)
+    types = {int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_(),
+             date: pa.date32(), datetime: pa.timestamp("us")}
+    columns = model.__table__.c if model is not None else {}
+    schema = []
+    for f in fields(dto_class):
+        hint = hints[f.name]
+        # Optional[X] -> X
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        hint = args[0] if args else hint
+        if hint is Decimal:
+            # The precision and scale of the NUMERIC column of the model
+            column = columns.get(f.name)
+            schema.append(pa.field(f.name, _arrow_decimal(pa, column.type if column is not None else None)))
+        else:
+            schema.append(pa.field(f.name, types[hint]))
+    return pa.schema(schema)
+
+
+def write_parquet(rows: Iterable, dto_class: type, stream: BinaryIO, compression: str | None = None,
+                  row_group_size: int = 1000, model: type | None = None) -> int:
+    """
+    Writes the rows as a Parquet file, one row group per `row_group_size` rows,
+    so that only one row group is held in memory. A columnar batch, such as a
+    `ContractBatch`, is written as its own row group, straight from its
+    columns. The compression is applied by Parquet itself to each column chunk.
+    `Decimal` fields are written as Parquet decimals, with the precision and
+    scale of the matching NUMERIC column of `model`.
+    """
+    pa = _optional_import("pyarrow", "L'export Parquet")
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(pa, dto_class, model)
+    names = schema.names
+    count = 0
+    with pq.ParquetWriter(stream, schema, compression=compression or "none") as writer:
+        columns = {name: [] for name in names}
+        pending = 0
+        for row in rows:
+            if hasattr(row, "to_columns"):
+                if pending:
+                    writer.write_table(pa.table(columns, schema=schema))
+                    columns, pending = {name: [] for name in names}, 0
+                writer.write_table(pa.table(row.to_columns(), schema=schema))
+                count += len(row)
+                continue
+            for name in names:
+                columns[name].append(getattr(row, name))
+            count += 1
+            pending += 1
+            if pending == row_group_size:
+                writer.write_table(pa.table(columns, schema=schema))
+                columns, pending = {name: [] for name in names}, 0
+        if pending or not count:
+            writer.write_table(pa.table(columns, schema=schema))
+    return count
+
+
+def export_rows(rows: Iterable, dto_class: type, fmt: str, path: Path | None, compression: str | None = None,
+                chunk_size: int = 1000, model: type | None = None) -> int:
+    """
+    Writes a stream of DTOs to a file or to the standard output.
+
+    :param rows: The DTOs to export, or columnar batches of DTOs, consumed lazily.
+    :param dto_class: The DTO dataclass, giving the columns and their types.
+    :param fmt: "csv", "jsonl" or "parquet".
+    :param path: The output file, or None for the standard output.
+    :param compression: "gzip", "zstd" or None. Parquet compresses its column
+        chunks with the same codec instead of the whole file.
+    :param chunk_size: Rows per Parquet row group.
+    :param model: The ORM model of the rows, giving the precision and scale
+        of the Parquet decimals.
+    :return: The number of exported rows.
+    :rtype: int
+    """
+    if fmt == "parquet":
+        with open_output(path) as stream:
+            return write_parquet(rows, dto_class, stream, compression, chunk_size, model)
+
+    writer = write_csv if fmt == "csv" else write_jsonl
+    with open_output(path, compression) as stream:
+        return writer(rows, dto_class, stream)
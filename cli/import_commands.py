@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+
+import click
+import sentry_sdk
+from bl.import_bl import ImportBL
+from cli.auth_decorator import with_auth_payload
+from cli.import_readers import FORMATS, chunked, detect_format, read_rows
+from db.session import SessionLocal as Session, unit_of_work
+from dtos.import_result_dto import RejectedRowDTO
+
+DEFAULT_CHUNK_SIZE = 1000
+
+import_cli = click.Group("import")
+
+
+def import_options(f):
+    f = click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))(f)
+    f = click.option("--format", "fmt", type=click.Choice(FORMATS), default=None,
+                     help="Format du fichier, déduit de son extension par défaut")(f)
+    f = click.option("--chunk-size", type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE, show_default=True,
+                     help="Nombre de lignes insérées et validées par transaction")(f)
+    f = click.option("--errors", "errors_path", type=click.Path(dir_okay=False, path_type=Path), default=None,
+                     help="Rapport des lignes rejetées (JSON Lines), <fichier>.errors.jsonl par défaut")(f)
+    return f
+
+
+def run_import(method_name: str, path: Path, fmt: str | None, chunk_size: int, errors_path: Path | None,
+               current_user: dict) -> None:
+    """
+    Streams an import file through `ImportBL` one chunk at a time.
+
+    Each chunk is validated, inserted and committed in its own unit of work, so
+    a failure only loses the current chunk and memory use does not depend on
+    the size of the file. Rejected rows are written to a JSON Lines report with
+    their line number and the reason of the rejection.
+
+    :param method_name: The `ImportBL` method importing a chunk.
+    :param path: The import file.
+    :param fmt: The file format, or None to deduce it from the extension.
+    :param chunk_size: The number of rows per transaction.
+    :param errors_path: The error report, `<path>.errors.jsonl` by default.
+    :param current_user: The authenticated user running the import.
+    :return: None
+    """
+    try:
+        fmt = detect_format(path, fmt)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    errors_path = errors_path or path.with_name(f"{path.name}.errors.jsonl")
+
+    inserted = rejected = 0
+    with open(errors_path, "w", encoding="utf-8") as report:
+        for chunk in chunked(read_rows(path, fmt), chunk_size):
+            try:
+                with unit_of_work(Session) as db:
+                    result = getattr(ImportBL(db), method_name)(chunk, current_user)
+            except PermissionError as e:
+                click.echo(f"Erreur : {e}")
+                break
+            except Exception as e:
+                sentry_sdk.capture_exception(e)
+                result_rejected = [RejectedRowDTO(line=line, error=f"Lot annulé : {e}", row=row) for line, row in chunk]
+            else:
+                inserted += result.inserted
+                result_rejected = result.rejected
+
+            for row in result_rejected:
+                report.write(json.dumps({"line": row.line, "error": row.error, "row": row.row},
+                                        ensure_ascii=False, default=str) + "\n")
+            rejected += len(result_rejected)
+
+    click.echo(f"Lignes importées : {inserted}, rejetées : {rejected}")
+    if rejected:
+        click.echo(f"Rapport d'erreurs : {errors_path}")
+    else:
+        errors_path.unlink(missing_ok=True)
+
+
+@import_cli.command("clients")
+@import_options
+@with_auth_payload
+def import_clients(path, fmt, chunk_size, errors_path, current_user):
+    """
+    Imports clients from a CSV or JSON Lines file.
+
+    Columns: name, email, phone, company, creation_date, last_contact_date.
+    The clients are assigned to the commercial running the import.
+    """
+    run_import("import_clients", path, fmt, chunk_size, errors_path, current_user)
+
+
+@import_cli.command("contracts")
+@import_options
+@with_auth_payload
+def import_contracts(path, fmt, chunk_size, errors_path, current_user):
+    """
+    Imports contracts from a CSV or JSON Lines file.
+
+    Columns: client_id, total_amount, amount_left, creation_date, status and,
+    for the management team, commercial_id (the client's commercial by default).
+    """
+    run_import("import_contracts", path, fmt, chunk_size, errors_path, current_user)
+
+
+@import_cli.command("events")
+@import_options
+@with_auth_payload
+def import_events(path, fmt, chunk_size, errors_path, current_user):
+    """
+    Imports events from a CSV or JSON Lines file.
+
+    Columns: contract_id, start_date, end_date, location, attendees, note.
+    Each contract must be signed and belong to the commercial running the import.
+    """
+    run_import("import_events", path, fmt, chunk_size, errors_path, current_user)
@@ -0,0 +1,65 @@
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+FORMATS = ("csv", "jsonl")
+
+
+def detect_format(path: Path, fmt: str | None = None) -> str:
+    """
+    Returns the format of an import file, from `fmt` or from the file extension.
+
+    :param path: The import file.
+    :type path: Path
+    :param fmt: The format given on the command line, if any.
+    :type fmt: str | None
+    :return: "csv" or "jsonl".
+    :rtype: str
+    """
+    fmt = fmt or {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}.get(path.suffix.lower())
+    if fmt not in FORMATS:
+        raise ValueError(f"Format d'import inconnu pour {path.name} : utilisez --format csv ou jsonl.")
+    return fmt
+
+
+def read_rows(path: Path, fmt: str) -> Iterator[tuple[int, dict | None]]:
+    """
+    Streams the rows of a CSV file with a header line, or of a JSON Lines file.
+
+    The file is read lazily, one row at a time, so its size does not matter.
+    Each row comes with its line number; a JSON line that cannot be parsed is
+    yielded as None so that it ends up in the error report.
+
+    :param path: The import file.
+    :type path: Path
+    :param fmt: "csv" or "jsonl".
+    :type fmt: str
+    :return: An iterator of `(line, row)` pairs.
+    :rtype: Iterator[tuple[int, dict | None]]
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line, text in enumerate(f, start=1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except ValueError:
+                row = None
+            yield line, row
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """
+    Splits an iterable into lists of at most `size` items, lazily.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -1,9 +1,10 @@
 import click
 import sentry_sdk
-from db.session import SessionLocal
+from db.session import unit_of_work
+from db.database_init import create_missing_indexes
 from bl.role_bl import RoleBL
 from bl.collaborator_bl import CollaboratorBL
-from security.password import hash_password
+from security.password import BCRYPT_ROUNDS, calibrate_rounds, hash_password
 
 
 init_cli = click.Group("init")
@@ -11,53 +12,92 @@ init_cli = click.Group("init")
 
 @click.command("all")
 def init_all():
-    db = SessionLocal()
     try:
-        role_bl = RoleBL(db)
-        collaborator_bl = CollaboratorBL(db)
-
-        # Creation of roles if non-existing
-        created_roles = []
-        for role in ["gestion", "commercial", "support"]:
-            try:
-                role_bl.create_role(role)
-                created_roles.append(role)
-            except ValueError:
-                continue  # Role already exists
-
-        if created_roles:
-            click.echo(f"Rôles crées : {', '.join(created_roles)}")
-        else:
-            click.echo("Les rôles existent déjà.")
-
-        # Creation of admin if non-existing
-        admin_email = "admin@epicevents.fr"
-        existing_admin = collaborator_bl.dal.get_by_email_raw(admin_email)
-
-        if not existing_admin:
-            password = click.prompt("Mot de passe de l'administrateur", hide_input=True, confirmation_prompt=True)
-            hashed_pw = hash_password(password)
-
-            gestion_role = role_bl.get_gestion_role()
-            if not gestion_role:
-                click.echo("Rôle 'gestion' introuvable. Initialisation interrompue.")
-                return
-
-            collaborator_bl.create_collaborator({
-                "name": "Admin",
-                "email": admin_email,
-                "password": hashed_pw,
-                "role_id": gestion_role.id
-            })
-            click.echo("Admin créé : admin@epicevents.fr")
-        else:
-            click.echo("Un administrateur existe déjà.")
+        with unit_of_work() as db:
+            role_bl = RoleBL(db)
+            collaborator_bl = CollaboratorBL(db)
+
+            # Creation of roles if non-existing
+            created_roles = []
+            for role in ["gestion", "commercial", "support"]:
+                try:
+                    role_bl.create_role(role)
+                    created_roles.append(role)
+                except ValueError:
+                    continue  # Role already exists
+
+            if created_roles:
+                click.echo(f"Rôles crées : {', '.join(created_roles)}")
+            else:
+                click.echo("Les rôles existent déjà.")
+
+            # Creation of admin if non-existing
+            admin_email = "admin@epicevents.fr"
+            existing_admin = collaborator_bl.dal.get_by_email_raw(admin_email)
+
+            if not existing_admin:
+                password = click.prompt("Mot de passe de l'administrateur", hide_input=True, confirmation_prompt=True)
+                hashed_pw = hash_password(password)
+
+                gestion_role = role_bl.get_gestion_role()
+                if not gestion_role:
+                    click.echo("Rôle 'gestion' introuvable. Initialisation interrompue.")
+                    return
+
+                collaborator_bl.create_collaborator({
+                    "name": "Admin",
+                    "email": admin_email,
+                    "password": hashed_pw,
+                    "role_id": gestion_role.id
+                })
+                click.echo("Admin créé : admin@epicevents.fr")
+            else:
+                click.echo("Un administrateur existe déjà.")
 
+    except click.exceptions.Abort:
+        # A prompt without input: the daemon then runs the command in a terminal
+        raise
     except Exception as e:
         sentry_sdk.capture_exception(e)
         click.echo(f"Erreur lors de l'initialisation : {e}")
-    finally:
-        db.close()
+
+
+@click.command("indexes")
+def init_indexes():
+    """
+    Creates the missing indexes on a live database without locking writers.
+    """
+    try:
+        created = create_missing_indexes()
+        if created:
+            click.echo(f"Index créés : {', '.join(created)}")
+        else:
+            click.echo("Tous les index existent déjà.")
+    except Exception as e:
+        sentry_sdk.capture_exception(e)
+        click.echo(f"Erreur lors de la création des index : {e}")
+
+
+@click.command("calibrate")
+@click.option("--target-ms", type=click.FloatRange(min=0, min_open=True), default=250, show_default=True,
+              help="Latence de vérification visée, en millisecondes")
+@click.option("--max-rounds", type=click.IntRange(4, 31), default=16, show_default=True,
+              help="Coût bcrypt maximal à mesurer")
+def init_calibrate(target_ms, max_rounds):
+    """
+    Measures bcrypt on this machine and suggests the cost hitting a target
+    verification latency.
+    """
+    chosen, timings = calibrate_rounds(target_ms, max_rounds=max_rounds)
+    for rounds, elapsed in timings.items():
+        click.echo(f"Coût {rounds} : {elapsed:.1f} ms")
+    if timings[chosen] > target_ms:
+        click.echo(f"Même le coût minimal dépasse {target_ms:g} ms.")
+    click.echo(f"Coût recommandé : BCRYPT_ROUNDS={chosen} (actuel : {BCRYPT_ROUNDS})")
+    if chosen != BCRYPT_ROUNDS:
+        click.echo("Les mots de passe seront re-hachés au coût choisi lors de la prochaine connexion de chacun.")
 
 
 init_cli.add_command(init_all)
+init_cli.add_command(init_indexes)
+init_cli.add_command(init_calibrate)
@@ -0,0 +1,49 @@
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group importing its subcommands only when they are invoked.
+
+    Each subcommand is declared as an import path `"module:attribute"`, so that
+    running one command does not import the BL, DAL and SQLAlchemy modules of
+    all the others.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def invoke(self, ctx: click.Context):
+        # Click clears the arguments before running the group callback, which
+        # names the monitoring transaction after the invoked command
+        ctx.meta["command_path"] = self._command_path(ctx, [*ctx.protected_args, *ctx.args])
+        return super().invoke(ctx)
+
+    def _command_path(self, ctx: click.Context, args: list[str]) -> list[str]:
+        # Names of the nested commands, e.g. ["event", "list"]: option values are never included
+        path, command = [], self
+        while isinstance(command, click.Group) and args:
+            subcommand = command.get_command(ctx, args[0])
+            if subcommand is None:
+                break
+            path.append(args[0])
+            command, args = subcommand, args[1:]
+        return path
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"{self.lazy_subcommands[cmd_name]} n'est pas une commande click.")
+        return command
@@ -0,0 +1,114 @@
+import click
+import sentry_sdk
+from bl.report_bl import ReportBL
+from cli.auth_decorator import with_auth_payload
+from db.session import SessionLocal as Session, unit_of_work
+
+report_cli = click.Group("report")
+
+
+def _name(collaborator_id, name, missing: str) -> str:
+    return f"#{collaborator_id} {name}" if collaborator_id is not None else missing
+
+
+def _echo_summary(label: str, summary) -> None:
+    click.echo(f" - {label} | Signés : {summary.signed} | Non signés : {summary.unsigned} "
+               f"| Montant : {summary.total_amount:.2f}€ | Restant dû : {summary.amount_left:.2f}€")
+
+
+@report_cli.command("contracts")
+@with_auth_payload
+def report_contracts(current_user):
+    """
+    Displays the contract figures of each commercial: number of signed and
+    unsigned contracts, total amount and amount left to pay.
+
+    :param current_user: The authenticated user running the command.
+    :return: None
+    """
+    with unit_of_work(Session) as db:
+        bl = ReportBL(db)
+
+        try:
+            rows, totals = bl.contract_summary(current_user)
+            if not rows:
+                click.echo("Aucun contrat enregistré.")
+                return
+
+            click.echo("Contrats par commercial :")
+            for r in rows:
+                _echo_summary(_name(r.commercial_id, r.commercial_name, "Sans commercial"), r)
+            _echo_summary("Total", totals)
+
+        except PermissionError as pe:
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+
+
+@report_cli.command("events")
+@click.option("--year", type=click.IntRange(min=1), default=None, help="Uniquement les évènements de cette année")
+@with_auth_payload
+def report_events(year, current_user):
+    """
+    Displays the number of events of each support collaborator, month by
+    month.
+
+    :param year: Only count the events starting this year.
+    :param current_user: The authenticated user running the command.
+    :return: None
+    """
+    with unit_of_work(Session) as db:
+        bl = ReportBL(db)
+
+        try:
+            rows = bl.events_per_support(current_user, year=year)
+            if not rows:
+                click.echo("Aucun évènement enregistré.")
+                return
+
+            click.echo("Évènements par support et par mois :")
+            for r in rows:
+                click.echo(f" - {_name(r.support_id, r.support_name, 'Sans support')} | {r.month} "
+                           f"| {r.events} évènement(s)")
+
+        except PermissionError as pe:
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
+
+
+@report_cli.command("clients")
+@click.option("--days", type=click.IntRange(min=0), default=180, show_default=True,
+              help="Nombre de jours sans contact au-delà duquel un client est inactif")
+@with_auth_payload
+def report_clients(days, current_user):
+    """
+    Displays, for each commercial, the number of clients not contacted for
+    `--days` days, including those never contacted.
+
+    :param days: Number of days without contact.
+    :param current_user: The authenticated user running the command.
+    :return: None
+    """
+    with unit_of_work(Session) as db:
+        bl = ReportBL(db)
+
+        try:
+            rows = bl.inactive_clients(current_user, days=days)
+            if not rows:
+                click.echo(f"Tous les clients ont été contactés ces {days} derniers jours.")
+                return
+
+            click.echo(f"Clients sans contact depuis {days} jours :")
+            for r in rows:
+                click.echo(f" - {_name(r.commercial_id, r.commercial_name, 'Sans commercial')} "
+                           f"| {r.inactive} client(s) dont {r.never_contacted} jamais contacté(s)")
+
+        except PermissionError as pe:
+            click.echo(f"Accès refusé : {pe}")
+        except Exception as e:
+            sentry_sdk.capture_exception(e)
+            click.echo(f"Erreur : {e}")
@@ -0,0 +1,54 @@
+import time
+
+import click
+import sentry_sdk
+from db.seed import SeedSpec, seed_database
+from db.session import engine
+from models import Base
+
+DEFAULT_SPEC = SeedSpec()
+
+
+@click.command("seed")
+@click.option("--collaborators", type=click.IntRange(min=3), default=DEFAULT_SPEC.collaborators, show_default=True,
+              help="Nombre de collaborateurs, répartis entre les trois rôles")
+@click.option("--clients-per-commercial", type=click.IntRange(min=0), default=DEFAULT_SPEC.clients_per_commercial,
+              show_default=True, help="Clients de chaque commercial")
+@click.option("--contracts-per-client", type=click.IntRange(min=0), default=DEFAULT_SPEC.contracts_per_client,
+              show_default=True, help="Contrats de chaque client")
+@click.option("--seed", "seed_value", type=int, default=DEFAULT_SPEC.seed, show_default=True,
+              help="Graine du générateur : une même graine produit les mêmes données")
+@click.option("--workers", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Processus de chargement")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=10_000, show_default=True,
+              help="Lignes par transaction")
+@click.option("--reset", is_flag=True, help="Supprime et recrée toutes les tables avant le chargement")
+@click.option("--password", prompt="Mot de passe des collaborateurs générés", hide_input=True,
+              confirmation_prompt=True, help="Mot de passe commun des collaborateurs générés")
+def seed(collaborators, clients_per_commercial, contracts_per_client, seed_value, workers, chunk_size, reset,
+         password):
+    """
+    Generates a consistent dataset of collaborators, clients, contracts and
+    events, for load tests and demos.
+    """
+    if reset:
+        click.confirm("Toutes les données de la base seront supprimées. Continuer ?", abort=True)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+    spec = SeedSpec(collaborators=collaborators, clients_per_commercial=clients_per_commercial,
+                    contracts_per_client=contracts_per_client, seed=seed_value)
+    start = time.perf_counter()
+    try:
+        result = seed_database(engine, spec, workers=workers, chunk_size=chunk_size, password=password)
+    except Exception as e:
+        sentry_sdk.capture_exception(e)
+        click.echo(f"Erreur lors de la génération : {e}")
+        return
+    elapsed = time.perf_counter() - start
+
+    counts = result["counts"]
+    rows = sum(counts.values())
+    click.echo(f"{counts['collaborators']} collaborateurs, {counts['clients']} clients, "
+               f"{counts['contracts']} contrats et {counts['events']} évènements créés "
+               f"en {elapsed:.1f} s ({rows / max(elapsed, 1e-9):.0f} lignes/s).")
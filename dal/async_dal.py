@@ -0,0 +1,88 @@
+from collections.abc import Iterator
+from sqlalchemy.ext.asyncio import AsyncSession
+from dal.client_dal import ClientDAL
+from dal.collaborator_dal import CollaboratorDAL
+from dal.contract_dal import ContractDAL
+from dal.event_dal import EventDAL
+from dal.role_dal import RoleDAL
+
+
+_END = object()
+
+
+class AsyncStream:
+    """
+    Async iterator over the result of a streaming DAL method, such as `stream`.
+
+    The synchronous iterator reads a server-side cursor, so every step runs
+    through `AsyncSession.run_sync` like the queries do: iterate it with
+    `async for` while the session is open.
+    """
+
+    def __init__(self, db: AsyncSession, iterator: Iterator):
+        self.db = db
+        self.iterator = iterator
+
+    def __aiter__(self) -> "AsyncStream":
+        return self
+
+    async def __anext__(self):
+        item = await self.db.run_sync(lambda session: next(self.iterator, _END))
+        if item is _END:
+            raise StopAsyncIteration
+        return item
+
+
+class AsyncDAL:
+    """
+    Asyncio twin of a synchronous DAL.
+
+    Every public method of `dal_class` is exposed as a coroutine that runs the
+    synchronous method through `AsyncSession.run_sync`, so each query is written
+    once. Methods returning DTOs are safe to use from async code; methods
+    returning ORM objects (`*_raw`) must not have their lazy relationships
+    loaded outside of the session. Streaming methods, which return an iterator,
+    return an `AsyncStream` to iterate with `async for`.
+
+    An `AsyncSession` runs one operation at a time: concurrent reads need one
+    session each.
+    """
+    dal_class: type
+
+    def __init__(self, db: AsyncSession, **dal_kwargs):
+        self.db = db
+        self.dal_kwargs = dal_kwargs
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(self.dal_class, name, None)):
+            raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+        async def method(*args, **kwargs):
+            result = await self.db.run_sync(
+                lambda session: getattr(self.dal_class(session, **self.dal_kwargs), name)(*args, **kwargs)
+            )
+            # A generator would otherwise read its cursor outside of run_sync
+            return AsyncStream(self.db, result) if isinstance(result, Iterator) else result
+
+        method.__name__ = name
+        return method
+
+
+class AsyncClientDAL(AsyncDAL):
+    dal_class = ClientDAL
+
+
+class AsyncContractDAL(AsyncDAL):
+    dal_class = ContractDAL
+
+
+class AsyncEventDAL(AsyncDAL):
+    dal_class = EventDAL
+
+
+class AsyncCollaboratorDAL(AsyncDAL):
+    dal_class = CollaboratorDAL
+
+
+class AsyncRoleDAL(AsyncDAL):
+    dal_class = RoleDAL
@@ -1,11 +1,54 @@
+from typing import Iterator
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from models.client import Client
 from dtos.client_dto import ClientDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from monitoring.tracing import traced_methods
 
+# Columns selected in projection mode, in the order of the ClientDTO fields
+CLIENT_COLUMNS = (
+    Client.id,
+    Client.name,
+    Client.email,
+    Client.phone,
+    Client.company,
+    Client.creation_date,
+    Client.last_contact_date,
+    Client.commercial_id,
+)
 
+
+@traced_methods("db.dal")
 class ClientDAL:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, projection: bool = False):
         self.db = db
+        self.projection = projection
+
+    def _query(self, options: tuple = ()):
+        """
+        Builds the base query of the read methods, applying the optional loader
+        options (`joinedload`, `selectinload`, ...) given by the caller.
+        """
+        query = self.db.query(Client)
+        return query.options(*options) if options else query
+
+    def _read_query(self, options: tuple = ()):
+        """
+        Builds the query of the read-only methods along with the function turning
+        its rows into DTOs.
+
+        In projection mode, only the DTO columns are selected and each row tuple
+        is turned straight into a `ClientDTO`, skipping the hydration of `Client`
+        entities. Full entities are loaded when loader options are given.
+        """
+        if self.projection and not options:
+            return self.db.query(*CLIENT_COLUMNS), self._row_to_dto
+        return self._query(options), self._to_dto
+
+    def _row_to_dto(self, row) -> ClientDTO:
+        return ClientDTO(*row)
 
     def _to_dto(self, client: Client) -> ClientDTO:
         """
@@ -32,22 +75,25 @@ class ClientDAL:
             commercial_id=client.commercial_id,
         )
 
-    def get(self, client_id: int) -> ClientDTO | None:
+    def get(self, client_id: int, options: tuple = ()) -> ClientDTO | None:
         """
         Fetches a client record from the database by its identifier and converts it into
         a Data Transfer Object (DTO). Returns None if no matching client is found.
 
         :param client_id: The unique identifier of the client to retrieve.
         :type client_id: int
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: A ClientDTO object representing the client record if found, otherwise None.
         :rtype: ClientDTO | None
         """
-        client = self.db.query(Client).filter_by(id=client_id).first()
+        query, to_dto = self._read_query(options)
+        client = query.filter_by(id=client_id).first()
         if not client:
             return None
-        return self._to_dto(client)
+        return to_dto(client)
 
-    def get_all(self) -> list[ClientDTO]:
+    def get_all(self, options: tuple = ()) -> list[ClientDTO]:
         """
         Retrieves and returns all clients from the database as a list of ClientDTO objects.
 
@@ -57,11 +103,33 @@ class ClientDAL:
         the DTO (Data Transfer Object) representation. Clients not matching the DTO
         transformation logic are not included in the result.
 
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: A list of ClientDTO objects representing the clients in the database.
         :rtype: list[ClientDTO]
         """
-        clients = self.db.query(Client).all()
-        return [self._to_dto(client) for client in clients]
+        query, to_dto = self._read_query(options)
+        return [to_dto(client) for client in query.all()]
+
+    def get_page(self, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE,
+                 options: tuple = ()) -> PageDTO[ClientDTO]:
+        """
+        Retrieves one page of clients ordered by id, starting after the given cursor.
+
+        Unlike `get_all`, only `limit` rows are loaded, so memory usage and query
+        time stay constant whatever the size of the table.
+
+        :param after: Id of the last client of the previous page, or None for the first page.
+        :type after: int | None
+        :param limit: Maximum number of clients to return.
+        :type limit: int
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
+        :return: A page of `ClientDTO` objects and the cursor of the next page.
+        :rtype: PageDTO[ClientDTO]
+        """
+        query, to_dto = self._read_query(options)
+        return keyset_page(query, Client.id, to_dto, after=after, limit=limit)
 
     def create(self, data: dict) -> ClientDTO:
         """
@@ -69,8 +137,9 @@ class ClientDAL:
         representation.
 
         This method instantiates a Client object from the provided data dictionary, adds the
-        client record to the database, commits the transaction, refreshes the state, and
-        converts it to a DTO before returning it.
+        client record to the session, flushes it to the database, refreshes the state, and
+        converts it to a DTO before returning it. The transaction is committed by the
+        caller's unit of work.
 
         :param data: Dictionary containing client data to be stored in the database.
         :type data: dict
@@ -79,18 +148,62 @@ class ClientDAL:
         """
         client = Client(**data)
         self.db.add(client)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(client)
         return self._to_dto(client)
 
-    def get_by_email(self, email: str) -> ClientDTO | None:
-        client = self.db.query(Client).filter_by(email=email).first()
-        return self._to_dto(client) if client else None
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """
+        Inserts many clients with a single executemany statement.
+
+        No ORM object is created: the rows are sent as parameter sets, which the
+        driver batches into multi-row INSERT statements. The transaction is
+        committed by the caller's unit of work.
+
+        :param rows: The column values of each client.
+        :type rows: list[dict]
+        :return: The number of inserted clients.
+        :rtype: int
+        """
+        if rows:
+            self.db.execute(insert(Client), rows)
+        return len(rows)
+
+    def get_by_ids(self, client_ids, options: tuple = ()) -> list[ClientDTO]:
+        """
+        Retrieves the clients matching a set of identifiers in a single query.
+
+        :param client_ids: The identifiers to look up.
+        :type client_ids: Iterable[int]
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
+        :return: The clients found, ordered by id. Unknown ids are skipped.
+        :rtype: list[ClientDTO]
+        """
+        query, to_dto = self._read_query(options)
+        return [to_dto(c) for c in query.filter(Client.id.in_(set(client_ids))).order_by(Client.id).all()]
+
+    def get_existing_emails(self, emails) -> set[str]:
+        """
+        Returns which of the given emails are already used by a client, in a
+        single query.
+
+        :param emails: The emails to check.
+        :type emails: Iterable[str]
+        :return: The emails already present in the database.
+        :rtype: set[str]
+        """
+        return {email for email, in self.db.query(Client.email).filter(Client.email.in_(set(emails)))}
+
+    def get_by_email(self, email: str, options: tuple = ()) -> ClientDTO | None:
+        query, to_dto = self._read_query(options)
+        client = query.filter_by(email=email).first()
+        return to_dto(client) if client else None
 
     def update(self, client: Client, updates: dict) -> ClientDTO:
         for key, value in updates.items():
             setattr(client, key, value)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(client)
         return self._to_dto(client)
 
@@ -100,7 +213,41 @@ class ClientDAL:
             return None
         return self.update(client, updates)
 
-    def get_raw(self, client_id: int) -> Client | None:
+    def update_many(self, client_ids, updates: dict) -> int:
+        """
+        Applies the same updates to many clients with a single UPDATE statement.
+
+        :param client_ids: The identifiers of the clients to update.
+        :type client_ids: Iterable[int]
+        :param updates: The column values to set.
+        :type updates: dict
+        :return: The number of updated clients. Unknown ids are skipped.
+        :rtype: int
+        """
+        client_ids = set(client_ids)
+        if not client_ids:
+            return 0
+        return self.update_where(Client.id.in_(client_ids), updates)
+
+    def update_where(self, predicate, updates: dict) -> int:
+        """
+        Applies the same updates to every client matching a SQL predicate.
+
+        The matching clients are not loaded: the statement runs in the database,
+        and the clients already held by the session are synchronized in memory.
+        The transaction is committed by the caller's unit of work.
+
+        :param predicate: The SQL expression selecting the clients.
+        :param updates: The column values to set.
+        :type updates: dict
+        :return: The number of updated clients.
+        :rtype: int
+        """
+        if not updates:
+            return 0
+        return self.db.execute(update(Client).where(predicate).values(**updates)).rowcount
+
+    def get_raw(self, client_id: int, options: tuple = ()) -> Client | None:
         """
         Retrieve raw client data by client ID.
 
@@ -110,7 +257,25 @@ class ClientDAL:
 
         :param client_id: Unique identifier for the client.
         :type client_id: int
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: The client object if found, otherwise None.
         :rtype: Client | None
         """
-        return self.db.query(Client).filter_by(id=client_id).first()
+        return self._query(options).filter_by(id=client_id).first()
+
+    def stream(self, chunk_size: int = 1000) -> Iterator[ClientDTO]:
+        """
+        Streams all clients, ordered by id.
+
+        Rows are fetched through a server-side cursor, `chunk_size` at a time,
+        and converted to DTOs one by one, so memory use does not grow with the
+        size of the table. The session must stay open while iterating.
+
+        :param chunk_size: Number of rows fetched per round trip.
+        :type chunk_size: int
+        :return: An iterator of `ClientDTO` objects.
+        :rtype: Iterator[ClientDTO]
+        """
+        query = self.db.query(*CLIENT_COLUMNS).order_by(Client.id).yield_per(chunk_size)
+        return (self._row_to_dto(row) for row in query)
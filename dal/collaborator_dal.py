@@ -1,12 +1,29 @@
+from sqlalchemy import exists, insert, update
 from sqlalchemy.orm import Session
 from models.collaborator import Collaborator
+from models.event import Event
+from models.role import Role
+from dal.event_dal import overlapping
 from dtos.collaborator_dto import CollaboratorDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from monitoring.tracing import traced_methods
 
 
+@traced_methods("db.dal")
 class CollaboratorDAL:
     def __init__(self, db: Session):
         self.db = db
 
+    def _query(self, options: tuple = ()):
+        """
+        Builds the base query of the read methods, applying the optional loader
+        options (`joinedload`, `selectinload`, ...) given by the caller. The role
+        of each collaborator is always joined by the model loading policy.
+        """
+        query = self.db.query(Collaborator)
+        return query.options(*options) if options else query
+
     def _to_dto(self, collaborator: Collaborator) -> CollaboratorDTO:
         return CollaboratorDTO(
             id=collaborator.id,
@@ -15,7 +32,7 @@ class CollaboratorDAL:
             role_name=collaborator.role.name
         )
 
-    def get_by_id(self, collaborator_id: int) -> CollaboratorDTO | None:
+    def get_by_id(self, collaborator_id: int, options: tuple = ()) -> CollaboratorDTO | None:
         """
         Fetches a collaborator by their unique identifier.
 
@@ -26,14 +43,16 @@ class CollaboratorDAL:
 
         :param collaborator_id: The unique identifier of the collaborator to fetch.
         :type collaborator_id: int
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: A data transfer object representing the collaborator if found,
             otherwise None.
         :rtype: CollaboratorDTO | None
         """
-        collaborator = self.db.query(Collaborator).filter_by(id=collaborator_id).first()
+        collaborator = self._query(options).filter_by(id=collaborator_id).first()
         return self._to_dto(collaborator) if collaborator else None
 
-    def get_by_email(self, email: str) -> CollaboratorDTO | None:
+    def get_by_email(self, email: str, options: tuple = ()) -> CollaboratorDTO | None:
         """
         Retrieve a collaborator by their email address.
 
@@ -44,13 +63,15 @@ class CollaboratorDAL:
 
         :param email: The email address of the collaborator to retrieve.
         :type email: str
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: A CollaboratorDTO instance if a collaborator is found, otherwise None.
         :rtype: CollaboratorDTO | None
         """
-        collaborator = self.db.query(Collaborator).filter_by(email=email).first()
+        collaborator = self._query(options).filter_by(email=email).first()
         return self._to_dto(collaborator) if collaborator else None
 
-    def get_by_email_raw(self, email: str) -> Collaborator | None:
+    def get_by_email_raw(self, email: str, options: tuple = ()) -> Collaborator | None:
         """
         Fetch a collaborator from the database by their email address.
 
@@ -60,12 +81,14 @@ class CollaboratorDAL:
 
         :param email: The email address of the collaborator to be retrieved.
         :type email: str
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: A `Collaborator` object if a match is found, otherwise `None`.
         :rtype: Collaborator | None
         """
-        return self.db.query(Collaborator).filter_by(email=email).first()
+        return self._query(options).filter_by(email=email).first()
 
-    def get_all(self) -> list[CollaboratorDTO]:
+    def get_all(self, options: tuple = ()) -> list[CollaboratorDTO]:
         """
         Retrieves all collaborators from the database and transforms them
         into a list of CollaboratorDTO instances.
@@ -74,20 +97,123 @@ class CollaboratorDAL:
         model class, maps each one into a `CollaboratorDTO`, and returns the
         list of these DTO objects.
 
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
         :return: A list of `CollaboratorDTO` objects representing all
             collaborators in the database.
         :rtype: list[CollaboratorDTO]
         """
-        collaborators = self.db.query(Collaborator).all()
+        collaborators = self._query(options).all()
         return [self._to_dto(c) for c in collaborators]
 
+    def get_page(self, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE,
+                 options: tuple = ()) -> PageDTO[CollaboratorDTO]:
+        """
+        Retrieves one page of collaborators ordered by id, starting after the given cursor.
+
+        Unlike `get_all`, only `limit` rows are loaded, so memory usage and query
+        time stay constant whatever the size of the table.
+
+        :param after: Id of the last collaborator of the previous page, or None for the first page.
+        :type after: int | None
+        :param limit: Maximum number of collaborators to return.
+        :type limit: int
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
+        :return: A page of `CollaboratorDTO` objects and the cursor of the next page.
+        :rtype: PageDTO[CollaboratorDTO]
+        """
+        return keyset_page(self._query(options), Collaborator.id, self._to_dto, after=after, limit=limit)
+
+    def get_role_name(self, collaborator_id: int) -> str | None:
+        """
+        Returns the role name of a collaborator with a single indexed query,
+        without loading the collaborator.
+
+        :param collaborator_id: The identifier of the collaborator.
+        :type collaborator_id: int
+        :return: The role name, or None if no collaborator has this identifier.
+        :rtype: str | None
+        """
+        return (self.db.query(Role.name).join(Collaborator, Collaborator.role_id == Role.id)
+                .filter(Collaborator.id == collaborator_id).scalar())
+
+    def get_existing_ids(self, collaborator_ids) -> set[int]:
+        """
+        Returns which of the given identifiers belong to a collaborator, in a
+        single query.
+
+        :param collaborator_ids: The identifiers to check.
+        :type collaborator_ids: Iterable[int]
+        :return: The identifiers present in the database.
+        :rtype: set[int]
+        """
+        return {collaborator_id for collaborator_id, in
+                self.db.query(Collaborator.id).filter(Collaborator.id.in_(set(collaborator_ids)))}
+
+    def get_by_role(self, role_name: str, options: tuple = ()) -> list[CollaboratorDTO]:
+        """
+        Retrieves the collaborators of a role, ordered by id.
+
+        :param role_name: The name of the role, e.g. "support".
+        :type role_name: str
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
+        :return: The collaborators of the role.
+        :rtype: list[CollaboratorDTO]
+        """
+        query = (self._query(options).join(Role, Collaborator.role_id == Role.id)
+                 .filter(Role.name == role_name).order_by(Collaborator.id))
+        return [self._to_dto(c) for c in query.all()]
+
+    def get_available(self, role_name: str, start, end, options: tuple = ()) -> list[CollaboratorDTO]:
+        """
+        Retrieves the collaborators of a role without any event overlapping the
+        period `[start, end)`, in a single query.
+
+        On PostgreSQL, the overlap test can use the GiST index
+        `ix_events_support_period` to find the events of the period, which are
+        then matched against each collaborator; the index does not cover
+        `support_id`.
+
+        :param role_name: The role of the collaborators, e.g. "support".
+        :type role_name: str
+        :param start: The start of the period.
+        :type start: datetime
+        :param end: The end of the period.
+        :type end: datetime
+        :param options: Optional loader options applied to the query.
+        :type options: tuple
+        :return: The available collaborators, ordered by id.
+        :rtype: list[CollaboratorDTO]
+        """
+        busy = exists().where(Event.support_id == Collaborator.id,
+                              overlapping(self.db.get_bind().dialect.name, start, end))
+        query = (self._query(options).join(Role, Collaborator.role_id == Role.id)
+                 .filter(Role.name == role_name, ~busy).order_by(Collaborator.id))
+        return [self._to_dto(c) for c in query.all()]
+
     def create(self, data: dict) -> CollaboratorDTO:
         collaborator = Collaborator(**data)
         self.db.add(collaborator)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(collaborator)
         return self._to_dto(collaborator)
 
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """
+        Inserts many collaborators with a single executemany statement. The
+        passwords must already be hashed.
+
+        :param rows: The column values of each collaborator.
+        :type rows: list[dict]
+        :return: The number of inserted collaborators.
+        :rtype: int
+        """
+        if rows:
+            self.db.execute(insert(Collaborator), rows)
+        return len(rows)
+
     def update_by_id(self, collaborator_id: int, updates: dict) -> CollaboratorDTO | None:
         """
         Updates a collaborator's details in the database by their unique identifier. If the collaborator
@@ -108,15 +234,47 @@ class CollaboratorDAL:
             return None
         for key, value in updates.items():
             setattr(collaborator, key, value)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(collaborator)
         return self._to_dto(collaborator)
 
+    def update_many(self, collaborator_ids, updates: dict) -> int:
+        """
+        Applies the same updates to many collaborators with a single UPDATE
+        statement, instead of loading and flushing each of them.
+
+        :param collaborator_ids: The identifiers of the collaborators to update.
+        :type collaborator_ids: Iterable[int]
+        :param updates: The column values to set.
+        :type updates: dict
+        :return: The number of updated collaborators. Unknown ids are skipped.
+        :rtype: int
+        """
+        collaborator_ids = set(collaborator_ids)
+        if not collaborator_ids:
+            return 0
+        return self.update_where(Collaborator.id.in_(collaborator_ids), updates)
+
+    def update_where(self, predicate, updates: dict) -> int:
+        """
+        Applies the same updates to every collaborator matching a SQL predicate.
+        The transaction is committed by the caller's unit of work.
+
+        :param predicate: The SQL expression selecting the collaborators.
+        :param updates: The column values to set.
+        :type updates: dict
+        :return: The number of updated collaborators.
+        :rtype: int
+        """
+        if not updates:
+            return 0
+        return self.db.execute(update(Collaborator).where(predicate).values(**updates)).rowcount
+
     def delete_by_id(self, collaborator_id: int) -> bool:
         """
         Deletes a collaborator record from the database using the specified collaborator ID. If the collaborator
         with the specified ID does not exist in the database, the operation will return False. Otherwise, it will
-        delete the record and commit the changes.
+        delete the record and flush the changes.
 
         :param collaborator_id: The ID of the collaborator to be deleted.
         :type collaborator_id: int
@@ -127,5 +285,5 @@ class CollaboratorDAL:
         if not collaborator:
             return False
         self.db.delete(collaborator)
-        self.db.commit()
+        self.db.flush()
         return True
@@ -1,11 +1,43 @@
+from typing import Iterator
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from models.contract import Contract
+from dtos.contract_batch import ContractBatch
 from dtos.contract_dto import ContractDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from monitoring.tracing import traced_methods
 
+# Columns selected in projection mode, in the order of the ContractDTO fields
+CONTRACT_COLUMNS = (
+    Contract.id,
+    Contract.total_amount,
+    Contract.amount_left,
+    Contract.creation_date,
+    Contract.status,
+    Contract.client_id,
+    Contract.commercial_id,
+)
 
+
+@traced_methods("db.dal")
 class ContractDAL:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, projection: bool = False):
         self.db = db
+        self.projection = projection
+
+    def _query(self, options: tuple = ()):
+        query = self.db.query(Contract)
+        return query.options(*options) if options else query
+
+    def _read_query(self, options: tuple = ()):
+        # Projection mode: select the DTO columns only and skip entity hydration
+        if self.projection and not options:
+            return self.db.query(*CONTRACT_COLUMNS), self._row_to_dto
+        return self._query(options), self._to_dto
+
+    def _row_to_dto(self, row) -> ContractDTO:
+        return ContractDTO(*row)
 
     def _to_dto(self, contract: Contract) -> ContractDTO:
         return ContractDTO(
@@ -18,26 +50,36 @@ class ContractDAL:
             commercial_id=contract.commercial_id
         )
 
-    def get(self, contract_id: int) -> ContractDTO | None:
-        contract = self.db.query(Contract).filter_by(id=contract_id).first()
+    def get(self, contract_id: int, options: tuple = ()) -> ContractDTO | None:
+        query, to_dto = self._read_query(options)
+        contract = query.filter_by(id=contract_id).first()
         if not contract:
             return None
-        return self._to_dto(contract)
+        return to_dto(contract)
 
     def create(self, data: dict) -> ContractDTO:
         contract = Contract(**data)
         self.db.add(contract)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(contract)
         return self._to_dto(contract)
 
+    def bulk_insert(self, rows: list[dict]) -> int:
+        if rows:
+            self.db.execute(insert(Contract), rows)
+        return len(rows)
+
+    def get_by_ids(self, contract_ids, options: tuple = ()) -> list[ContractDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(c) for c in query.filter(Contract.id.in_(set(contract_ids))).order_by(Contract.id).all()]
+
     def update(self, contract_id: int, updates: dict) -> ContractDTO:
         contract = self.db.query(Contract).filter_by(id=contract_id).first()
         if not contract:
             return None
         for key, value in updates.items():
             setattr(contract, key, value)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(contract)
         return self._to_dto(contract)
 
@@ -47,10 +89,67 @@ class ContractDAL:
             return None
         return self.update(contract_id, updates)
 
-    def filter_by_status(self, signed: bool = True) -> list[ContractDTO]:
-        contracts = self.db.query(Contract).filter_by(status=signed).all()
-        return [self._to_dto(c) for c in contracts]
+    def update_many(self, contract_ids, updates: dict) -> int:
+        contract_ids = set(contract_ids)
+        if not contract_ids:
+            return 0
+        return self.update_where(Contract.id.in_(contract_ids), updates)
+
+    def update_where(self, predicate, updates: dict) -> int:
+        # A single UPDATE statement, without loading the matching contracts
+        if not updates:
+            return 0
+        return self.db.execute(update(Contract).where(predicate).values(**updates)).rowcount
+
+    def filter_by_status(self, signed: bool = True, options: tuple = ()) -> list[ContractDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(c) for c in query.filter_by(status=signed).all()]
+
+    def find(self, *criteria, options: tuple = ()) -> list[ContractDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(c) for c in query.filter(*criteria).order_by(Contract.id).all()]
+
+    def filter_unpaid(self, options: tuple = ()) -> list[ContractDTO]:
+        return self.find(Contract.amount_left > 0, options=options)
+
+    def get_all(self, options: tuple = ()) -> list[ContractDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(c) for c in query.all()]
+
+    def get_page(self, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE,
+                 options: tuple = ()) -> PageDTO[ContractDTO]:
+        query, to_dto = self._read_query(options)
+        return keyset_page(query, Contract.id, to_dto, after=after, limit=limit)
+
+    def stream_batches(self, signed: bool | None = None, unpaid: bool = False,
+                       chunk_size: int = 1000) -> Iterator[ContractBatch]:
+        """
+        Streams the contracts, ordered by id, as columnar batches.
+
+        Rows are fetched through a server-side cursor, `chunk_size` at a time,
+        and appended straight to a `ContractBatch` without any per-row DTO. Only
+        one batch is held in memory at a time; the session must stay open while
+        iterating.
 
-    def get_all(self) -> list[ContractDTO]:
-        contracts = self.db.query(Contract).all()
-        return [self._to_dto(c) for c in contracts]
+        :param signed: Only the signed (True) or unsigned (False) contracts.
+        :type signed: bool | None
+        :param unpaid: Only the contracts with an amount left to pay.
+        :type unpaid: bool
+        :param chunk_size: Number of rows fetched per round trip, and per batch.
+        :type chunk_size: int
+        :return: An iterator of `ContractBatch` objects of up to `chunk_size` rows.
+        :rtype: Iterator[ContractBatch]
+        """
+        query = self.db.query(*CONTRACT_COLUMNS)
+        if signed is not None:
+            query = query.filter(Contract.status.is_(signed))
+        if unpaid:
+            query = query.filter(Contract.amount_left > 0)
+        batch = ContractBatch()
+        for row in query.order_by(Contract.id).yield_per(chunk_size):
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield batch
+                batch = ContractBatch()
+        if len(batch):
+            yield batch
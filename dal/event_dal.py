@@ -1,11 +1,56 @@
+from typing import Iterator
+from sqlalchemy import and_, false, func, insert, update
 from sqlalchemy.orm import Session
 from models.event import Event
 from dtos.event_dto import EventDTO
+from dtos.page_dto import PageDTO
+from dal.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from monitoring.tracing import traced_methods
 
+# Columns selected in projection mode, in the order of the EventDTO fields
+EVENT_COLUMNS = (
+    Event.id,
+    Event.start_date,
+    Event.end_date,
+    Event.location,
+    Event.attendees,
+    Event.note,
+    Event.contract_id,
+    Event.support_id,
+)
 
+
+def overlapping(dialect_name: str, start, end):
+    # Events overlapping [start, end); on PostgreSQL the range operator uses ix_events_support_period,
+    # whose expression is repeated here for the planner to match it. Like an empty tsrange, an event
+    # or a slot whose end equals its start covers no time and overlaps nothing (see IntervalIndex)
+    if not start < end:
+        return false()
+    if dialect_name == "postgresql":
+        period = func.tsrange(func.least(Event.start_date, Event.end_date),
+                              func.greatest(Event.start_date, Event.end_date))
+        return period.op("&&")(func.tsrange(start, end))
+    return and_(Event.start_date < end, Event.end_date > start, Event.start_date < Event.end_date)
+
+
+@traced_methods("db.dal")
 class EventDAL:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, projection: bool = False):
         self.db = db
+        self.projection = projection
+
+    def _query(self, options: tuple = ()):
+        query = self.db.query(Event)
+        return query.options(*options) if options else query
+
+    def _read_query(self, options: tuple = ()):
+        # Projection mode: select the DTO columns only and skip entity hydration
+        if self.projection and not options:
+            return self.db.query(*EVENT_COLUMNS), self._row_to_dto
+        return self._query(options), self._to_dto
+
+    def _row_to_dto(self, row) -> EventDTO:
+        return EventDTO(*row)
 
     def _to_dto(self, event: Event) -> EventDTO:
         return EventDTO(
@@ -19,23 +64,39 @@ class EventDAL:
             support_id=event.support_id
         )
 
-    def get(self, event_id: int) -> EventDTO | None:
-        event = self.db.query(Event).filter_by(id=event_id).first()
+    def get(self, event_id: int, options: tuple = ()) -> EventDTO | None:
+        query, to_dto = self._read_query(options)
+        event = query.filter_by(id=event_id).first()
         if not event:
             return None
-        return self._to_dto(event)
+        return to_dto(event)
 
     def create(self, data: dict) -> EventDTO:
         event = Event(**data)
         self.db.add(event)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(event)
         return self._to_dto(event)
 
+    def bulk_insert(self, rows: list[dict]) -> int:
+        if rows:
+            self.db.execute(insert(Event), rows)
+        return len(rows)
+
+    def bulk_update(self, rows: list[dict]) -> int:
+        # Bulk UPDATE by primary key: a single executemany, each row holding the id and the new values
+        if rows:
+            self.db.execute(update(Event), rows)
+        return len(rows)
+
+    def get_by_ids(self, event_ids, options: tuple = ()) -> list[EventDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(e) for e in query.filter(Event.id.in_(set(event_ids))).order_by(Event.id).all()]
+
     def update(self, event: Event, updates: dict) -> EventDTO:
         for key, value in updates.items():
             setattr(event, key, value)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(event)
         return self._to_dto(event)
 
@@ -45,14 +106,65 @@ class EventDAL:
             return None
         return self.update(event, updates)
 
-    def get_all(self) -> list[EventDTO]:
-        events = self.db.query(Event).all()
-        return [self._to_dto(e) for e in events]
+    def update_many(self, event_ids, updates: dict) -> int:
+        event_ids = set(event_ids)
+        if not event_ids:
+            return 0
+        return self.update_where(Event.id.in_(event_ids), updates)
+
+    def update_where(self, predicate, updates: dict) -> int:
+        # A single UPDATE statement, without loading the matching events
+        if not updates:
+            return 0
+        return self.db.execute(update(Event).where(predicate).values(**updates)).rowcount
+
+    def get_all(self, options: tuple = ()) -> list[EventDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(e) for e in query.all()]
+
+    def get_page(self, after: int | None = None, limit: int = DEFAULT_PAGE_SIZE,
+                 options: tuple = ()) -> PageDTO[EventDTO]:
+        query, to_dto = self._read_query(options)
+        return keyset_page(query, Event.id, to_dto, after=after, limit=limit)
+
+    def get_without_support(self, options: tuple = ()) -> list[EventDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(e) for e in query.filter_by(support_id=None).all()]
+
+    def get_by_support_id(self, support_id: int, options: tuple = ()) -> list[EventDTO]:
+        query, to_dto = self._read_query(options)
+        return [to_dto(e) for e in query.filter_by(support_id=support_id).all()]
+
+    def get_for_supports(self, support_ids, start, end, options: tuple = ()) -> list[EventDTO]:
+        query, to_dto = self._read_query(options)
+        query = query.filter(Event.support_id.in_(set(support_ids)),
+                             overlapping(self.db.get_bind().dialect.name, start, end))
+        return [to_dto(e) for e in query.all()]
+
+    def find_overlapping(self, support_id: int, start, end, exclude_event_id: int | None = None) -> list[int]:
+        """
+        Returns the ids of the events of a support overlapping `[start, end)`,
+        by start date, with one indexed query.
 
-    def get_without_support(self) -> list[EventDTO]:
-        events = self.db.query(Event).filter_by(support_id=None).all()
-        return [self._to_dto(e) for e in events]
+        :param support_id: The support collaborator whose schedule is checked.
+        :type support_id: int
+        :param start: The start of the slot.
+        :param end: The end of the slot, excluded.
+        :param exclude_event_id: An event to leave out, e.g. the one being moved.
+        :type exclude_event_id: int | None
+        :return: The ids of the overlapping events.
+        :rtype: list[int]
+        """
+        query = self.db.query(Event.id).filter(Event.support_id == support_id,
+                                               overlapping(self.db.get_bind().dialect.name, start, end))
+        if exclude_event_id is not None:
+            query = query.filter(Event.id != exclude_event_id)
+        return [event_id for event_id, in query.order_by(Event.start_date, Event.id)]
 
-    def get_by_support_id(self, support_id: int) -> list[EventDTO]:
-        events = self.db.query(Event).filter_by(support_id=support_id).all()
-        return [self._to_dto(e) for e in events]
+    def stream(self, without_support: bool = False, chunk_size: int = 1000) -> Iterator[EventDTO]:
+        query = self.db.query(*EVENT_COLUMNS)
+        if without_support:
+            query = query.filter(Event.support_id.is_(None))
+        # Server-side cursor: rows are fetched chunk_size at a time and never all held in memory
+        query = query.order_by(Event.id).yield_per(chunk_size)
+        return (self._row_to_dto(row) for row in query)
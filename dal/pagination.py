@@ -0,0 +1,45 @@
+from typing import Callable, TypeVar
+
+from sqlalchemy.orm import Query
+
+from dtos.page_dto import PageDTO
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+def keyset_page(query: Query, id_column, to_dto: Callable[..., T],
+                after: int | None = None, limit: int = DEFAULT_PAGE_SIZE) -> PageDTO[T]:
+    """
+    Fetches one page of results from `query` using keyset (cursor) pagination.
+
+    Rows are ordered by `id_column` and only those whose id is strictly greater
+    than `after` are read, so the database can walk the primary key index
+    directly instead of scanning and discarding an OFFSET. One extra row is
+    requested to know whether another page exists without a COUNT query.
+
+    :param query: The base query selecting the rows to paginate.
+    :param id_column: The primary key column used as the cursor.
+    :param to_dto: Callable converting a row into its DTO.
+    :param after: Cursor returned by the previous page, or None for the first page.
+    :type after: int | None
+    :param limit: Maximum number of items in the page, capped to `MAX_PAGE_SIZE`.
+    :type limit: int
+    :return: A `PageDTO` holding the items and the cursor of the next page,
+        which is None when the last page has been reached.
+    :rtype: PageDTO
+    """
+    if limit < 1:
+        raise ValueError("La taille de page doit être supérieure à 0.")
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    if after is not None:
+        query = query.filter(id_column > after)
+    rows = query.order_by(id_column).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    items = [to_dto(row) for row in rows[:limit]]
+    next_cursor = items[-1].id if has_more else None
+    return PageDTO(items=items, next_cursor=next_cursor)
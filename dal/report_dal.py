@@ -0,0 +1,80 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+
+from dtos.report_dto import ContractSummaryDTO, InactiveClientsDTO, SupportMonthDTO
+from models.client import Client
+from models.collaborator import Collaborator
+from models.contract import Contract
+from models.event import Event
+from monitoring.tracing import traced_methods
+
+
+def month_of(dialect_name: str, column):
+    # "AAAA-MM" label of a date column, computed by the database
+    if dialect_name == "postgresql":
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+@traced_methods("db.dal")
+class ReportDAL:
+    """
+    Aggregate queries of the reports. Every figure is computed by the database
+    with `GROUP BY`, so only one row per group is read, whatever the number
+    of contracts, events or clients.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _contract_aggregates(self):
+        signed = func.count(case((Contract.status.is_(True), 1)))
+        return (
+            func.count(Contract.id),
+            signed,
+            func.count(Contract.id) - signed,
+            func.coalesce(func.sum(Contract.total_amount), 0),
+            func.coalesce(func.sum(Contract.amount_left), 0),
+        )
+
+    @staticmethod
+    def _summary(commercial_id, commercial_name, contracts, signed, unsigned, total_amount, amount_left):
+        return ContractSummaryDTO(commercial_id=commercial_id, commercial_name=commercial_name,
+                                  contracts=contracts, signed=signed, unsigned=unsigned,
+                                  total_amount=Decimal(total_amount), amount_left=Decimal(amount_left))
+
+    def contracts_by_commercial(self) -> list[ContractSummaryDTO]:
+        query = (self.db.query(Contract.commercial_id, Collaborator.name, *self._contract_aggregates())
+                 .outerjoin(Collaborator, Contract.commercial_id == Collaborator.id)
+                 .group_by(Contract.commercial_id, Collaborator.name)
+                 .order_by(Contract.commercial_id.nulls_last()))
+        return [self._summary(*row) for row in query.all()]
+
+    def contract_totals(self) -> ContractSummaryDTO:
+        return self._summary(None, None, *self.db.query(*self._contract_aggregates()).one())
+
+    def events_by_support_month(self, start: datetime | None = None,
+                                end: datetime | None = None) -> list[SupportMonthDTO]:
+        month = month_of(self.db.get_bind().dialect.name, Event.start_date)
+        query = (self.db.query(Event.support_id, Collaborator.name, month, func.count(Event.id))
+                 .outerjoin(Collaborator, Event.support_id == Collaborator.id)
+                 .filter(Event.start_date.isnot(None)))
+        if start is not None:
+            query = query.filter(Event.start_date >= start)
+        if end is not None:
+            query = query.filter(Event.start_date < end)
+        query = (query.group_by(Event.support_id, Collaborator.name, month)
+                 .order_by(Event.support_id.nulls_last(), month))
+        return [SupportMonthDTO(*row) for row in query.all()]
+
+    def inactive_clients_by_commercial(self, contacted_before: date) -> list[InactiveClientsDTO]:
+        query = (self.db.query(Client.commercial_id, Collaborator.name, func.count(Client.id),
+                               func.count(case((Client.last_contact_date.is_(None), 1))))
+                 .outerjoin(Collaborator, Client.commercial_id == Collaborator.id)
+                 .filter(or_(Client.last_contact_date.is_(None), Client.last_contact_date < contacted_before))
+                 .group_by(Client.commercial_id, Collaborator.name)
+                 .order_by(Client.commercial_id.nulls_last()))
+        return [InactiveClientsDTO(*row) for row in query.all()]
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 from models.role import Role
 from dtos.role_dto import RoleDTO
+from monitoring.tracing import traced_methods
 
 
+@traced_methods("db.dal")
 class RoleDAL:
     def __init__(self, db: Session):
         self.db = db
@@ -74,8 +76,8 @@ class RoleDAL:
     def create_role(self, name: str) -> RoleDTO:
         """
         Creates a new role with the specified name and persists it to the database. This
-        method initializes a `Role` object, adds it to the database session, commits the
-        transaction to save it, and refreshes the object instance. Finally, the role is
+        method initializes a `Role` object, adds it to the database session, flushes it
+        to the database, and refreshes the object instance. Finally, the role is
         converted into a Data Transfer Object (DTO) for return.
 
         :param name: The name of the role to be created.
@@ -87,6 +89,6 @@ class RoleDAL:
             raise ValueError("Le nom du rôle ne peut être vide.")
         role = Role(name=name)
         self.db.add(role)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(role)
         return self._to_dto(role)
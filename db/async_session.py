@@ -0,0 +1,108 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from db.session import DATABASE_URL, get_engine_settings
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+_async_sessionmaker: async_sessionmaker | None = None
+
+
+def to_async_url(url: str) -> str:
+    """
+    Returns the asyncio flavour of a database URL.
+
+    `postgresql://` URLs use asyncpg and `sqlite://` URLs use aiosqlite; a URL
+    already naming an async driver is returned unchanged.
+
+    :param url: The database URL.
+    :type url: str
+    :return: The URL with an asyncio driver.
+    :rtype: str
+    """
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver and url.get_driver_name() != driver:
+        url = url.set(drivername=f"{url.get_backend_name()}+{driver}")
+    return url.render_as_string(hide_password=False)
+
+
+def create_async_engine_from_settings(url: str = DATABASE_URL, **overrides) -> AsyncEngine:
+    """
+    Creates an asyncio engine configured like the synchronous one.
+
+    The pool settings come from `get_engine_settings`. The psycopg2 executemany
+    mode does not apply, and the statement timeout is passed as an asyncpg
+    server setting.
+
+    :param url: The database URL, converted with `to_async_url`.
+    :type url: str
+    :param overrides: Settings taking precedence over the environment.
+    :return: The configured engine.
+    :rtype: AsyncEngine
+    """
+    settings = {**get_engine_settings(), **overrides}
+    url = make_url(to_async_url(url))
+
+    kwargs = {
+        "pool_pre_ping": settings["pool_pre_ping"],
+        "insertmanyvalues_page_size": settings["insertmanyvalues_page_size"],
+    }
+    if url.get_backend_name() != "sqlite":
+        kwargs.update(
+            pool_size=settings["pool_size"],
+            max_overflow=settings["max_overflow"],
+            pool_timeout=settings["pool_timeout"],
+            pool_recycle=settings["pool_recycle"],
+        )
+    if url.get_backend_name() == "postgresql" and settings["statement_timeout_ms"]:
+        kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(settings["statement_timeout_ms"])}}
+
+    return create_async_engine(url, **kwargs)
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Returns the asyncio session factory of the application.
+
+    The engine is created on first use, so that the synchronous CLI never needs
+    the asyncio driver.
+
+    :return: The session factory bound to the asyncio engine.
+    :rtype: async_sessionmaker
+    """
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(create_async_engine_from_settings(), autoflush=False,
+                                                 expire_on_commit=False)
+    return _async_sessionmaker
+
+
+@asynccontextmanager
+async def async_unit_of_work(session_factory: async_sessionmaker | None = None) -> AsyncIterator[AsyncSession]:
+    """
+    Asyncio counterpart of `unit_of_work`.
+
+    The transaction is committed when the block exits normally, and rolled back
+    when it raises or when a failed flush left it unusable. The session is
+    always closed.
+
+    :param session_factory: The session factory, `get_async_sessionmaker()` by default.
+    :type session_factory: async_sessionmaker | None
+    :return: The session to hand to the async DAL.
+    :rtype: AsyncIterator[AsyncSession]
+    """
+    session = (session_factory or get_async_sessionmaker())()
+    try:
+        yield session
+        if session.is_active:
+            await session.commit()
+        else:
+            await session.rollback()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
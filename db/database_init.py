@@ -1,3 +1,7 @@
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, DropIndex
+
 from db.session import engine
 from models import Base
 
@@ -7,5 +11,73 @@ def init_db():
     print("📦 Database initialized !")
 
 
+def _index_applies_to(index, dialect_name: str) -> bool:
+    # Indexes declared with `ddl_if(dialect=...)` only exist on those databases
+    ddl_if = getattr(index, "_ddl_if", None)
+    if ddl_if is None or ddl_if.dialect is None:
+        return True
+    dialects = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+    return dialect_name in dialects
+
+
+def _invalid_indexes(conn: Connection) -> set[str]:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which the planner never uses
+    if conn.dialect.name != "postgresql":
+        return set()
+    return set(conn.scalars(text(
+        "SELECT index_class.relname FROM pg_index"
+        " JOIN pg_class AS index_class ON index_class.oid = pg_index.indexrelid"
+        " JOIN pg_namespace ON pg_namespace.oid = index_class.relnamespace"
+        " WHERE NOT pg_index.indisvalid AND pg_namespace.nspname = current_schema()"
+    )))
+
+
+def create_missing_indexes(bind: Engine = engine) -> list[str]:
+    """
+    Creates the indexes declared on the models that are missing from the database.
+
+    Indexes restricted to another database with `ddl_if` are skipped, as they
+    are by `create_all`. Statements run in autocommit mode so that, on PostgreSQL, every index is
+    built with `CREATE INDEX CONCURRENTLY`: the table stays writable while the
+    index is being built. An index left INVALID by a build that failed is
+    dropped and built again. Tables that do not exist yet are skipped,
+    `init_db` creates them along with their indexes.
+
+    :param bind: The engine of the target database.
+    :type bind: Engine
+    :return: The names of the indexes that were created or rebuilt.
+    :rtype: list[str]
+    """
+    created = []
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        inspector = inspect(conn)
+        concurrently = conn.dialect.name == "postgresql"
+        invalid = _invalid_indexes(conn)
+
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            # The indexes are built from a copy of the table, so that the
+            # models shared with the rest of the application are left untouched
+            copies = None
+
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                if not _index_applies_to(index, conn.dialect.name):
+                    continue
+                if index.name in existing and index.name not in invalid:
+                    continue
+                if copies is None:
+                    copies = {copy.name: copy for copy in table.to_metadata(MetaData()).indexes}
+                copy = copies[index.name]
+                copy.dialect_options["postgresql"]["concurrently"] = concurrently
+                if index.name in invalid:
+                    conn.execute(DropIndex(copy, if_exists=True))
+                conn.execute(CreateIndex(copy, if_not_exists=True))
+                created.append(index.name)
+
+    return created
+
+
 if __name__ == "__main__":
     init_db()
@@ -0,0 +1,307 @@
+import csv
+import io
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Iterator
+
+from sqlalchemy import func, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from bl.interval_index import IntervalIndex
+from bl.support_scheduler import plan_assignments
+from dal.client_dal import ClientDAL
+from dal.collaborator_dal import CollaboratorDAL
+from dal.contract_dal import ContractDAL
+from dal.event_dal import EventDAL
+from dal.role_dal import RoleDAL
+from db.session import create_engine_from_settings, unit_of_work
+from models import Client, Collaborator, Contract, Event
+from security.password import hash_password
+
+ROLES = ("gestion", "commercial", "support")
+START_DATE = date(2024, 1, 1)
+SEED_DOMAIN = "seed.epicevents.fr"
+
+TABLES = {"clients": Client, "contracts": Contract, "events": Event}
+DALS = {"clients": ClientDAL, "contracts": ContractDAL, "events": EventDAL}
+
+
+@dataclass(frozen=True, slots=True)
+class SeedSpec:
+    """
+    Shape of a generated dataset.
+
+    The collaborators are spread evenly across the three roles, every
+    commercial gets the same number of clients and every client the same
+    number of contracts, all owned by the client's commercial. Only signed
+    contracts get an event, at most one as in the `Contract.event`
+    relationship, and events are only assigned to support collaborators,
+    never to one already busy on their slot.
+    """
+    collaborators: int = 30
+    clients_per_commercial: int = 20
+    contracts_per_client: int = 2
+    signed_ratio: float = 0.7
+    unpaid_ratio: float = 0.4
+    event_ratio: float = 0.8
+    unassigned_ratio: float = 0.3
+    seed: int = 42
+
+
+@dataclass(frozen=True, slots=True)
+class SeedPlan:
+    """
+    Everything a worker needs to generate its share of the dataset: the ids
+    of the rows are derived from the offsets, so that the shards never overlap
+    and the rows do not depend on the number of workers.
+    """
+    spec: SeedSpec
+    commercial_ids: tuple[int, ...]
+    support_ids: tuple[int, ...]
+    client_offset: int
+    contract_offset: int
+    event_offset: int
+
+
+def generate_shard(plan: SeedPlan, commercials: range, chunk_size: int = 10_000) -> Iterator[dict[str, list]]:
+    """
+    Generates the clients, contracts and events of a range of commercials.
+
+    Each commercial draws from its own random generator, seeded from the spec
+    seed and its position, so a commercial always gets the same rows whatever
+    the shard it belongs to.
+
+    :param plan: The plan computed by `seed_database`.
+    :type plan: SeedPlan
+    :param commercials: Positions of the commercials in `plan.commercial_ids`.
+    :type commercials: range
+    :param chunk_size: Approximate number of rows per chunk.
+    :type chunk_size: int
+    :return: Chunks of rows keyed by table name, parents always in the same
+        chunk as their children or in an earlier one. The events are generated
+        without support; the `(start, end, event_id)` of those to assign are
+        listed under "to_assign".
+    :rtype: Iterator[dict[str, list]]
+    """
+    spec = plan.spec
+    chunk = {table: [] for table in (*TABLES, "to_assign")}
+
+    for position in commercials:
+        rng = random.Random(f"{spec.seed}:{position}")
+        commercial_id = plan.commercial_ids[position]
+
+        for client_index in range(position * spec.clients_per_commercial,
+                                  (position + 1) * spec.clients_per_commercial):
+            client_id = plan.client_offset + client_index + 1
+            creation_date = START_DATE + timedelta(days=rng.randrange(365))
+            chunk["clients"].append({
+                "id": client_id, "name": f"Client {client_id}", "email": f"client{client_id}@{SEED_DOMAIN}",
+                "phone": f"01{rng.randrange(10 ** 8):08d}", "company": f"Société {client_id % 997}",
+                "creation_date": creation_date, "last_contact_date": None, "commercial_id": commercial_id,
+            })
+
+            for contract_index in range(client_index * spec.contracts_per_client,
+                                        (client_index + 1) * spec.contracts_per_client):
+                contract_id = plan.contract_offset + contract_index + 1
+                signed = rng.random() < spec.signed_ratio
+                total_amount = Decimal(rng.randrange(1_000, 50_000))
+                chunk["contracts"].append({
+                    "id": contract_id, "total_amount": total_amount,
+                    "amount_left": total_amount if rng.random() < spec.unpaid_ratio else Decimal(0),
+                    "creation_date": creation_date, "status": signed, "client_id": client_id,
+                    "commercial_id": commercial_id,
+                })
+
+                # The event id follows the contract id, so ids are stable but may have gaps
+                if signed and rng.random() < spec.event_ratio:
+                    start = datetime.combine(creation_date, datetime.min.time()) + timedelta(
+                        days=rng.randrange(30, 400), hours=rng.randrange(8, 14))
+                    event_id = plan.event_offset + contract_index + 1
+                    end = start + timedelta(hours=rng.randrange(2, 48))
+                    chunk["events"].append({
+                        "id": event_id, "start_date": start, "end_date": end,
+                        "location": f"Salle {rng.randrange(100)}", "attendees": rng.randrange(10, 500),
+                        "note": None, "contract_id": contract_id, "support_id": None,
+                    })
+                    if plan.support_ids and rng.random() >= spec.unassigned_ratio:
+                        chunk["to_assign"].append((start, end, event_id))
+
+            if sum(len(chunk[table]) for table in TABLES) >= chunk_size:
+                yield chunk
+                chunk = {table: [] for table in (*TABLES, "to_assign")}
+
+    if any(chunk.values()):
+        yield chunk
+
+
+def _copy_rows(db: Session, table_name: str, rows: list[dict]) -> None:
+    # COPY is the fastest bulk path of PostgreSQL; an empty unquoted CSV field is NULL
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["" if row[column] is None else row[column] for column in columns])
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
+def insert_chunk(db: Session, chunk: dict[str, list]) -> dict[str, int]:
+    """
+    Inserts one chunk of generated rows, parents first.
+
+    psycopg2 connections load the rows with COPY; other drivers go through the
+    DAL `bulk_insert` methods, which batch them with insertmanyvalues.
+
+    :return: The number of inserted rows of each table.
+    :rtype: dict[str, int]
+    """
+    copy = db.get_bind().dialect.driver == "psycopg2"
+    counts = {}
+    for table, dal_class in DALS.items():
+        rows = chunk.get(table, [])
+        if copy and rows:
+            _copy_rows(db, table, rows)
+            counts[table] = len(rows)
+        else:
+            counts[table] = dal_class(db).bulk_insert(rows)
+    return counts
+
+
+def _load_shard(bind: Engine | str, plan: SeedPlan, commercials: range,
+                chunk_size: int) -> tuple[dict[str, int], list[tuple]]:
+    # Worker processes receive the URL and open their own engine
+    engine = create_engine_from_settings(bind) if isinstance(bind, str) else bind
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    counts = dict.fromkeys(TABLES, 0)
+    to_assign = []
+    try:
+        for chunk in generate_shard(plan, commercials, chunk_size):
+            # One transaction per chunk keeps the transactions, and the server memory, small
+            with unit_of_work(session_factory) as db:
+                for table, count in insert_chunk(db, chunk).items():
+                    counts[table] += count
+            to_assign.extend(chunk["to_assign"])
+    finally:
+        if engine is not bind:
+            engine.dispose()
+    return counts, to_assign
+
+
+def _assign_supports(bind: Engine, support_ids: tuple[int, ...], events: list[tuple], chunk_size: int) -> None:
+    # The shards share the supports, so their events are planned together once loaded.
+    # The supports were just created: their schedules are empty.
+    plan = plan_assignments(events, {support_id: IntervalIndex() for support_id in support_ids},
+                            dict.fromkeys(support_ids, 0.0))
+    rows = [{"id": event_id, "support_id": support_id} for event_id, support_id in sorted(plan.items())]
+    session_factory = sessionmaker(bind=bind, autoflush=False)
+    for position in range(0, len(rows), chunk_size):
+        with unit_of_work(session_factory) as db:
+            EventDAL(db).bulk_update(rows[position:position + chunk_size])
+
+
+def _max_id(db: Session, model) -> int:
+    return db.query(func.max(model.id)).scalar() or 0
+
+
+def _reset_sequences(bind: Engine) -> None:
+    # Rows are inserted with explicit ids, which PostgreSQL sequences do not see
+    if bind.dialect.name != "postgresql":
+        return
+    with bind.begin() as conn:
+        for table in ("roles", "collaborators", *TABLES):
+            conn.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                              f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"))
+
+
+def _shards(count: int, workers: int) -> list[range]:
+    size, extra = divmod(count, workers)
+    shards, start = [], 0
+    for worker in range(workers):
+        end = start + size + (worker < extra)
+        if end > start:
+            shards.append(range(start, end))
+        start = end
+    return shards
+
+
+def seed_database(bind: Engine, spec: SeedSpec, workers: int = 1, chunk_size: int = 10_000,
+                  password: str = "password") -> dict:
+    """
+    Generates a consistent dataset and bulk-loads it next to the existing rows.
+
+    The roles are reused or created, then the collaborators are inserted in
+    one statement. The clients, contracts and events are generated per
+    commercial and loaded by `workers` processes, each committing its own
+    chunks. The supports are then assigned to the events by
+    `plan_assignments`, so that no support gets overlapping events: an event
+    no support is free for stays unassigned. The same spec always produces the same rows, whatever the number
+    of workers, as long as the database starts in the same state. Emails are
+    built from the row ids, which keeps them unique across runs.
+
+    Every collaborator gets the same password, hashed once: bcrypt would
+    otherwise dominate the load time.
+
+    :param bind: The engine of the target database.
+    :type bind: Engine
+    :param spec: The shape of the dataset.
+    :type spec: SeedSpec
+    :param workers: Number of loading processes; an in-memory SQLite database
+        only supports one.
+    :type workers: int
+    :param chunk_size: Approximate number of rows per transaction.
+    :type chunk_size: int
+    :param password: The plain text password of the collaborators.
+    :type password: str
+    :return: The number of rows inserted in each table, under "counts", and
+        the id of one collaborator of each role, under "users".
+    :rtype: dict
+    """
+    if spec.collaborators < len(ROLES):
+        raise ValueError("Il faut au moins un collaborateur par rôle.")
+    if workers > 1 and bind.url.get_backend_name() == "sqlite" and bind.url.database in (None, "", ":memory:"):
+        raise ValueError("Une base SQLite en mémoire ne peut être chargée que par un seul processus.")
+
+    hashed_password = hash_password(password)
+    with unit_of_work(sessionmaker(bind=bind, autoflush=False)) as db:
+        role_dal = RoleDAL(db)
+        role_ids = {name: (role_dal.get_by_name(name) or role_dal.create_role(name)).id for name in ROLES}
+
+        collaborator_offset = _max_id(db, Collaborator)
+        members = {name: [] for name in ROLES}
+        collaborators = []
+        for collaborator_id in range(collaborator_offset + 1, collaborator_offset + spec.collaborators + 1):
+            role = ROLES[(collaborator_id - collaborator_offset - 1) % len(ROLES)]
+            members[role].append(collaborator_id)
+            collaborators.append({"id": collaborator_id, "name": f"{role.capitalize()} {collaborator_id}",
+                                  "email": f"{role}{collaborator_id}@{SEED_DOMAIN}", "password": hashed_password,
+                                  "role_id": role_ids[role]})
+        CollaboratorDAL(db).bulk_insert(collaborators)
+
+        plan = SeedPlan(spec=spec, commercial_ids=tuple(members["commercial"]), support_ids=tuple(members["support"]),
+                        client_offset=_max_id(db, Client), contract_offset=_max_id(db, Contract),
+                        event_offset=_max_id(db, Event))
+
+    counts = {"collaborators": len(collaborators), **dict.fromkeys(TABLES, 0)}
+    shards = _shards(len(plan.commercial_ids), workers)
+    if workers > 1:
+        url = bind.url.render_as_string(hide_password=False)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_load_shard, [url] * len(shards), [plan] * len(shards), shards,
+                                        [chunk_size] * len(shards)))
+    else:
+        results = [_load_shard(bind, plan, shard, chunk_size) for shard in shards]
+    for result, _ in results:
+        for table, count in result.items():
+            counts[table] += count
+    _assign_supports(bind, plan.support_ids, [event for _, events in results for event in events], chunk_size)
+
+    _reset_sequences(bind)
+    return {"counts": counts, "users": {role: ids[0] for role, ids in members.items()}}
@@ -1,7 +1,139 @@
+import os
+from contextlib import contextmanager
+from typing import Iterator
+from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
 
-DATABASE_URL = "postgresql://ansi@localhost/epicevent"
+load_dotenv()
 
-engine = create_engine(DATABASE_URL)
+DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://ansi@localhost/epicevent")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_engine_settings() -> dict:
+    """
+    Reads the engine and connection pool settings from the environment.
+
+    Every setting has a default suited to the interactive CLI, and can be raised
+    through the environment (or the `.env` file) for concurrent batch jobs:
+
+    - `DB_POOL_SIZE`: connections kept open in the pool.
+    - `DB_MAX_OVERFLOW`: extra connections allowed above the pool size.
+    - `DB_POOL_TIMEOUT`: seconds to wait for a free connection.
+    - `DB_POOL_RECYCLE`: seconds after which a connection is replaced.
+    - `DB_POOL_PRE_PING`: checks that a connection is alive before using it.
+    - `DB_STATEMENT_TIMEOUT_MS`: PostgreSQL statement timeout, 0 to disable it.
+    - `DB_EXECUTEMANY_MODE`: psycopg2 executemany strategy.
+    - `DB_INSERTMANYVALUES_PAGE_SIZE`: rows per batched INSERT statement.
+
+    :return: The settings, keyed by name.
+    :rtype: dict
+    """
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+        "statement_timeout_ms": int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0)),
+        "executemany_mode": os.getenv("DB_EXECUTEMANY_MODE", "values_plus_batch"),
+        "insertmanyvalues_page_size": int(os.getenv("DB_INSERTMANYVALUES_PAGE_SIZE", 1000)),
+    }
+
+
+def create_engine_from_settings(url: str = DATABASE_URL, **overrides) -> Engine:
+    """
+    Creates the SQLAlchemy engine of the application from `get_engine_settings`.
+
+    Settings that do not apply to the database backend are left out: SQLite
+    keeps its own pool, and the statement timeout and executemany mode are only
+    passed to PostgreSQL and psycopg2.
+
+    :param url: The database URL.
+    :type url: str
+    :param overrides: Settings taking precedence over the environment.
+    :return: The configured engine.
+    :rtype: Engine
+    """
+    settings = {**get_engine_settings(), **overrides}
+    url = make_url(url)
+
+    kwargs = {
+        "pool_pre_ping": settings["pool_pre_ping"],
+        "insertmanyvalues_page_size": settings["insertmanyvalues_page_size"],
+    }
+    if url.get_backend_name() != "sqlite":
+        kwargs.update(
+            pool_size=settings["pool_size"],
+            max_overflow=settings["max_overflow"],
+            pool_timeout=settings["pool_timeout"],
+            pool_recycle=settings["pool_recycle"],
+        )
+    if url.get_backend_name() == "postgresql":
+        if settings["statement_timeout_ms"]:
+            kwargs["connect_args"] = {"options": f"-c statement_timeout={settings['statement_timeout_ms']}"}
+        if url.get_driver_name() == "psycopg2":
+            kwargs["executemany_mode"] = settings["executemany_mode"]
+
+    return create_engine(url, **kwargs)
+
+
+def get_pool_stats(bind: Engine | None = None) -> dict:
+    """
+    Returns the current state of the connection pool of an engine.
+
+    :param bind: The engine to inspect, the application engine by default.
+    :type bind: Engine | None
+    :return: The pool class, its status line and, when the pool supports them,
+        its size and the number of checked in, checked out and overflow connections.
+    :rtype: dict
+    """
+    pool = (bind or engine).pool
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
+
+engine = create_engine_from_settings()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@contextmanager
+def unit_of_work(session_factory: sessionmaker | None = None) -> Iterator[Session]:
+    """
+    Opens a session for the duration of one command and ends its transaction
+    exactly once.
+
+    The DAL only flushes its changes: they are committed when the block exits
+    normally, and rolled back when it raises or when a failed flush left the
+    transaction unusable. The session is always closed, so its connection goes
+    back to the pool as soon as the command is done.
+
+    :param session_factory: The session factory, `SessionLocal` by default.
+    :type session_factory: sessionmaker | None
+    :return: The session to hand to the BL.
+    :rtype: Iterator[Session]
+    """
+    session = (session_factory or SessionLocal)()
+    try:
+        yield session
+        if session.is_active:
+            session.commit()
+        else:
+            session.rollback()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -0,0 +1,8 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class AutoAssignmentDTO:
+    # Support id of each assigned event, keyed by event id
+    assignments: dict[int, int] = field(default_factory=dict)
+    unassigned: list[int] = field(default_factory=list)
@@ -3,7 +3,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClientDTO:
     id: int
     name: str
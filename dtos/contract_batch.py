@@ -0,0 +1,115 @@
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+from dtos.contract_dto import ContractDTO
+
+# Ids start at 1, so 0 stands for a NULL foreign key in the id columns
+NULL_ID = 0
+
+# Amounts are stored in cents at least, in finer units when an amount needs them
+MIN_AMOUNT_SCALE = 2
+
+
+class ContractBatch:
+    """
+    Columnar container for a large number of contracts.
+
+    Each field is stored in its own contiguous `array` instead of one
+    `ContractDTO` per row: ids as 64-bit integers, dates as ordinals and
+    statuses as bytes. Amounts are exact: they are stored as 64-bit integers
+    in units of `10 ** -amount_scale` (cents by default), and read back as
+    `Decimal`. A `ContractDTO` is only built when a row is accessed, so bulk
+    reads and exports keep a memory footprint close to the size of the raw
+    data.
+    """
+
+    __slots__ = ("ids", "total_amounts", "amounts_left", "amount_scale", "creation_dates", "statuses",
+                 "client_ids", "commercial_ids")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.total_amounts = array("q")
+        self.amounts_left = array("q")
+        self.amount_scale = MIN_AMOUNT_SCALE
+        self.creation_dates = array("l")
+        self.statuses = array("b")
+        self.client_ids = array("q")
+        self.commercial_ids = array("q")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> "ContractBatch":
+        """
+        Builds a batch from rows ordered like the `ContractDTO` fields, such as
+        the tuples of a projection query or `ContractDTO` objects.
+        """
+        batch = cls()
+        for row in rows:
+            batch.append(row)
+        return batch
+
+    def _rescale(self, scale: int) -> None:
+        factor = 10 ** (scale - self.amount_scale)
+        self.total_amounts = array("q", (amount * factor for amount in self.total_amounts))
+        self.amounts_left = array("q", (amount * factor for amount in self.amounts_left))
+        self.amount_scale = scale
+
+    def _units(self, amount) -> int:
+        # Floats go through their shortest repr, e.g. 500.5 -> Decimal("500.5")
+        amount = Decimal(str(amount)) if isinstance(amount, float) else Decimal(amount)
+        # Trailing zeros, such as those SQLite adds, do not require a finer scale
+        scale = -amount.normalize().as_tuple().exponent
+        if scale > self.amount_scale:
+            self._rescale(scale)
+        return int(amount.scaleb(self.amount_scale))
+
+    def append(self, row) -> None:
+        contract_id, total_amount, amount_left, creation_date, status, client_id, commercial_id = (
+            (row.id, row.total_amount, row.amount_left, row.creation_date, row.status,
+             row.client_id, row.commercial_id) if isinstance(row, ContractDTO) else row
+        )
+        total_amount, amount_left = self._units(total_amount), self._units(amount_left)
+        self.ids.append(contract_id)
+        self.total_amounts.append(total_amount)
+        self.amounts_left.append(amount_left)
+        self.creation_dates.append(creation_date.toordinal())
+        self.statuses.append(1 if status else 0)
+        self.client_ids.append(client_id or NULL_ID)
+        self.commercial_ids.append(commercial_id or NULL_ID)
+
+    def _amount(self, units: int) -> Decimal:
+        return Decimal(units).scaleb(-self.amount_scale)
+
+    def to_columns(self) -> dict[str, list]:
+        """
+        Returns the batch as one list of values per `ContractDTO` field, e.g.
+        to build a Parquet row group without any per-row DTO.
+        """
+        return {
+            "id": self.ids.tolist(),
+            "total_amount": [self._amount(units) for units in self.total_amounts],
+            "amount_left": [self._amount(units) for units in self.amounts_left],
+            "creation_date": [date.fromordinal(ordinal) for ordinal in self.creation_dates],
+            "status": [bool(status) for status in self.statuses],
+            "client_id": [client_id or None for client_id in self.client_ids],
+            "commercial_id": [commercial_id or None for commercial_id in self.commercial_ids],
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> ContractDTO:
+        return ContractDTO(
+            id=self.ids[index],
+            total_amount=self._amount(self.total_amounts[index]),
+            amount_left=self._amount(self.amounts_left[index]),
+            creation_date=date.fromordinal(self.creation_dates[index]),
+            status=bool(self.statuses[index]),
+            client_id=self.client_ids[index] or None,
+            commercial_id=self.commercial_ids[index] or None,
+        )
+
+    def __iter__(self) -> Iterator[ContractDTO]:
+        for index in range(len(self)):
+            yield self[index]
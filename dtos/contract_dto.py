@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from datetime import date
+from decimal import Decimal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContractDTO:
     id: int
-    total_amount: float
-    amount_left: float
+    total_amount: Decimal
+    amount_left: Decimal
     creation_date: date
     status: bool
     client_id: int
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRowDTO:
+    line: int
+    error: str
+    row: dict | None
+
+
+@dataclass(frozen=True, slots=True)
+class ImportResultDTO:
+    inserted: int
+    rejected: list[RejectedRowDTO] = field(default_factory=list)
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class PageDTO(Generic[T]):
+    items: list[T]
+    next_cursor: Optional[int]
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class ContractSummaryDTO:
+    # No commercial for the grand total, or for contracts without commercial
+    commercial_id: Optional[int]
+    commercial_name: Optional[str]
+    contracts: int
+    signed: int
+    unsigned: int
+    total_amount: Decimal
+    amount_left: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class SupportMonthDTO:
+    # No support for the events still to assign
+    support_id: Optional[int]
+    support_name: Optional[str]
+    month: str
+    events: int
+
+
+@dataclass(frozen=True, slots=True)
+class InactiveClientsDTO:
+    commercial_id: Optional[int]
+    commercial_name: Optional[str]
+    inactive: int
+    never_contacted: int
@@ -1,31 +1,46 @@
-import click
-from monitoring.sentry_logging import init_sentry
-from cli.auth_commands import auth_cli
-from cli.collaborator_commands import collaborator_cli
-from cli.contract_commands import contract_cli
-from cli.client_commands import client_cli
-from cli.init_command import init_cli
-from cli.event_commands import event_cli
-
-
-init_sentry()
+import sys
 
-
-@click.group()
-def cli():
+import click
+from cli.daemon_client import forward_to_daemon
+from cli.lazy_group import LazyGroup
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    "init": "cli.init_command:init_cli",
+    "auth": "cli.auth_commands:auth_cli",
+    "collaborator": "cli.collaborator_commands:collaborator_cli",
+    "client": "cli.client_commands:client_cli",
+    "contract": "cli.contract_commands:contract_cli",
+    "event": "cli.event_commands:event_cli",
+    "import": "cli.import_commands:import_cli",
+    "export": "cli.export_commands:export_cli",
+    "report": "cli.report_commands:report_cli",
+    "seed": "cli.seed_command:seed",
+    "serve": "cli.daemon:serve",
+})
+@click.option("--profile-sql", is_flag=True, help="Affiche les requêtes SQL de la commande et leur durée")
+@click.pass_context
+def cli(ctx, profile_sql):
     """
     CLI for Epic Events CRM
     """
-    pass
-
+    from monitoring.sentry_logging import init_sentry
+    from monitoring.sql_profiler import start_sql_profiling
+    from monitoring.tracing import command_transaction
+    init_sentry()
+    ctx.with_resource(command_transaction(ctx))
 
-cli.add_command(init_cli)
-cli.add_command(auth_cli)
-cli.add_command(collaborator_cli)
-cli.add_command(client_cli)
-cli.add_command(contract_cli)
-cli.add_command(event_cli)
+    profiler = start_sql_profiling(profile_sql)
+    if profiler:
+        def report():
+            profiler.detach()
+            if profile_sql:
+                click.echo(profiler.format_summary(), err=True)
+        ctx.call_on_close(report)
 
 
 if __name__ == "__main__":
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
     cli()
@@ -0,0 +1,8 @@
+from .base import Base
+from .role import Role
+from .collaborator import Collaborator
+from .client import Client
+from .contract import Contract
+from .event import Event
+
+__all__ = ["Base", "Role", "Collaborator", "Client", "Contract", "Event"]
@@ -14,7 +14,8 @@ class Client(Base):
     creation_date = Column(Date)
     last_contact_date = Column(Date)
 
-    commercial_id = Column(Integer, ForeignKey("collaborators.id"))
-    commercial = relationship("Collaborator", back_populates="clients")
+    commercial_id = Column(Integer, ForeignKey("collaborators.id"), index=True)
+    # Never lazy-loaded row by row: use joinedload/selectinload in the DAL when needed
+    commercial = relationship("Collaborator", back_populates="clients", lazy="raise_on_sql")
 
     contracts = relationship("Contract", back_populates="client")
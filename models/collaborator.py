@@ -10,8 +10,9 @@ class Collaborator(Base):
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
     password = Column(String, nullable=False)
-    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
-    role = relationship("Role", back_populates="collaborators")
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False, index=True)
+    # Needed by every CollaboratorDTO: loaded in the same SELECT as the collaborator
+    role = relationship("Role", back_populates="collaborators", lazy="joined")
 
     clients = relationship("Client", back_populates="commercial")  # 'commercial'
     contracts = relationship("Contract", back_populates="commercial")  # 'commercial'
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, Numeric, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, Date, Numeric, Boolean, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -12,9 +12,22 @@ class Contract(Base):
     creation_date = Column(Date, nullable=False)
     status = Column(Boolean, default=False)  # Signed or not
 
-    client_id = Column(Integer, ForeignKey("clients.id"))
-    commercial_id = Column(Integer, ForeignKey("collaborators.id"))
+    client_id = Column(Integer, ForeignKey("clients.id"), index=True)
+    commercial_id = Column(Integer, ForeignKey("collaborators.id"), index=True)
 
-    client = relationship("Client", back_populates="contracts")
+    # Never lazy-loaded row by row: use joinedload/selectinload in the DAL when needed
+    client = relationship("Client", back_populates="contracts", lazy="raise_on_sql")
     commercial = relationship("Collaborator", back_populates="contracts")
     event = relationship("Event", back_populates="contract", uselist=False)
+
+    __table_args__ = (
+        # Signed / unsigned listings, read in id order
+        Index("ix_contracts_status_id", status, id),
+        # Partial index: only contracts still waiting for a payment are indexed
+        Index(
+            "ix_contracts_unpaid",
+            amount_left,
+            postgresql_where=amount_left > 0,
+            sqlite_where=amount_left > 0
+        ),
+    )
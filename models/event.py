@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Index, CheckConstraint, func
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -13,8 +13,34 @@ class Event(Base):
     attendees = Column(Integer)
     note = Column(Text)
 
-    contract_id = Column(Integer, ForeignKey("contracts.id"))
+    contract_id = Column(Integer, ForeignKey("contracts.id"), index=True)
     contract = relationship("Contract", back_populates="event")
 
     support_id = Column(Integer, ForeignKey("collaborators.id"))
     support = relationship("Collaborator", back_populates="events")
+
+    __table_args__ = (
+        CheckConstraint(
+            "end_date >= start_date",
+            name="check_event_period"
+        ),
+        # Events of a support collaborator, in chronological order
+        Index("ix_events_support_id_start_date", support_id, start_date),
+        # Partial index: events still waiting for a support collaborator
+        Index(
+            "ix_events_without_support",
+            id,
+            postgresql_where=support_id.is_(None),
+            sqlite_where=support_id.is_(None)
+        ),
+        # Schedules of the support collaborators: overlap (&&) queries on the event periods.
+        # PostgreSQL only, other databases fall back to ix_events_support_id_start_date.
+        # The bounds are ordered because tsrange rejects an inverted period, which databases
+        # created before check_event_period may still hold.
+        Index(
+            "ix_events_support_period",
+            func.tsrange(func.least(start_date, end_date), func.greatest(start_date, end_date)),
+            postgresql_using="gist",
+            postgresql_where=support_id.isnot(None)
+        ).ddl_if(dialect="postgresql"),
+    )
@@ -2,6 +2,7 @@ import sentry_sdk
 from sentry_sdk.integrations.logging import LoggingIntegration
 import os
 from dotenv import load_dotenv
+from monitoring.tracing import enable_tracing
 
 load_dotenv()
 
@@ -11,16 +12,22 @@ sentry_logging = LoggingIntegration(
 )
 
 SENTRY_DSN = os.getenv("SENTRY_DSN")
+# Share of the commands sent to the Sentry performance view, 0.0 disables tracing
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", 0.0))
 
 
-def init_sentry():
-    if SENTRY_DSN:
-        sentry_sdk.init(
-            dsn=SENTRY_DSN,
-            integrations=[sentry_logging],
-            traces_sample_rate=0.0,  # Deactivated for CLI
-            send_default_pii=True
-        )
+def init_sentry(**options):
+    # The serve daemon runs the root group once per forwarded command.
+    if SENTRY_DSN and not sentry_sdk.is_initialized():
+        sentry_sdk.init(**{
+            "dsn": SENTRY_DSN,
+            "integrations": [sentry_logging],
+            "traces_sample_rate": SENTRY_TRACES_SAMPLE_RATE,
+            "send_default_pii": True,
+            **options,
+        })
+        # BL, DAL and password hashing spans are only created when transactions may be sampled
+        enable_tracing(bool(sentry_sdk.get_client().options.get("traces_sample_rate")))
 
 
 def log_sentry(message: str, user: dict | None = None, level: str = "info"):
@@ -0,0 +1,189 @@
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Statements slower than this are written to the slow-query log
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", 200))
+# JSON lines file of the slow queries, disabled when empty
+SQL_SLOW_QUERY_LOG = os.getenv("SQL_SLOW_QUERY_LOG", "")
+
+# Packages of the application, the DAL being the most precise caller
+APPLICATION_PACKAGES = ("dal", "bl", "cli", "security", "db", "benchmarks")
+
+_START_TIMES = "sql_profiler_start_times"
+
+
+@dataclass(frozen=True, slots=True)
+class QueryRecord:
+    """
+    One statement sent to the database.
+    """
+    statement: str
+    duration_ms: float
+    rows: int | None
+    caller: str
+
+
+def find_caller() -> str:
+    """
+    Names the application function that issued the current statement.
+
+    The call stack is walked up to the first DAL method; when the statement
+    does not come from the DAL, the first function of the application is used.
+
+    :return: The qualified name of the caller, "?" if none is found.
+    :rtype: str
+    """
+    frame = sys._getframe(1)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        package = module.split(".")[0]
+        if package == "dal":
+            return f"{module}.{frame.f_code.co_qualname}"
+        if fallback is None and package in APPLICATION_PACKAGES:
+            fallback = f"{module}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return fallback or "?"
+
+
+class SQLProfiler:
+    """
+    Times the statements of an engine through its cursor events.
+
+    Every statement is recorded when `record` is set, for the per-command
+    summary; statements over `slow_query_ms` are appended to `slow_query_log`
+    when one is configured. Only the statement text is logged, never its
+    parameters.
+    """
+
+    def __init__(self, record: bool = True, slow_query_ms: float = SQL_SLOW_QUERY_MS,
+                 slow_query_log: str | None = SQL_SLOW_QUERY_LOG or None):
+        self.record = record
+        self.slow_query_ms = slow_query_ms
+        self.slow_query_log = slow_query_log
+        self.records: list[QueryRecord] = []
+        self._engines = []
+
+    def attach(self, engine) -> "SQLProfiler":
+        from sqlalchemy import event
+
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        self._engines.append(engine)
+        return self
+
+    def detach(self) -> None:
+        from sqlalchemy import event
+
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+            event.remove(engine, "handle_error", self._handle_error)
+        self._engines.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # A stack, since a statement may be executed while another one is pending
+        conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info[_START_TIMES].pop()) * 1000
+        slow = self.slow_query_log is not None and duration_ms >= self.slow_query_ms
+        if not (self.record or slow):
+            return
+
+        # The DB-API reports -1 when the row count is unknown, e.g. for a SELECT on SQLite
+        rows = cursor.rowcount if cursor.rowcount >= 0 else None
+        record = QueryRecord(statement=statement, duration_ms=duration_ms, rows=rows, caller=find_caller())
+        if self.record:
+            self.records.append(record)
+        if slow:
+            self._log_slow_query(record)
+
+    def _handle_error(self, exception_context):
+        # A failed statement never reaches after_cursor_execute: its start time
+        # is dropped so that the next statement is not timed from it
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_START_TIMES):
+            conn.info[_START_TIMES].pop()
+
+    def _log_slow_query(self, record: QueryRecord) -> None:
+        entry = {
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "duration_ms": round(record.duration_ms, 3),
+            "rows": record.rows,
+            "caller": record.caller,
+            "statement": record.statement,
+        }
+        with open(self.slow_query_log, "a", encoding="utf-8") as log:
+            log.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def summary(self) -> list[dict]:
+        """
+        Aggregates the recorded statements by caller and statement text.
+
+        :return: One entry per caller and statement, holding the number of
+            executions, the total and maximum latencies and the total row
+            count, the slowest in total first.
+        :rtype: list[dict]
+        """
+        groups = {}
+        for record in self.records:
+            group = groups.setdefault((record.caller, record.statement), {
+                "caller": record.caller, "statement": record.statement,
+                "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": None,
+            })
+            group["count"] += 1
+            group["total_ms"] += record.duration_ms
+            group["max_ms"] = max(group["max_ms"], record.duration_ms)
+            if record.rows is not None:
+                group["rows"] = (group["rows"] or 0) + record.rows
+        return sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)
+
+    def format_summary(self, limit: int = 10) -> str:
+        """
+        Formats the summary printed by `--profile-sql`.
+
+        :param limit: Number of statement groups to show.
+        :type limit: int
+        :return: The report, one line per statement group.
+        :rtype: str
+        """
+        total_ms = sum(record.duration_ms for record in self.records)
+        lines = [f"SQL : {len(self.records)} requête(s), {total_ms:.1f} ms"]
+        for group in self.summary()[:limit]:
+            statement = " ".join(group["statement"].split())
+            if len(statement) > 80:
+                statement = statement[:77] + "..."
+            rows = "?" if group["rows"] is None else group["rows"]
+            lines.append(f"{group['total_ms']:9.1f} ms | {group['count']:4d} x | max {group['max_ms']:7.1f} ms "
+                         f"| {rows} ligne(s) | {group['caller']} | {statement}")
+        return "\n".join(lines)
+
+
+def start_sql_profiling(profile: bool = False, bind=None) -> SQLProfiler | None:
+    """
+    Attaches a profiler to the application engine for the current command.
+
+    Nothing is attached, and the database layer is not even imported, when
+    neither the summary nor the slow-query log is requested.
+
+    :param profile: Records every statement for the per-command summary.
+    :type profile: bool
+    :param bind: The engine to instrument, the application engine by default.
+    :return: The attached profiler, to `detach` at the end of the command, or
+        None when profiling is off.
+    :rtype: SQLProfiler | None
+    """
+    if not profile and not SQL_SLOW_QUERY_LOG:
+        return None
+    if bind is None:
+        from db.session import engine as bind
+    return SQLProfiler(record=profile).attach(bind)
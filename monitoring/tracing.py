@@ -0,0 +1,85 @@
+from contextlib import nullcontext
+from functools import wraps
+from inspect import isfunction
+
+import sentry_sdk
+
+# Set by `init_sentry` when performance tracing is sampled
+_enabled = False
+
+
+def enable_tracing(enabled: bool = True) -> None:
+    """
+    Turns the spans of `traced` functions on or off.
+
+    :param enabled: True when Sentry samples transactions.
+    :type enabled: bool
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_tracing_enabled() -> bool:
+    return _enabled
+
+
+def traced(op: str, name: str | None = None):
+    """
+    Records each call of the decorated function as a Sentry span.
+
+    While tracing is off, the wrapper only checks a module flag before calling
+    the function, so it can be applied to the BL and the DAL at no measurable
+    cost.
+
+    :param op: The span operation, e.g. "bl" or "db.dal".
+    :type op: str
+    :param name: The span name, the qualified name of the function by default.
+    :type name: str | None
+    :return: The decorator.
+    """
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with sentry_sdk.start_span(op=op, name=span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_methods(op: str):
+    """
+    Class decorator applying `traced` to every public method of the class.
+    Static and class methods are left untouched.
+
+    :param op: The span operation of the methods.
+    :type op: str
+    :return: The class decorator.
+    """
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and isfunction(value):
+                setattr(cls, attr, traced(op)(value))
+        return cls
+    return decorator
+
+
+def command_transaction(ctx):
+    """
+    Opens the Sentry transaction of a CLI command, named after the command
+    path, e.g. "event list". The options and arguments are left out of the
+    name, so that every run of a command is grouped together.
+
+    :param ctx: The click context of the root group, whose `command_path`
+        meta entry holds the names of the invoked commands (see
+        `LazyGroup.invoke`).
+    :return: The transaction, to enter for the duration of the command, or a
+        no-op context when tracing is off.
+    """
+    if not _enabled:
+        return nullcontext()
+    name = " ".join(ctx.meta.get("command_path", ())) or ctx.info_name
+    return sentry_sdk.start_transaction(op="cli.command", name=name)
@@ -1,5 +1,5 @@
 from dal.collaborator_dal import CollaboratorDAL
-from security.password import verify_password
+from security.password import hash_password, needs_rehash, verify_password
 
 
 def authenticate_collaborator(db, email: str, password: str) -> dict | None:
@@ -8,6 +8,9 @@ def authenticate_collaborator(db, email: str, password: str) -> dict | None:
     If the credentials are valid, the collaborator's essential information is
     returned as a dictionary.
 
+    A password hash made with an outdated policy, such as another bcrypt cost,
+    is replaced on successful login, while the plain text password is known.
+
     :param db: Database session or connection object used for querying.
     :type db: Any
     :param email: The email address of the collaborator to authenticate.
@@ -25,6 +28,9 @@ def authenticate_collaborator(db, email: str, password: str) -> dict | None:
     if not verify_password(password, user.password):
         return None
 
+    if needs_rehash(user.password):
+        dal.update_by_id(user.id, {"password": hash_password(password)})
+
     return {
         "id": user.id,
         "sub": user.email,
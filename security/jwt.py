@@ -1,7 +1,10 @@
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+import hashlib
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,6 +12,14 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "default_secret_key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 90))
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", 128))
+
+# Payloads of tokens whose signature was already verified, keyed by token digest
+_verified_tokens: OrderedDict[str, dict] = OrderedDict()
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -25,11 +36,49 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
 
 
 def decode_access_token(token: str) -> dict | None:
+    """
+    Verifies a JWT access token and returns its payload.
+
+    The signature of a given token is verified once per process: the payload is
+    then served from a small cache keyed by the token digest until the token
+    expires or `invalidate_token` is called. Each call returns a fresh copy of
+    the payload.
+
+    :param token: The encoded JWT.
+    :type token: str
+    :return: The payload, or None if the token is invalid or expired.
+    :rtype: dict | None
+    """
+    digest = _token_digest(token)
+    payload = _verified_tokens.get(digest)
+    if payload is not None:
+        if "exp" not in payload or payload["exp"] > time.time():
+            _verified_tokens.move_to_end(digest)
+            return dict(payload)
+        del _verified_tokens[digest]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        _verified_tokens[digest] = payload
+        if len(_verified_tokens) > VERIFIED_TOKEN_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+        return dict(payload)
     except ExpiredSignatureError:
         print("Le token a expiré.")
     except InvalidTokenError:
         print("Token invalide.")
     return None
+
+
+def invalidate_token(token: str | None = None) -> None:
+    """
+    Removes a token from the verified-token cache, so that its next use verifies
+    the signature again.
+
+    :param token: The encoded JWT, or None to empty the whole cache.
+    :type token: str | None
+    """
+    if token is None:
+        _verified_tokens.clear()
+    else:
+        _verified_tokens.pop(_token_digest(token), None)
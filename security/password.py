@@ -1,6 +1,30 @@
-from passlib.hash import bcrypt
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable
+from passlib.context import CryptContext
+from dotenv import load_dotenv
+from monitoring.tracing import traced
 
+load_dotenv()
 
+# bcrypt cost factor: each extra round doubles the hashing time
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+BCRYPT_MIN_ROUNDS = 4
+BCRYPT_MAX_ROUNDS = 31
+
+# Hashes made with another cost than BCRYPT_ROUNDS are reported by `needs_rehash`
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# "thread" (bcrypt releases the GIL while hashing) or "process"
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+# Number of workers, 0 for one per CPU
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 0))
+
+_executor: Executor | None = None
+
+
+@traced("security.password")
 def hash_password(password: str) -> str:
     """
     Hash the given password using a secure hashing algorithm.
@@ -14,9 +38,10 @@ def hash_password(password: str) -> str:
     :return: A securely hashed representation of the input password.
     :rtype: str
     """
-    return bcrypt.hash(password)
+    return pwd_context.hash(password)
 
 
+@traced("security.password")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies a plain text password against a hashed password using a password
@@ -30,4 +55,159 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         otherwise, False.
     :rtype: bool
     """
-    return bcrypt.verify(plain_password, hashed_password)
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Tells whether a stored hash no longer matches the hashing policy, for
+    instance because it was made with another bcrypt cost than `BCRYPT_ROUNDS`.
+
+    :param hashed_password: The stored hash.
+    :type hashed_password: str
+    :return: True if the hash should be replaced at the next successful login;
+        False if it is up to date or cannot be identified.
+    :rtype: bool
+    """
+    try:
+        return pwd_context.needs_update(hashed_password)
+    except (TypeError, ValueError):
+        return False
+
+
+def measure_rounds(rounds: int, samples: int = 3) -> float:
+    """
+    Measures the verification time of a bcrypt hash made with the given cost.
+
+    :param rounds: The bcrypt cost factor.
+    :type rounds: int
+    :param samples: Number of verifications, the fastest one is kept.
+    :type samples: int
+    :return: The verification time, in milliseconds.
+    :rtype: float
+    """
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    hashed_password = context.hash("calibration")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration", hashed_password)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def calibrate_rounds(target_ms: float, min_rounds: int = BCRYPT_MIN_ROUNDS,
+                     max_rounds: int = 16) -> tuple[int, dict[int, float]]:
+    """
+    Finds the highest bcrypt cost whose verification stays within a target
+    latency on the current hardware.
+
+    Costs are measured in increasing order and the search stops at the first
+    one over the target, since every extra round doubles the time.
+
+    :param target_ms: The maximum verification latency, in milliseconds.
+    :type target_ms: float
+    :param min_rounds: The lowest cost to consider, returned if even it is too slow.
+    :type min_rounds: int
+    :param max_rounds: The highest cost to consider.
+    :type max_rounds: int
+    :return: The chosen cost and the measured latency of each cost tried.
+    :rtype: tuple[int, dict[int, float]]
+    """
+    if not BCRYPT_MIN_ROUNDS <= min_rounds <= max_rounds <= BCRYPT_MAX_ROUNDS:
+        raise ValueError(f"Les coûts bcrypt doivent être compris entre {BCRYPT_MIN_ROUNDS} et {BCRYPT_MAX_ROUNDS}.")
+
+    chosen = min_rounds
+    timings = {}
+    for rounds in range(min_rounds, max_rounds + 1):
+        timings[rounds] = measure_rounds(rounds)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, timings
+
+
+def create_hashing_executor(kind: str = PASSWORD_HASH_EXECUTOR, workers: int = PASSWORD_HASH_WORKERS) -> Executor:
+    """
+    Creates a worker pool for password hashing.
+
+    A thread pool scales with the cores because bcrypt releases the GIL; a
+    process pool also isolates the hashing from the calling interpreter, at the
+    cost of pickling every password and hash.
+
+    :param kind: "thread" or "process".
+    :type kind: str
+    :param workers: Number of workers, 0 for one per CPU.
+    :type workers: int
+    :return: The executor. The caller is responsible for shutting it down.
+    :rtype: Executor
+    """
+    workers = workers or os.cpu_count() or 1
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    raise ValueError(f"Type d'exécuteur de hachage inconnu : {kind}")
+
+
+def get_hashing_executor() -> Executor:
+    """
+    Returns the executor used by `hash_many` and `verify_many`, creating it from
+    `PASSWORD_HASH_EXECUTOR` and `PASSWORD_HASH_WORKERS` on first use.
+
+    :return: The shared hashing executor.
+    :rtype: Executor
+    """
+    global _executor
+    if _executor is None:
+        _executor = create_hashing_executor()
+    return _executor
+
+
+def set_hashing_executor(executor: Executor | None) -> Executor | None:
+    """
+    Replaces the executor used by `hash_many` and `verify_many`.
+
+    Passing None makes the next batch create a new executor from the
+    environment settings.
+
+    :param executor: The executor to use.
+    :type executor: Executor | None
+    :return: The previous executor, which is not shut down.
+    :rtype: Executor | None
+    """
+    global _executor
+    previous, _executor = _executor, executor
+    return previous
+
+
+def hash_many(passwords: Iterable[str], executor: Executor | None = None) -> list[str]:
+    """
+    Hashes a batch of passwords on the hashing executor.
+
+    :param passwords: The plain text passwords.
+    :type passwords: Iterable[str]
+    :param executor: The executor to use, the shared one by default.
+    :type executor: Executor | None
+    :return: The hashes, in the order of the passwords.
+    :rtype: list[str]
+    """
+    return list((executor or get_hashing_executor()).map(hash_password, passwords))
+
+
+def verify_many(credentials: Iterable[tuple[str, str]], executor: Executor | None = None) -> list[bool]:
+    """
+    Verifies a batch of passwords against their hashes on the hashing executor.
+
+    :param credentials: Pairs of plain text password and hashed password.
+    :type credentials: Iterable[tuple[str, str]]
+    :param executor: The executor to use, the shared one by default.
+    :type executor: Executor | None
+    :return: The verification results, in the order of the pairs.
+    :rtype: list[bool]
+    """
+    credentials = list(credentials)
+    if not credentials:
+        return []
+    plain_passwords, hashed_passwords = zip(*credentials)
+    return list((executor or get_hashing_executor()).map(verify_password, plain_passwords, hashed_passwords))
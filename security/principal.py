@@ -0,0 +1,80 @@
+import os
+import time
+from dataclasses import dataclass
+
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", 60))
+
+# Role name of the collaborators already checked, with the time of the check, by id
+_checked_roles: dict[int, tuple[str, float]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Identity of the collaborator running the current command.
+    """
+    id: int
+    email: str
+    role: str
+
+
+def _current_role(collaborator_id: int, collaborator_dal) -> str | None:
+    checked = _checked_roles.get(collaborator_id)
+    if checked is not None and time.monotonic() - checked[1] < PRINCIPAL_CACHE_TTL:
+        return checked[0]
+    role = collaborator_dal.get_role_name(collaborator_id)
+    if role is None:
+        _checked_roles.pop(collaborator_id, None)
+    else:
+        _checked_roles[collaborator_id] = (role, time.monotonic())
+    return role
+
+
+def invalidate_principal(collaborator_id: int | None = None) -> None:
+    """
+    Forgets the checked role of a collaborator, so that its next principal is
+    checked against the database again.
+
+    :param collaborator_id: The collaborator updated or deleted, or None to
+        empty the whole cache.
+    :type collaborator_id: int | None
+    """
+    if collaborator_id is None:
+        _checked_roles.clear()
+    else:
+        _checked_roles.pop(collaborator_id, None)
+
+
+def resolve_principal(payload: dict, collaborator_dal) -> Principal | None:
+    """
+    Resolves the collaborator behind a JWT payload.
+
+    Tokens issued by `authenticate_collaborator` carry the collaborator `id`.
+    The token may outlive the collaborator or its role, so the role of the id
+    is checked with one indexed query, then cached for the process until the
+    collaborator is updated or deleted, or for `PRINCIPAL_CACHE_TTL` seconds
+    since other processes may change it. For a payload without `id`, the
+    collaborator is looked up once by email and its id is cached in the
+    payload, which lives as long as the command does.
+
+    :param payload: The decoded JWT payload of the current user.
+    :type payload: dict
+    :param collaborator_dal: The DAL used to check the collaborator.
+    :type collaborator_dal: CollaboratorDAL
+    :return: The principal, or None if no collaborator matches the payload,
+        e.g. once deleted or given another role than the token's.
+    :rtype: Principal | None
+    """
+    if not isinstance(payload, dict):
+        raise TypeError("Le payload doit être un dictionnaire.")
+
+    email = payload.get("email") or payload.get("sub")
+    if payload.get("id") is None:
+        collaborator = collaborator_dal.get_by_email_raw(payload.get("sub"))
+        if not collaborator:
+            return None
+        payload["id"] = collaborator.id
+
+    if _current_role(payload["id"], collaborator_dal) != payload.get("role"):
+        return None
+    return Principal(id=payload["id"], email=email, role=payload.get("role"))
@@ -1,4 +1,5 @@
 from pathlib import Path
+from security.jwt import invalidate_token
 
 DEFAULT_TOKEN_FILE = Path.home() / ".epicevents_token"
 
@@ -17,4 +18,6 @@ def load_token(path: Path = DEFAULT_TOKEN_FILE) -> str | None:
 
 def delete_token(path: Path = DEFAULT_TOKEN_FILE):
     if path.exists():
+        # Logging out must not leave the token usable from the verified-token cache
+        invalidate_token(load_token(path))
         path.unlink()
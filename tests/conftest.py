@@ -1,8 +1,13 @@
 import warnings
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.testing import db
 
 from bl.role_bl import RoleBL
+from models import Base
+from security.principal import invalidate_principal
 
 
 def pytest_configure():
@@ -10,4 +15,27 @@ def pytest_configure():
         "ignore",
         category=DeprecationWarning,
         message=".*crypt.*"
-    )
\ No newline at end of file
+    )
+
+
+@pytest.fixture
+def sqlite_engine():
+    """
+    In-memory SQLite database with every table created. All the sessions of
+    a test share its single connection, so they see each other's commits.
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_session_factory(sqlite_engine):
+    return sessionmaker(bind=sqlite_engine)
+
+
+@pytest.fixture(autouse=True)
+def forget_checked_principals():
+    # Each test has its own collaborators, often under the same ids
+    invalidate_principal()
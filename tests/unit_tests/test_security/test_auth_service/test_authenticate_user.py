@@ -67,4 +67,24 @@ def test_authenticate_collaborator_missing_role():
     with patch("security.auth_service.CollaboratorDAL", return_value=mock_collaborator_dal), \
          patch("security.auth_service.verify_password", return_value=True):
         with pytest.raises(AttributeError, match="'NoneType' object has no attribute 'name'"):
-            authenticate_collaborator(mock_db, "user@example.com", "correct_password")
\ No newline at end of file
+            authenticate_collaborator(mock_db, "user@example.com", "correct_password")
+
+@pytest.mark.parametrize("stale", [True, False])
+def test_authenticate_collaborator_rehashes_stale_hash(stale):
+    mock_role = Mock()
+    mock_role.name = "support"
+    mock_user = Mock(id=4, email="test@example.com", password="old_hash", role=mock_role)
+    mock_collaborator_dal = Mock()
+    mock_collaborator_dal.get_by_email_raw.return_value = mock_user
+
+    with patch("security.auth_service.CollaboratorDAL", return_value=mock_collaborator_dal), \
+            patch("security.auth_service.verify_password", return_value=True), \
+            patch("security.auth_service.needs_rehash", return_value=stale), \
+            patch("security.auth_service.hash_password", return_value="new_hash"):
+        result = authenticate_collaborator(Mock(), "test@example.com", "plain_password")
+
+    assert result["id"] == 4
+    if stale:
+        mock_collaborator_dal.update_by_id.assert_called_once_with(4, {"password": "new_hash"})
+    else:
+        mock_collaborator_dal.update_by_id.assert_not_called()
@@ -0,0 +1,51 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from passlib.hash import bcrypt
+from security import password
+from security.password import create_hashing_executor, hash_many, set_hashing_executor, verify_many
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_hash_many_keeps_order(executor):
+    hashes = hash_many(["first", "second"], executor)
+
+    assert bcrypt.verify("first", hashes[0])
+    assert bcrypt.verify("second", hashes[1])
+
+
+def test_verify_many(executor):
+    hashed = bcrypt.hash("secret")
+
+    assert verify_many([("secret", hashed), ("wrong", hashed)], executor) == [True, False]
+
+
+def test_batches_accept_empty_input(executor):
+    assert hash_many([], executor) == []
+    assert verify_many(iter([]), executor) == []
+
+
+def test_hash_many_uses_shared_executor(executor):
+    previous = set_hashing_executor(executor)
+    try:
+        assert len(hash_many(["secret"])) == 1
+        assert password.get_hashing_executor() is executor
+    finally:
+        set_hashing_executor(previous)
+
+
+@pytest.mark.parametrize("kind, executor_class", [("thread", ThreadPoolExecutor), ("process", ProcessPoolExecutor)])
+def test_create_hashing_executor(kind, executor_class):
+    with create_hashing_executor(kind, 1) as executor:
+        assert isinstance(executor, executor_class)
+        assert verify_many([("secret", bcrypt.hash("secret"))], executor) == [True]
+
+
+def test_create_hashing_executor_unknown_kind():
+    with pytest.raises(ValueError):
+        create_hashing_executor("fiber", 1)
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+import pytest
+import security.principal as principal_module
+from dal.collaborator_dal import CollaboratorDAL
+from security.principal import Principal, invalidate_principal, resolve_principal
+
+GESTION = {"id": 3, "sub": "a@epicevents.fr", "email": "a@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture
+def collaborator_dal():
+    return MagicMock(spec=CollaboratorDAL)
+
+
+def test_resolve_principal_from_token_id(collaborator_dal):
+    collaborator_dal.get_role_name.return_value = "gestion"
+
+    principal = resolve_principal(dict(GESTION), collaborator_dal)
+
+    assert principal == Principal(id=3, email="a@epicevents.fr", role="gestion")
+    collaborator_dal.get_by_email_raw.assert_not_called()
+    collaborator_dal.get_role_name.assert_called_once_with(3)
+
+
+def test_resolve_principal_checks_the_role_once_per_process(collaborator_dal):
+    collaborator_dal.get_role_name.return_value = "gestion"
+
+    resolve_principal(dict(GESTION), collaborator_dal)
+    resolve_principal(dict(GESTION), collaborator_dal)
+
+    collaborator_dal.get_role_name.assert_called_once_with(3)
+
+
+@pytest.mark.parametrize("role", [None, "support"])
+def test_resolve_principal_rejects_a_deleted_or_demoted_collaborator(collaborator_dal, role):
+    collaborator_dal.get_role_name.return_value = role
+
+    assert resolve_principal(dict(GESTION), collaborator_dal) is None
+
+
+def test_invalidate_principal_checks_the_role_again(collaborator_dal):
+    collaborator_dal.get_role_name.return_value = "gestion"
+    resolve_principal(dict(GESTION), collaborator_dal)
+
+    collaborator_dal.get_role_name.return_value = "support"
+    invalidate_principal(3)
+
+    assert resolve_principal(dict(GESTION), collaborator_dal) is None
+
+
+def test_checked_roles_expire(collaborator_dal, monkeypatch):
+    collaborator_dal.get_role_name.return_value = "gestion"
+    resolve_principal(dict(GESTION), collaborator_dal)
+
+    collaborator_dal.get_role_name.return_value = None
+    monkeypatch.setattr(principal_module, "PRINCIPAL_CACHE_TTL", 0)
+
+    assert resolve_principal(dict(GESTION), collaborator_dal) is None
+
+
+def test_resolve_principal_looks_up_once_without_id(collaborator_dal):
+    collaborator_dal.get_by_email_raw.return_value = MagicMock(id=7)
+    collaborator_dal.get_role_name.return_value = "support"
+    payload = {"sub": "b@epicevents.fr", "role": "support"}
+
+    first = resolve_principal(payload, collaborator_dal)
+    second = resolve_principal(payload, collaborator_dal)
+
+    assert first == second == Principal(id=7, email="b@epicevents.fr", role="support")
+    collaborator_dal.get_by_email_raw.assert_called_once_with("b@epicevents.fr")
+
+
+def test_resolve_principal_unknown_collaborator(collaborator_dal):
+    collaborator_dal.get_by_email_raw.return_value = None
+    payload = {"sub": "ghost@epicevents.fr", "role": "support"}
+
+    assert resolve_principal(payload, collaborator_dal) is None
+    assert "id" not in payload
+
+
+def test_resolve_principal_invalid_payload(collaborator_dal):
+    with pytest.raises(TypeError):
+        resolve_principal("not a dict", collaborator_dal)
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+from passlib.context import CryptContext
+from security.password import calibrate_rounds, needs_rehash, pwd_context
+
+
+def _hash_with_rounds(rounds):
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds).hash("secret")
+
+
+def test_current_policy_hash_is_up_to_date():
+    assert needs_rehash(pwd_context.hash("secret")) is False
+
+
+@pytest.mark.parametrize("rounds", [4, 13])
+def test_other_cost_needs_rehash(rounds):
+    assert needs_rehash(_hash_with_rounds(rounds)) is True
+
+
+def test_unidentified_hash_is_not_rehashed():
+    assert needs_rehash("hashed_password") is False
+
+
+def test_calibrate_rounds_stops_at_target():
+    with patch("security.password.measure_rounds", side_effect=lambda rounds: 2 ** (rounds - 4)) as measure:
+        chosen, timings = calibrate_rounds(10)
+
+    assert chosen == 7
+    assert timings == {4: 1, 5: 2, 6: 4, 7: 8, 8: 16}
+    assert measure.call_count == 5
+
+
+def test_calibrate_rounds_keeps_minimum_when_too_slow():
+    with patch("security.password.measure_rounds", return_value=500):
+        assert calibrate_rounds(10, min_rounds=8) == (8, {8: 500})
+
+
+def test_calibrate_rounds_rejects_invalid_range():
+    with pytest.raises(ValueError):
+        calibrate_rounds(10, min_rounds=3)
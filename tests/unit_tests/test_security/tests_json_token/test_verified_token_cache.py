@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+import pytest
+from security import jwt as jwt_module
+from security.jwt import create_access_token, decode_access_token, invalidate_token
+from security.token_store import delete_token, save_token
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    invalidate_token()
+    yield
+    invalidate_token()
+
+
+@pytest.fixture
+def jwt_decode(mocker):
+    return mocker.spy(jwt_module.jwt, "decode")
+
+
+def test_signature_is_verified_once(jwt_decode):
+    token = create_access_token({"sub": "a@epicevents.fr", "role": "gestion"})
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first == second
+    assert first["sub"] == "a@epicevents.fr"
+    assert jwt_decode.call_count == 1
+
+
+def test_cached_payload_is_a_copy():
+    token = create_access_token({"sub": "a@epicevents.fr"})
+
+    decode_access_token(token)["id"] = 42
+
+    assert "id" not in decode_access_token(token)
+
+
+def test_expired_cache_entry_is_verified_again(jwt_decode, mocker):
+    token = create_access_token({"sub": "a@epicevents.fr"}, expires_delta=timedelta(minutes=1))
+    exp = decode_access_token(token)["exp"]
+
+    mocker.patch("security.jwt.time.time", return_value=exp + 1)
+    decode_access_token(token)
+
+    assert jwt_decode.call_count == 2
+
+
+def test_invalidate_token_forces_verification(jwt_decode):
+    token = create_access_token({"sub": "a@epicevents.fr"})
+    decode_access_token(token)
+
+    invalidate_token(token)
+    decode_access_token(token)
+
+    assert jwt_decode.call_count == 2
+
+
+def test_delete_token_invalidates_cache(tmp_path):
+    path = tmp_path / "token"
+    token = create_access_token({"sub": "a@epicevents.fr"})
+    save_token(token, path=path)
+    decode_access_token(token)
+
+    delete_token(path=path)
+
+    assert jwt_module._token_digest(token) not in jwt_module._verified_tokens
+
+
+def test_cache_is_bounded(mocker):
+    mocker.patch("security.jwt.VERIFIED_TOKEN_CACHE_SIZE", 2)
+    tokens = [create_access_token({"sub": f"{i}@epicevents.fr"}) for i in range(3)]
+
+    for token in tokens:
+        decode_access_token(token)
+
+    assert list(jwt_module._verified_tokens) == [jwt_module._token_digest(t) for t in tokens[1:]]
@@ -0,0 +1,31 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks import bench_bl
+
+
+@pytest.fixture(autouse=True)
+def fast_hash():
+    with patch("db.seed.hash_password", return_value="hashed"):
+        yield
+
+
+def test_benchmark_writes_json_results(tmp_path):
+    output = tmp_path / "results.json"
+
+    bench_bl.main(["--sizes", "3", "6", "--repeat", "1", "--clients-per-commercial", "4", "--output", str(output)])
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["meta"]["database"] == "sqlite"
+    assert [run["collaborators"] for run in report["runs"]] == [3, 6]
+    assert report["runs"][1]["counts"]["clients"] == 8
+    methods = {result["method"] for result in report["runs"][0]["results"]}
+    assert {"ContractBL.list_unpaid_contract", "EventBL.list_events_without_support"} <= methods
+    assert all(result["min_ms"] <= result["median_ms"] <= result["max_ms"] for result in report["runs"][0]["results"])
+
+
+def test_benchmark_refuses_to_drop_a_database_without_reset():
+    with pytest.raises(SystemExit):
+        bench_bl.main(["--database-url", "postgresql://localhost/epicevent"])
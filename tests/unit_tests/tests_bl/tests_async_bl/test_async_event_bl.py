@@ -0,0 +1,121 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from bl.async_bl import AsyncClientBLL, AsyncEventBL
+from dal.async_dal import AsyncContractDAL, AsyncEventDAL, AsyncStream
+from db.async_session import async_unit_of_work, create_async_engine_from_settings
+from models import Base, Client, Collaborator, Contract, Role
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_async_engine_from_settings(f"sqlite:///{tmp_path / 'async.db'}")
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_unit_of_work(async_sessionmaker(engine)) as db:
+            db.add(Role(id=1, name="commercial"))
+            db.add(Collaborator(id=1, name="Com", email="com@epicevents.fr", password="x", role_id=1))
+            db.add(Collaborator(id=2, name="Other", email="other@epicevents.fr", password="x", role_id=1))
+            db.add(Client(id=1, name="Client", email="client@example.com", commercial_id=1,
+                          creation_date=date(2025, 1, 1)))
+            db.add(Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2025, 1, 1), status=True,
+                            client_id=1, commercial_id=1))
+            db.add(Contract(id=2, total_amount=100, amount_left=100, creation_date=date(2025, 1, 1), status=False,
+                            client_id=1, commercial_id=1))
+
+    asyncio.run(setup())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def event_data():
+    return {
+        "contract_id": 1,
+        "start_date": datetime(2025, 6, 1, 10),
+        "end_date": datetime(2025, 6, 1, 12),
+        "location": "Paris",
+        "attendees": 10,
+    }
+
+
+def test_create_event_commits(session_factory, event_data):
+    current_user = {"sub": "com@epicevents.fr", "role": "commercial"}
+
+    async def scenario():
+        event = await AsyncEventBL(session_factory).create_event(event_data, current_user)
+        async with async_unit_of_work(session_factory) as db:
+            return event, await AsyncEventDAL(db, projection=True).get(event.id)
+
+    event, stored = asyncio.run(scenario())
+
+    assert stored == event
+    assert event.contract_id == 1
+    assert current_user["id"] == 1
+
+
+def test_create_event_rejects_unsigned_contract(session_factory, event_data):
+    current_user = {"id": 1, "sub": "com@epicevents.fr", "role": "commercial"}
+
+    with pytest.raises(PermissionError, match="contrat non signé"):
+        asyncio.run(AsyncEventBL(session_factory).create_event({**event_data, "contract_id": 2}, current_user))
+
+
+def test_create_event_rejects_other_commercial(session_factory, event_data):
+    current_user = {"id": 2, "sub": "other@epicevents.fr", "role": "commercial"}
+
+    with pytest.raises(PermissionError, match="vos propres contrats"):
+        asyncio.run(AsyncEventBL(session_factory).create_event(event_data, current_user))
+
+
+def test_create_event_rejects_inverted_dates(session_factory, event_data):
+    current_user = {"id": 1, "sub": "com@epicevents.fr", "role": "commercial"}
+    event_data["end_date"] = datetime(2025, 6, 1, 9)
+
+    with pytest.raises(ValueError, match="postérieure"):
+        asyncio.run(AsyncEventBL(session_factory).create_event(event_data, current_user))
+
+
+def test_create_event_uses_a_single_unit_of_work(session_factory, event_data, mocker):
+    current_user = {"id": 1, "sub": "com@epicevents.fr", "role": "commercial"}
+    unit_of_work = mocker.patch("bl.async_bl.async_unit_of_work", wraps=async_unit_of_work)
+
+    asyncio.run(AsyncEventBL(session_factory).create_event(event_data, current_user))
+
+    unit_of_work.assert_called_once_with(session_factory)
+
+
+def test_independent_reads_can_be_gathered(session_factory):
+    async def scenario():
+        clients = AsyncClientBLL(session_factory)
+        return await asyncio.gather(clients.get_client(1), clients.get_all_clients())
+
+    client, all_clients = asyncio.run(scenario())
+
+    assert client.email == "client@example.com"
+    assert all_clients == [client]
+
+
+def test_async_dal_streams_inside_the_session(session_factory):
+    async def scenario():
+        async with async_unit_of_work(session_factory) as db:
+            stream = await AsyncContractDAL(db).stream_batches(chunk_size=1)
+            assert isinstance(stream, AsyncStream)
+            return [[contract.id for contract in batch] async for batch in stream]
+
+    assert asyncio.run(scenario()) == [[1], [2]]
+
+
+def test_async_bl_refuses_streams(session_factory):
+    with pytest.raises(TypeError, match="stream_clients"):
+        asyncio.run(AsyncClientBLL(session_factory).stream_clients())
+
+
+def test_unknown_method_is_not_proxied(session_factory):
+    with pytest.raises(AttributeError):
+        AsyncClientBLL(session_factory).missing_method
@@ -22,7 +22,9 @@ def mock_client_dal(mock_db):
 
 @pytest.fixture
 def mock_collaborator_dal(mock_db):
-    return MagicMock(CollaboratorDAL(mock_db))
+    collaborator_dal = MagicMock(CollaboratorDAL(mock_db))
+    collaborator_dal.get_role_name.return_value = "commercial"
+    return collaborator_dal
 
 
 @pytest.fixture
@@ -48,6 +50,7 @@ class TestClientBLL(unittest.TestCase):
         self.mock_db = MagicMock()
         self.mock_client_dal = MagicMock(ClientDAL(self.mock_db))
         self.mock_collaborator_dal = MagicMock(CollaboratorDAL(self.mock_db))
+        self.mock_collaborator_dal.get_role_name.return_value = "commercial"
         self.client_bll = ClientBLL(self.mock_db)
         self.client_bll.dal = self.mock_client_dal
         self.client_bll.collaborator_dal = self.mock_collaborator_dal
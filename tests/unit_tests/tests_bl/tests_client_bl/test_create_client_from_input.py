@@ -22,7 +22,9 @@ def client_dal(db_session):
 
 @pytest.fixture
 def collaborator_dal(db_session):
-    return MagicMock(CollaboratorDAL(db_session))
+    collaborator_dal = MagicMock(CollaboratorDAL(db_session))
+    collaborator_dal.get_role_name.return_value = "commercial"
+    return collaborator_dal
 
 
 @pytest.fixture
@@ -142,6 +144,7 @@ def client_bl():
     bl = ClientBLL(fake_db)
     bl.dal = MagicMock()
     bl.collaborator_dal = MagicMock()
+    bl.collaborator_dal.get_role_name.return_value = "commercial"
     return bl
 
 
@@ -149,18 +152,18 @@ def client_bl():
 def test_create_client_not_commercial(mock_perm, client_bl):
     with pytest.raises(PermissionError, match="Seuls les commerciaux peuvent créer des clients"):
         client_bl.create_client_from_input("Alice", "alice@example.com",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
 
 
 @patch("bl.client_bl.is_commercial", return_value=True)
 def test_create_client_missing_name_or_email(mock_perm, client_bl):
     with pytest.raises(ValueError, match="Le nom et l'email sont requis."):
         client_bl.create_client_from_input("", "alice@example.com",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
 
     with pytest.raises(ValueError, match="Le nom et l'email sont requis."):
         client_bl.create_client_from_input("Alice", "",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
 
 
 @patch("bl.client_bl.is_commercial", return_value=True)
@@ -168,7 +171,7 @@ def test_create_client_email_already_exists(mock_perm, client_bl):
     client_bl.dal.get_by_email.return_value = MagicMock()
     with pytest.raises(ValueError, match="Un client avec cet email existe déjà."):
         client_bl.create_client_from_input("Alice", "alice@example.com",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
 
 
 @patch("bl.client_bl.is_commercial", return_value=True)
@@ -178,7 +181,7 @@ def test_create_client_collaborator_not_found(mock_perm, client_bl):
 
     with pytest.raises(ValueError, match="collaborateur introuvable"):
         client_bl.create_client_from_input("Alice", "alice@example.com",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
 
 
 @patch("bl.client_bl.is_commercial", return_value=True)
@@ -193,7 +196,7 @@ def test_create_client_integrity_error(mock_perm, client_bl):
     # Act + Assert
     with pytest.raises(ValueError, match="Email client déja utilisé."):
         client_bl.create_client_from_input("Alice", "alice@example.com",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
 
 
 @patch("bl.client_bl.is_commercial", return_value=True)
@@ -208,4 +211,4 @@ def test_create_client_unexpected_exception(mock_perm, client_bl):
     # Act + Assert
     with pytest.raises(ValueError, match="Une erreur inattendue est survenue : oops"):
         client_bl.create_client_from_input("Alice", "alice@example.com",
-                                           "0102030405", "ACorp", {"sub": "x"})
+                                           "0102030405", "ACorp", {"sub": "x", "role": "commercial"})
@@ -0,0 +1,18 @@
+from unittest.mock import MagicMock
+
+from bl.client_bl import ClientBLL
+from dal.client_dal import ClientDAL
+from dtos.page_dto import PageDTO
+from sqlalchemy.orm import Session
+
+
+def test_get_clients_page_delegates_to_dal():
+    bl = ClientBLL(MagicMock(spec=Session))
+    bl.dal = MagicMock(spec=ClientDAL)
+    expected = PageDTO(items=[], next_cursor=None)
+    bl.dal.get_page.return_value = expected
+
+    result = bl.get_clients_page(after=10, limit=5)
+
+    assert result is expected
+    bl.dal.get_page.assert_called_once_with(after=10, limit=5)
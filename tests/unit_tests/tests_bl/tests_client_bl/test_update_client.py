@@ -21,7 +21,9 @@ def mock_client_dal(mock_session):
 
 @pytest.fixture
 def mock_collaborator_dal(mock_session):
-    return MagicMock(spec=CollaboratorDAL, db=mock_session)
+    collaborator_dal = MagicMock(spec=CollaboratorDAL, db=mock_session)
+    collaborator_dal.get_role_name.return_value = "commercial"
+    return collaborator_dal
 
 
 @pytest.fixture
@@ -114,3 +116,15 @@ def test_update_client_wrong_commercial(client_bl_instance, mock_collaborator_da
 
     mock_collaborator_dal.get_by_email_raw.assert_called_once_with(mock_current_user["sub"])
     mock_client_dal.get.assert_called_once_with(1)
+
+
+def test_update_client_uses_token_id_without_lookup(client_bl_instance, mock_collaborator_dal, mock_client_dal,
+                                                    client_dto_instance):
+    current_user = {"id": 42, "sub": "user@example.com", "email": "user@example.com", "role": "commercial"}
+    mock_client_dal.get.return_value = client_dto_instance
+    mock_client_dal.update_by_id.return_value = client_dto_instance
+
+    result = client_bl_instance.update_client(client_id=1, updates={"name": "New"}, current_user=current_user)
+
+    assert result == client_dto_instance
+    mock_collaborator_dal.get_by_email_raw.assert_not_called()
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 import pytest
 from bl.client_bl import ClientBLL
@@ -12,7 +13,9 @@ def mock_client_dal():
 
 @pytest.fixture
 def mock_collaborator_dal():
-    return MagicMock()
+    collaborator_dal = MagicMock()
+    collaborator_dal.get_role_name.return_value = "commercial"
+    return collaborator_dal
 
 
 @pytest.fixture
@@ -118,9 +121,8 @@ def test_update_client_from_input_collaborator_not_found(client_bll, mock_collab
 def test_update_client_from_input_not_own_client(
         client_bll, mock_client_dal, mock_collaborator_dal, valid_client_dto, valid_collaborator
 ):
-    valid_client_dto.commercial_id = 2
     mock_collaborator_dal.get_by_email_raw.return_value = valid_collaborator
-    mock_client_dal.get.return_value = valid_client_dto
+    mock_client_dal.get.return_value = replace(valid_client_dto, commercial_id=2)
 
     with pytest.raises(PermissionError, match="Vous ne pouvez modifier que vos propres clients."):
         client_bll.update_client_from_input(
@@ -138,6 +140,7 @@ def client_bl():
     bl = ClientBLL(fake_db)
     bl.dal = MagicMock()
     bl.collaborator_dal = MagicMock()
+    bl.collaborator_dal.get_role_name.return_value = "commercial"
     return bl
 
 
@@ -185,7 +188,7 @@ def test_update_client_permission_denied_for_role(mock_is_commercial, client_bl)
 
 @patch("bl.client_bl.is_commercial", return_value=True)
 def test_update_client_collaborator_not_found(mock_is_commercial, client_bl):
-    current_user = {"sub": "com@ex.com"}
+    current_user = {"sub": "com@ex.com", "role": "commercial"}
     client_bl.collaborator_dal.get_by_email_raw.return_value = None
 
     with pytest.raises(ValueError, match="collaborateur introuvable"):
@@ -194,7 +197,7 @@ def test_update_client_collaborator_not_found(mock_is_commercial, client_bl):
 
 @patch("bl.client_bl.is_commercial", return_value=True)
 def test_update_client_not_found(mock_is_commercial, client_bl):
-    current_user = {"sub": "com@ex.com"}
+    current_user = {"sub": "com@ex.com", "role": "commercial"}
     collaborator = MagicMock(id=1)
     client_bl.collaborator_dal.get_by_email_raw.return_value = collaborator
     client_bl.dal.get.return_value = None
@@ -205,7 +208,7 @@ def test_update_client_not_found(mock_is_commercial, client_bl):
 
 @patch("bl.client_bl.is_commercial", return_value=True)
 def test_update_client_not_owned(mock_is_commercial, client_bl):
-    current_user = {"sub": "com@ex.com"}
+    current_user = {"sub": "com@ex.com", "role": "commercial"}
     collaborator = MagicMock(id=1)
     other_client = MagicMock(commercial_id=2)
     client_bl.collaborator_dal.get_by_email_raw.return_value = collaborator
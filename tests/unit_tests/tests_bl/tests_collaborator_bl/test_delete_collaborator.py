@@ -31,10 +31,12 @@ def mock_current_user():
 
 def test_delete_collaborator_successful(collaborator_bl_instance, mock_collaborator_dal, mock_current_user):
     mock_collaborator_dal.delete_by_id.return_value = True
-    with patch("bl.collaborator_bl.can_manage_collaborators", return_value=True):
+    with patch("bl.collaborator_bl.can_manage_collaborators", return_value=True), \
+            patch("bl.collaborator_bl.invalidate_principal") as invalidate_principal:
         result = collaborator_bl_instance.delete_collaborator(1, mock_current_user)
     assert result is None
     mock_collaborator_dal.delete_by_id.assert_called_once_with(1)
+    invalidate_principal.assert_called_once_with(1)
 
 
 def test_delete_collaborator_permission_error(collaborator_bl_instance, mock_current_user):
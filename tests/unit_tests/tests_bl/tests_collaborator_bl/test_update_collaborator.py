@@ -46,7 +46,8 @@ def test_update_collaborator_successful(collaborator_bl_instance, mock_collabora
                                         collaborator_dto_instance):
     updates = {"name": "Jane Doe"}
     mock_collaborator_dal.update_by_id.return_value = collaborator_dto_instance
-    with patch("bl.collaborator_bl.can_manage_collaborators", return_value=True):
+    with patch("bl.collaborator_bl.can_manage_collaborators", return_value=True), \
+            patch("bl.collaborator_bl.invalidate_principal") as invalidate_principal:
         result = collaborator_bl_instance.update_collaborator(
             collaborator_id=1,
             updates=updates,
@@ -54,6 +55,7 @@ def test_update_collaborator_successful(collaborator_bl_instance, mock_collabora
         )
     assert result == collaborator_dto_instance
     mock_collaborator_dal.update_by_id.assert_called_once_with(1, updates)
+    invalidate_principal.assert_called_once_with(1)
 
 
 def test_update_collaborator_no_permission(collaborator_bl_instance, mock_collaborator_dal, mock_current_user):
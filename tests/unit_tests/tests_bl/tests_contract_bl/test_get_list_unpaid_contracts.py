@@ -55,10 +55,12 @@ def paid_contracts():
 
 def test_list_unpaid_contract_as_commercial(contract_bl, contract_dal, commercial_user, unpaid_contracts,
                                             paid_contracts):
-    contract_dal.get_all.return_value = unpaid_contracts + paid_contracts
+    contract_dal.filter_unpaid.return_value = unpaid_contracts
     result = contract_bl.list_unpaid_contract(commercial_user)
     assert all(contract.amount_left > 0 for contract in result)
     assert result == unpaid_contracts
+    contract_dal.filter_unpaid.assert_called_once_with()
+    contract_dal.get_all.assert_not_called()
 
 
 def test_list_unpaid_contract_as_non_commercial(contract_bl, non_commercial_user):
@@ -67,6 +69,6 @@ def test_list_unpaid_contract_as_non_commercial(contract_bl, non_commercial_user
 
 
 def test_list_unpaid_contract_with_no_unpaid(contract_bl, contract_dal, commercial_user, paid_contracts):
-    contract_dal.get_all.return_value = paid_contracts
+    contract_dal.filter_unpaid.return_value = []
     result = contract_bl.list_unpaid_contract(commercial_user)
     assert result == []
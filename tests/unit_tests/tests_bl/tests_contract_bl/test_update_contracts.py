@@ -0,0 +1,56 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bl.contract_bl import ContractBL
+from dal.contract_dal import ContractDAL
+from dtos.contract_dto import ContractDTO
+from sqlalchemy.orm import Session
+
+COMMERCIAL = {"id": 1, "email": "com@epicevents.fr", "role": "commercial"}
+
+
+def _contract(contract_id, commercial_id=1, status=False):
+    return ContractDTO(id=contract_id, total_amount=Decimal("100"), amount_left=Decimal("100"),
+                       creation_date=date(2024, 1, 1), status=status, client_id=1, commercial_id=commercial_id)
+
+
+@pytest.fixture
+def contract_bl():
+    bl = ContractBL(MagicMock(spec=Session))
+    bl.dal = MagicMock(spec=ContractDAL)
+    bl.dal.update_many.return_value = 2
+    return bl
+
+
+def test_update_contracts_signs_a_batch(contract_bl):
+    contract_bl.dal.get_by_ids.return_value = [_contract(1), _contract(2, status=True)]
+
+    with patch("bl.contract_bl.capture_message") as capture, patch("bl.contract_bl.set_user"):
+        assert contract_bl.update_contracts([1, 2], {"status": True}, COMMERCIAL) == 2
+
+    contract_bl.dal.update_many.assert_called_once_with({1, 2}, {"status": True})
+    capture.assert_called_once_with("Contrats #1 signés par com@epicevents.fr", level="info")
+
+
+def test_update_contracts_rejects_contracts_of_other_commercials(contract_bl):
+    contract_bl.dal.get_by_ids.return_value = [_contract(1), _contract(2, commercial_id=9)]
+
+    with pytest.raises(PermissionError):
+        contract_bl.update_contracts([1, 2], {"status": True}, COMMERCIAL)
+    contract_bl.dal.update_many.assert_not_called()
+
+
+def test_update_contracts_rejects_unknown_contracts(contract_bl):
+    contract_bl.dal.get_by_ids.return_value = [_contract(1)]
+
+    with pytest.raises(ValueError, match="2"):
+        contract_bl.update_contracts([1, 2], {"status": True}, {"id": 5, "role": "gestion"})
+    contract_bl.dal.update_many.assert_not_called()
+
+
+def test_update_contracts_requires_contract_rights(contract_bl):
+    with pytest.raises(PermissionError):
+        contract_bl.update_contracts([1], {"status": True}, {"id": 3, "role": "support"})
+    contract_bl.dal.get_by_ids.assert_not_called()
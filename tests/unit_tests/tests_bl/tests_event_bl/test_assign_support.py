@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pytest
+from bl.event_bl import EventBL
+from dal.collaborator_dal import CollaboratorDAL
+from dal.event_dal import EventDAL
+from dtos.collaborator_dto import CollaboratorDTO
+from dtos.event_dto import EventDTO
+from sqlalchemy.orm import Session
+
+MANAGER = {"id": 1, "role": "gestion"}
+
+
+def _event(event_id):
+    return EventDTO(id=event_id, start_date=None, end_date=None, location=None, attendees=None, note=None,
+                    contract_id=1, support_id=None)
+
+
+@pytest.fixture
+def event_bl():
+    bl = EventBL(MagicMock(spec=Session))
+    bl.dal = MagicMock(spec=EventDAL)
+    bl.collaborator_dal = MagicMock(spec=CollaboratorDAL)
+    bl.dal.get_by_ids.return_value = [_event(1), _event(2)]
+    bl.collaborator_dal.get_by_id.return_value = CollaboratorDTO(id=7, name="Sam", email="s@e.fr",
+                                                                 role_name="support")
+    bl.dal.update_many.return_value = 2
+    return bl
+
+
+def test_assign_support_updates_all_events_at_once(event_bl):
+    assert event_bl.assign_support([1, 2, 2], 7, MANAGER) == 2
+
+    event_bl.dal.update_many.assert_called_once_with({1, 2}, {"support_id": 7})
+
+
+def test_assign_support_can_unassign(event_bl):
+    event_bl.assign_support([1, 2], None, MANAGER)
+
+    event_bl.collaborator_dal.get_by_id.assert_not_called()
+    event_bl.dal.update_many.assert_called_once_with({1, 2}, {"support_id": None})
+
+
+@pytest.mark.parametrize("role", ["support", "commercial"])
+def test_assign_support_is_reserved_to_management(event_bl, role):
+    with pytest.raises(PermissionError):
+        event_bl.assign_support([1, 2], 7, {"id": 2, "role": role})
+    event_bl.dal.update_many.assert_not_called()
+
+
+def test_assign_support_rejects_unknown_events(event_bl):
+    with pytest.raises(ValueError, match="3, 4"):
+        event_bl.assign_support([1, 2, 3, 4], 7, MANAGER)
+    event_bl.dal.update_many.assert_not_called()
+
+
+def test_assign_support_requires_a_support_collaborator(event_bl):
+    event_bl.collaborator_dal.get_by_id.return_value = CollaboratorDTO(id=7, name="Sam", email="s@e.fr",
+                                                                       role_name="commercial")
+    with pytest.raises(ValueError, match="support introuvable"):
+        event_bl.assign_support([1, 2], 7, MANAGER)
+    event_bl.dal.update_many.assert_not_called()
@@ -0,0 +1,67 @@
+from datetime import date, datetime
+
+import pytest
+
+from bl.event_bl import EventBL
+from models import Client, Collaborator, Contract, Event, Role
+
+MANAGER = {"id": 1, "role": "gestion"}
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all(
+        [Role(id=1, name="support"), Role(id=2, name="gestion"),
+         Collaborator(id=1, name="Manager", email="m@e.fr", password="x", role_id=2),
+         Collaborator(id=7, name="Sam", email="sam@e.fr", password="x", role_id=1),
+         Collaborator(id=8, name="Alex", email="alex@e.fr", password="x", role_id=1),
+         Client(id=1, name="Client", email="c@e.fr", creation_date=date(2024, 1, 1)),
+         Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1),
+         # Sam is already busy on the morning of March 1st
+         Event(id=1, start_date=datetime(2024, 3, 1, 8), end_date=datetime(2024, 3, 1, 12), contract_id=1,
+               support_id=7)]
+        + [Event(id=i, start_date=datetime(2024, 3, 1, 9), end_date=datetime(2024, 3, 1, 11), contract_id=1)
+           for i in (2, 3)]
+        + [Event(id=4, start_date=datetime(2024, 3, 2, 9), end_date=datetime(2024, 3, 2, 11), contract_id=1)]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _support_ids(db):
+    db.expire_all()
+    return {e.id: e.support_id for e in db.query(Event)}
+
+
+def test_auto_assign_support_plans_conflict_free_assignments(db):
+    result = EventBL(db).auto_assign_support(MANAGER)
+    db.commit()
+
+    # Event 3 overlaps both supports, Alex still has two hours of events against four for Sam
+    assert result.assignments == {2: 8, 4: 8}
+    assert result.unassigned == [3]
+    assert _support_ids(db) == {1: 7, 2: 8, 3: None, 4: 8}
+
+
+def test_auto_assign_support_dry_run_writes_nothing(db):
+    result = EventBL(db).auto_assign_support(MANAGER, dry_run=True)
+
+    assert result.assignments == {2: 8, 4: 8}
+    assert _support_ids(db) == {1: 7, 2: None, 3: None, 4: None}
+
+
+def test_auto_assign_support_without_supports(db):
+    db.query(Collaborator).filter(Collaborator.role_id == 1).update({"role_id": 2})
+
+    result = EventBL(db).auto_assign_support(MANAGER)
+
+    assert result.assignments == {}
+    assert result.unassigned == [2, 3, 4]
+
+
+@pytest.mark.parametrize("role", ["support", "commercial"])
+def test_auto_assign_support_is_reserved_to_management(db, role):
+    with pytest.raises(PermissionError):
+        EventBL(db).auto_assign_support({"id": 7, "role": role})
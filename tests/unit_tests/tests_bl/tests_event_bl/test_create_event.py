@@ -33,6 +33,7 @@ def test_create_event_as_commercial(event_bl, current_user_commercial):
     """Test creating an event as a valid commercial user."""
     contract_dal = MagicMock(spec=ContractDAL)
     collaborator_dal = MagicMock(spec=CollaboratorDAL)
+    collaborator_dal.get_role_name.return_value = "commercial"
     event_dal = MagicMock(spec=EventDAL)
 
     event_bl.contract_dal = contract_dal
@@ -109,6 +110,7 @@ def test_create_event_for_unowned_contract(event_bl, current_user_commercial):
     """Test creating an event for a contract not owned by the commercial raises PermissionError."""
     contract_dal = MagicMock(spec=ContractDAL)
     collaborator_dal = MagicMock(spec=CollaboratorDAL)
+    collaborator_dal.get_role_name.return_value = "commercial"
     event_bl.contract_dal = contract_dal
     event_bl.collaborator_dal = collaborator_dal
 
@@ -126,3 +128,17 @@ def test_create_event_for_unowned_contract(event_bl, current_user_commercial):
 
     contract_dal.get.assert_called_once_with(1)
     collaborator_dal.get_by_email_raw.assert_called_once_with("test@example.com")
+
+
+def test_create_event_rejects_an_end_before_the_start(event_bl, current_user_commercial):
+    event_bl.contract_dal = MagicMock(spec=ContractDAL)
+    event_bl.collaborator_dal = MagicMock(spec=CollaboratorDAL)
+    event_bl.collaborator_dal.get_role_name.return_value = "commercial"
+    event_bl.dal = MagicMock(spec=EventDAL)
+    event_bl.contract_dal.get.return_value = MagicMock(status=True, commercial_id=1)
+    event_bl.collaborator_dal.get_by_email_raw.return_value = MagicMock(id=1)
+
+    with pytest.raises(ValueError, match="date de fin"):
+        event_bl.create_event({"contract_id": 1, "start_date": "2023-11-02", "end_date": "2023-11-01"},
+                              current_user_commercial)
+    event_bl.dal.create.assert_not_called()
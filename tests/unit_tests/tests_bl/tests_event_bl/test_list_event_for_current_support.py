@@ -54,6 +54,7 @@ def test_list_events_for_current_support_valid_user(
 ):
     """Test retrieving events for a current support user."""
     mock_collaborator_dal.return_value.get_by_email_raw.return_value = MagicMock(id=10)
+    mock_collaborator_dal.return_value.get_role_name.return_value = "support"
     mock_event_dal.return_value.get_by_support_id.return_value = mock_events_data
     event_bl = EventBL(db_session)
 
@@ -89,3 +90,20 @@ def test_list_events_for_current_support_no_associated_user(
         event_bl.list_events_for_current_support(mock_current_user_support)
 
     mock_collaborator_dal.return_value.get_by_email_raw.assert_called_once_with(mock_current_user_support["sub"])
+
+
+@patch("bl.event_bl.CollaboratorDAL")
+@patch("bl.event_bl.EventDAL")
+def test_list_events_for_current_support_uses_token_id(
+        mock_event_dal, mock_collaborator_dal, db_session, mock_events_data
+):
+    """Test that a token carrying the collaborator id does not trigger a lookup."""
+    mock_collaborator_dal.return_value.get_role_name.return_value = "support"
+    mock_event_dal.return_value.get_by_support_id.return_value = mock_events_data
+    event_bl = EventBL(db_session)
+
+    events = event_bl.list_events_for_current_support({"id": 10, "sub": "support_user@test.com", "role": "support"})
+
+    mock_collaborator_dal.return_value.get_by_email_raw.assert_not_called()
+    mock_event_dal.return_value.get_by_support_id.assert_called_once_with(10)
+    assert events == mock_events_data
@@ -0,0 +1,137 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from bl.event_bl import EventBL, SchedulingConflictError
+from dal.collaborator_dal import CollaboratorDAL
+from dal.event_dal import EventDAL
+from dtos.collaborator_dto import CollaboratorDTO
+from dtos.event_dto import EventDTO
+from sqlalchemy.orm import Session
+
+MANAGER = {"id": 1, "role": "gestion"}
+
+
+def _event(event_id, start_hour, end_hour, support_id=None, day=1):
+    return EventDTO(id=event_id, start_date=datetime(2024, 3, day, start_hour),
+                    end_date=datetime(2024, 3, day, end_hour), location="Paris", attendees=10, note=None,
+                    contract_id=1, support_id=support_id)
+
+
+@pytest.fixture
+def event_bl():
+    bl = EventBL(MagicMock(spec=Session))
+    bl.dal = MagicMock(spec=EventDAL)
+    bl.collaborator_dal = MagicMock(spec=CollaboratorDAL)
+    # Schedule of the support #7
+    bl.dal.get_by_support_id.return_value = [_event(1, 9, 12, 7), _event(2, 14, 18, 7)]
+    bl.collaborator_dal.get_by_id.return_value = CollaboratorDTO(id=7, name="Sam", email="s@e.fr",
+                                                                 role_name="support")
+    return bl
+
+
+def test_update_event_rejects_an_overlapping_support(event_bl):
+    event_bl.dal.get.return_value = _event(3, 11, 15)
+
+    event_bl.dal.find_overlapping.return_value = [1, 2]
+
+    with pytest.raises(SchedulingConflictError, match="#1, #2") as error:
+        event_bl.update_event(3, {"support_id": 7}, MANAGER)
+
+    assert error.value.conflicts == [1, 2]
+    # A single slot is checked with one query, without loading the schedule
+    event_bl.dal.find_overlapping.assert_called_once_with(7, datetime(2024, 3, 1, 11), datetime(2024, 3, 1, 15),
+                                                          exclude_event_id=3)
+    event_bl.dal.get_by_support_id.assert_not_called()
+    event_bl.dal.update_by_id.assert_not_called()
+
+
+def test_update_event_can_force_a_conflict(event_bl):
+    event_bl.dal.get.return_value = _event(3, 11, 15)
+    event_bl.dal.update_by_id.return_value = _event(3, 11, 15, 7)
+
+    event_bl.update_event(3, {"support_id": 7}, MANAGER, allow_conflicts=True)
+
+    event_bl.dal.update_by_id.assert_called_once_with(3, {"support_id": 7})
+
+
+def test_update_event_accepts_a_free_slot(event_bl):
+    event_bl.dal.get.return_value = _event(3, 12, 14)
+    event_bl.dal.update_by_id.return_value = _event(3, 12, 14, 7)
+    event_bl.dal.find_overlapping.return_value = []
+
+    event_bl.update_event(3, {"support_id": 7}, MANAGER)
+
+    event_bl.dal.update_by_id.assert_called_once_with(3, {"support_id": 7})
+
+
+def test_support_moving_its_own_event_ignores_the_event_itself(event_bl):
+    event_bl.dal.get.return_value = _event(1, 9, 12, 7)
+    event_bl.dal.update_by_id.return_value = _event(1, 10, 13, 7)
+    event_bl.dal.find_overlapping.return_value = []
+
+    event_bl.update_event(1, {"start_date": datetime(2024, 3, 1, 10), "end_date": datetime(2024, 3, 1, 13)},
+                          {"id": 7, "role": "support"})
+
+    assert event_bl.dal.find_overlapping.call_args.kwargs == {"exclude_event_id": 1}
+    event_bl.dal.update_by_id.assert_called_once()
+
+
+def test_update_event_rejects_reversed_dates(event_bl):
+    event_bl.dal.get.return_value = _event(3, 9, 12)
+
+    with pytest.raises(ValueError, match="date de fin"):
+        event_bl.update_event(3, {"end_date": datetime(2024, 3, 1, 8)}, MANAGER)
+
+
+def test_update_event_skips_the_schedule_for_other_fields(event_bl):
+    event_bl.dal.get.return_value = _event(3, 11, 15, 7)
+    event_bl.dal.update_by_id.return_value = _event(3, 11, 15, 7)
+
+    event_bl.update_event(3, {"location": "Lyon"}, MANAGER)
+
+    event_bl.dal.find_overlapping.assert_not_called()
+
+
+def test_assign_support_rejects_events_overlapping_the_schedule(event_bl):
+    event_bl.dal.get_by_ids.return_value = [_event(3, 12, 14), _event(4, 17, 19)]
+
+    with pytest.raises(SchedulingConflictError) as error:
+        event_bl.assign_support([3, 4], 7, MANAGER)
+
+    assert error.value.conflicts == [2]
+    event_bl.dal.update_many.assert_not_called()
+
+
+def test_assign_support_rejects_overlapping_events_in_the_batch(event_bl):
+    event_bl.dal.get_by_ids.return_value = [_event(3, 12, 14, day=2), _event(4, 13, 15, day=2)]
+
+    with pytest.raises(SchedulingConflictError) as error:
+        event_bl.assign_support([3, 4], 7, MANAGER)
+
+    assert error.value.conflicts == [3, 4]
+
+
+def test_assign_support_ignores_events_of_the_batch_already_assigned(event_bl):
+    event_bl.dal.get_by_ids.return_value = [_event(1, 9, 12, 7), _event(3, 12, 14)]
+    event_bl.dal.update_many.return_value = 2
+
+    assert event_bl.assign_support([1, 3], 7, MANAGER) == 2
+
+
+def test_find_free_supports(event_bl):
+    start, end = datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 12)
+
+    event_bl.find_free_supports(start, end, MANAGER)
+
+    event_bl.collaborator_dal.get_available.assert_called_once_with("support", start, end)
+
+
+def test_find_free_supports_is_reserved_to_management(event_bl):
+    with pytest.raises(PermissionError):
+        event_bl.find_free_supports(datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 12), {"id": 7, "role": "support"})
+
+
+def test_find_free_supports_rejects_an_empty_slot(event_bl):
+    with pytest.raises(ValueError):
+        event_bl.find_free_supports(datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 9), MANAGER)
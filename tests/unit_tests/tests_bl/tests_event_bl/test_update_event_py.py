@@ -24,7 +24,9 @@ def event_dal(db_session):
 @pytest.fixture
 def collaborator_dal(db_session):
     """Fixture to provide a mocked CollaboratorDAL."""
-    return MagicMock(spec=CollaboratorDAL)
+    collaborator_dal = MagicMock(spec=CollaboratorDAL)
+    collaborator_dal.get_role_name.return_value = "support"
+    return collaborator_dal
 
 
 @pytest.fixture
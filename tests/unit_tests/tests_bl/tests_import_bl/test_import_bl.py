@@ -0,0 +1,134 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from bl.import_bl import ImportBL
+from models import Client, Collaborator, Contract, Event, Role
+
+COMMERCIAL = {"id": 1, "sub": "com@epicevents.fr", "email": "com@epicevents.fr", "role": "commercial"}
+GESTION = {"id": 3, "sub": "gestion@epicevents.fr", "email": "gestion@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all([
+        Role(id=1, name="commercial"),
+        Role(id=2, name="gestion"),
+        Collaborator(id=1, name="Com", email="com@epicevents.fr", password="x", role_id=1),
+        Collaborator(id=2, name="Other", email="other@epicevents.fr", password="x", role_id=1),
+        Collaborator(id=3, name="Gestion", email="gestion@epicevents.fr", password="x", role_id=2),
+        Client(id=1, name="Mine", email="mine@example.com", commercial_id=1, creation_date=date(2024, 1, 1)),
+        Client(id=2, name="Theirs", email="theirs@example.com", commercial_id=2, creation_date=date(2024, 1, 1)),
+        Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True,
+                 client_id=1, commercial_id=1),
+        Contract(id=2, total_amount=100, amount_left=100, creation_date=date(2024, 1, 1), status=False,
+                 client_id=1, commercial_id=1),
+        Contract(id=3, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True,
+                 client_id=2, commercial_id=2),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def _errors(result):
+    return {row.line: row.error for row in result.rejected}
+
+
+def test_import_clients(db):
+    rows = [
+        (2, {"name": "New", "email": "new@example.com", "phone": "", "creation_date": "2024-03-01"}),
+        (3, {"name": "Dup", "email": "mine@example.com"}),
+        (4, {"name": "Twice", "email": "new@example.com"}),
+        (5, {"name": "", "email": "noname@example.com"}),
+        (6, None),
+    ]
+
+    result = ImportBL(db).import_clients(rows, COMMERCIAL)
+
+    assert result.inserted == 1
+    assert _errors(result) == {
+        3: "Un client avec cet email existe déjà.",
+        4: "Un client avec cet email existe déjà.",
+        5: "Le champ 'name' est requis.",
+        6: "Ligne illisible.",
+    }
+    client = db.query(Client).filter_by(email="new@example.com").one()
+    assert (client.commercial_id, client.phone, client.creation_date) == (1, None, date(2024, 3, 1))
+
+
+def test_import_clients_requires_commercial(db):
+    with pytest.raises(PermissionError):
+        ImportBL(db).import_clients([(2, {"name": "New", "email": "new@example.com"})], GESTION)
+
+
+def test_import_contracts_as_commercial(db):
+    rows = [
+        (2, {"client_id": "1", "total_amount": "500", "amount_left": "200", "status": "oui"}),
+        (3, {"client_id": "2", "total_amount": "500", "amount_left": "200"}),
+        (4, {"client_id": "9", "total_amount": "500", "amount_left": "200"}),
+        (5, {"client_id": "1", "total_amount": "500", "amount_left": "900"}),
+        (6, {"client_id": "1", "total_amount": "abc", "amount_left": "0"}),
+    ]
+
+    result = ImportBL(db).import_contracts(rows, COMMERCIAL)
+
+    assert result.inserted == 1
+    assert _errors(result) == {
+        3: "Vous ne pouvez créer des contrats que pour vos propres clients.",
+        4: "Client introuvable.",
+        5: "Le montant restant doit être compris entre 0 et le montant total.",
+        6: "Le champ 'total_amount' doit être un montant.",
+    }
+    contract = db.query(Contract).order_by(Contract.id.desc()).first()
+    assert (contract.client_id, contract.commercial_id, contract.status) == (1, 1, True)
+    assert Decimal(contract.amount_left) == 200
+
+
+def test_import_contracts_as_gestion_defaults_to_client_commercial(db):
+    result = ImportBL(db).import_contracts([(2, {"client_id": 2, "total_amount": 10, "amount_left": 0})], GESTION)
+
+    assert result.inserted == 1
+    assert db.query(Contract).order_by(Contract.id.desc()).first().commercial_id == 2
+
+
+def test_import_contracts_rejects_unknown_commercials(db):
+    rows = [
+        (2, {"client_id": 1, "commercial_id": 2, "total_amount": 10, "amount_left": 0}),
+        (3, {"client_id": 1, "commercial_id": 99, "total_amount": 10, "amount_left": 0}),
+        (4, {"client_id": 1, "commercial_id": "abc", "total_amount": 10, "amount_left": 0}),
+    ]
+
+    result = ImportBL(db).import_contracts(rows, GESTION)
+
+    assert result.inserted == 1
+    assert _errors(result) == {
+        3: "Commercial introuvable.",
+        4: "Le champ 'commercial_id' doit être un entier.",
+    }
+    assert db.query(Contract).order_by(Contract.id.desc()).first().commercial_id == 2
+
+
+def test_import_events(db):
+    rows = [
+        (2, {"contract_id": "1", "start_date": "2025-06-01 10:00", "end_date": "2025-06-01 12:00",
+             "location": "Paris", "attendees": "30"}),
+        (3, {"contract_id": "2", "start_date": "2025-06-01 10:00", "end_date": "2025-06-01 12:00"}),
+        (4, {"contract_id": "3", "start_date": "2025-06-01 10:00", "end_date": "2025-06-01 12:00"}),
+        (5, {"contract_id": "1", "start_date": "2025-06-01 10:00", "end_date": "2025-05-01 12:00"}),
+        (6, {"contract_id": "1", "start_date": "demain", "end_date": "2025-06-01 12:00"}),
+    ]
+
+    result = ImportBL(db).import_events(rows, COMMERCIAL)
+
+    assert result.inserted == 1
+    assert _errors(result) == {
+        3: "Impossible de créer un évènement pour un contrat non signé.",
+        4: "Vous ne pouvez créer un évènement que pour vos propres contrats.",
+        5: "La date de fin doit être postérieure à la date de début.",
+        6: "Le champ 'start_date' doit être une date AAAA-MM-JJ HH:MM.",
+    }
+    event = db.query(Event).one()
+    assert (event.start_date, event.attendees, event.support_id) == (datetime(2025, 6, 1, 10), 30, None)
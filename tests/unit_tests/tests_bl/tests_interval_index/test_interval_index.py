@@ -0,0 +1,68 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from bl.interval_index import IntervalIndex
+
+DAY = datetime(2024, 3, 1)
+
+
+def _at(hours):
+    return DAY + timedelta(hours=hours)
+
+
+def _brute_force(intervals, start, end, exclude=None):
+    return sorted((s, e, key) for s, e, key in intervals if s < end and e > start and key != exclude)
+
+
+def test_intervals_are_half_open():
+    index = IntervalIndex([(_at(9), _at(12), 1)])
+
+    assert index.overlaps(_at(11), _at(14))
+    assert not index.overlaps(_at(12), _at(14))
+    assert not index.overlaps(_at(6), _at(9))
+
+
+def test_find_returns_the_overlapping_keys_by_start():
+    index = IntervalIndex([(_at(14), _at(16), 3), (_at(0), _at(48), 1), (_at(9), _at(10), 2)])
+
+    assert index.find(_at(9), _at(15)) == [1, 2, 3]
+    assert index.find(_at(9), _at(15), exclude=1) == [2, 3]
+    assert not index.overlaps(_at(10), _at(14), exclude=1)
+
+
+def test_add_and_remove_keep_the_index_consistent():
+    index = IntervalIndex([(_at(0), _at(2), 1)])
+    index.add(_at(20), _at(30), 2)
+    index.add(_at(1), _at(25), 3)
+
+    assert index.find(_at(22), _at(23)) == [3, 2]
+    assert index.remove(3)
+    assert not index.remove(3)
+    assert index.find(_at(22), _at(23)) == [2]
+    assert not index.overlaps(_at(3), _at(20))
+    assert len(index) == 2
+
+
+def test_add_rejects_reversed_intervals():
+    with pytest.raises(ValueError):
+        IntervalIndex().add(_at(2), _at(1), 1)
+
+
+def test_matches_brute_force_on_random_intervals():
+    rng = random.Random(7)
+    intervals = []
+    index = IntervalIndex()
+    for key in range(300):
+        start = rng.randrange(1000)
+        interval = (_at(start), _at(start + rng.randrange(1, 50)), key)
+        intervals.append(interval)
+        index.add(*interval)
+
+    for _ in range(300):
+        start = rng.randrange(1000)
+        end = start + rng.randrange(1, 30)
+        exclude = rng.choice([None, rng.randrange(300)])
+        expected = _brute_force(intervals, _at(start), _at(end), exclude)
+        assert sorted(index.find(_at(start), _at(end), exclude)) == sorted(key for _, _, key in expected)
+        assert index.overlaps(_at(start), _at(end), exclude) == bool(expected)
@@ -0,0 +1,58 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from bl.report_bl import ReportBL
+from dal.report_dal import ReportDAL
+from sqlalchemy.orm import Session
+
+MANAGER = {"id": 1, "role": "gestion"}
+
+
+@pytest.fixture
+def report_bl():
+    bl = ReportBL(MagicMock(spec=Session))
+    bl.dal = MagicMock(spec=ReportDAL)
+    return bl
+
+
+def test_contract_summary_returns_the_rows_and_the_totals(report_bl):
+    rows, totals = report_bl.contract_summary(MANAGER)
+
+    assert rows is report_bl.dal.contracts_by_commercial.return_value
+    assert totals is report_bl.dal.contract_totals.return_value
+
+
+def test_events_per_support_of_a_year(report_bl):
+    report_bl.events_per_support(MANAGER, year=2024)
+
+    report_bl.dal.events_by_support_month.assert_called_once_with(datetime(2024, 1, 1), datetime(2025, 1, 1))
+
+
+def test_events_per_support_of_all_years(report_bl):
+    report_bl.events_per_support(MANAGER)
+
+    report_bl.dal.events_by_support_month.assert_called_once_with()
+
+
+def test_inactive_clients_computes_the_cutoff_date(report_bl):
+    report_bl.inactive_clients(MANAGER, days=30, today=date(2024, 3, 31))
+
+    report_bl.dal.inactive_clients_by_commercial.assert_called_once_with(date(2024, 3, 1))
+
+
+def test_inactive_clients_rejects_negative_days(report_bl):
+    with pytest.raises(ValueError):
+        report_bl.inactive_clients(MANAGER, days=-1)
+
+
+@pytest.mark.parametrize("call", [
+    lambda bl, user: bl.contract_summary(user),
+    lambda bl, user: bl.events_per_support(user),
+    lambda bl, user: bl.inactive_clients(user),
+])
+@pytest.mark.parametrize("role", ["commercial", "support"])
+def test_reports_are_reserved_to_management(report_bl, call, role):
+    with pytest.raises(PermissionError):
+        call(report_bl, {"id": 2, "role": role})
+    assert not report_bl.dal.method_calls
@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timedelta
+
+from bl.interval_index import IntervalIndex
+from bl.support_scheduler import plan_assignments
+
+DAY = datetime(2024, 3, 1)
+
+
+def _at(hours):
+    return DAY + timedelta(hours=hours)
+
+
+def test_events_go_to_the_least_loaded_free_support():
+    schedules = {1: IntervalIndex(), 2: IntervalIndex()}
+
+    plan = plan_assignments([(_at(0), _at(4), 10), (_at(1), _at(2), 11), (_at(5), _at(6), 12)], schedules,
+                            {1: 0, 2: 0})
+
+    # Event 12 goes to support 2, which has one hour of events against four
+    assert plan == {10: 1, 11: 2, 12: 2}
+
+
+def test_existing_events_of_the_supports_are_respected():
+    schedules = {1: IntervalIndex([(_at(0), _at(10), 1)]), 2: IntervalIndex()}
+
+    plan = plan_assignments([(_at(2), _at(3), 10), (_at(2), _at(3), 11)], schedules, {1: 0, 2: 36_000})
+
+    assert plan == {10: 2}
+
+
+def test_adjacent_events_can_share_a_support():
+    plan = plan_assignments([(_at(0), _at(2), 10), (_at(2), _at(4), 11)], {1: IntervalIndex()}, {1: 0})
+
+    assert plan == {10: 1, 11: 1}
+
+
+def test_empty_events_cover_no_time():
+    # Like an empty tsrange, an event ending when it starts overlaps neither planned nor existing events
+    planned = plan_assignments([(_at(2), _at(6), 10), (_at(3), _at(3), 11)], {1: IntervalIndex()}, {1: 0})
+    existing = plan_assignments([(_at(3), _at(3), 12)], {1: IntervalIndex([(_at(0), _at(10), 1)])}, {1: 0})
+
+    assert planned == {10: 1, 11: 1}
+    assert existing == {12: 1}
+
+
+def test_plan_is_conflict_free_and_balanced():
+    rng = random.Random(3)
+    events = []
+    for event_id in range(2000):
+        start = rng.randrange(5000)
+        events.append((_at(start), _at(start + rng.randrange(1, 24)), event_id))
+    supports = range(1, 21)
+
+    plan = plan_assignments(events, {s: IntervalIndex() for s in supports}, dict.fromkeys(supports, 0))
+
+    by_support = {s: sorted(e for e in events if plan.get(e[2]) == s) for s in supports}
+    for planned in by_support.values():
+        assert all(previous[1] <= current[0] for previous, current in zip(planned, planned[1:]))
+    hours = [sum((end - start) / timedelta(hours=1) for start, end, _ in planned) for planned in by_support.values()]
+    assert max(hours) - min(hours) <= 24
+    # An event is only left out when every support is busy on its slot
+    for start, end, event_id in events:
+        if event_id not in plan:
+            assert all(any(s < end and e > start for s, e, _ in planned) for planned in by_support.values())
@@ -5,8 +5,8 @@ from cli.auth_commands import login
 
 
 def test_login_success(mocker):
-    mock_session = mocker.patch("cli.auth_commands.Session")
-    mock_authenticate = mocker.patch("cli.auth_commands.authenticate_collaborator")
+    mock_session = mocker.patch("db.session.SessionLocal")
+    mock_authenticate = mocker.patch("security.auth_service.authenticate_collaborator")
     mock_create_token = mocker.patch("cli.auth_commands.create_access_token")
     mock_save_token = mocker.patch("cli.auth_commands.save_token")
 
@@ -27,8 +27,8 @@ def test_login_success(mocker):
 
 
 def test_login_invalid_credentials(mocker):
-    mock_session = mocker.patch("cli.auth_commands.Session")
-    mock_authenticate = mocker.patch("cli.auth_commands.authenticate_collaborator")
+    mock_session = mocker.patch("db.session.SessionLocal")
+    mock_authenticate = mocker.patch("security.auth_service.authenticate_collaborator")
     mock_create_token = mocker.patch("cli.auth_commands.create_access_token")
 
     db_mock = Mock()
@@ -46,8 +46,8 @@ def test_login_invalid_credentials(mocker):
 
 
 def test_login_token_save_failure(mocker):
-    mock_session = mocker.patch("cli.auth_commands.Session")
-    mock_authenticate = mocker.patch("cli.auth_commands.authenticate_collaborator")
+    mock_session = mocker.patch("db.session.SessionLocal")
+    mock_authenticate = mocker.patch("security.auth_service.authenticate_collaborator")
     mock_create_token = mocker.patch("cli.auth_commands.create_access_token")
     mock_save_token = mocker.patch("cli.auth_commands.save_token", side_effect=Exception("Token save failed"))
 
@@ -52,4 +52,20 @@ def test_list_clients_failure(token_patches):
 
         list_clients.callback()
 
-        mock_echo.assert_called_once_with("Erreur : Database error")
\ No newline at end of file
+        mock_echo.assert_called_once_with("Erreur : Database error")
+
+def test_list_clients_paginated(token_patches):
+    client1 = SimpleNamespace(id=1, name="Client One", email="client1@example.com", company="Company A")
+
+    with patch("cli.client_commands.Session"), \
+         patch("cli.client_commands.ClientBLL") as mock_bll, \
+         patch("click.echo") as mock_echo:
+
+        mock_bll.return_value.get_clients_page.return_value = SimpleNamespace(items=[client1], next_cursor=1)
+
+        list_clients.callback(limit=1, after=None)
+
+        mock_bll.return_value.get_clients_page.assert_called_once_with(after=None, limit=1)
+        mock_bll.return_value.get_all_clients.assert_not_called()
+        mock_echo.assert_any_call("Client One - client1@example.com | Company A | Id : 1")
+        mock_echo.assert_any_call("Page suivante : --after 1")
@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli import client_commands as cc
+
+
+@pytest.fixture
+def sessions():
+    # Sessions opened by the command, with the number still open at each prompt
+    opened = []
+
+    def factory():
+        session = MagicMock()
+        opened.append(session)
+        return session
+
+    with patch("cli.client_commands.Session", side_effect=factory):
+        yield opened
+
+
+@pytest.fixture
+def bl_mock():
+    with patch("cli.client_commands.ClientBLL") as bl_cls:
+        bl_cls.return_value.get_client.return_value = MagicMock(name="client", phone="", company="")
+        yield bl_cls.return_value
+
+
+def _invoke(args):
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value={"id": 2, "role": "commercial"}):
+        return CliRunner().invoke(cc.update_client, args)
+
+
+def test_prompts_run_outside_any_transaction(sessions, bl_mock):
+    open_at_prompt = []
+
+    def prompt(*args, **kwargs):
+        open_at_prompt.append(sum(not s.close.called for s in sessions))
+        return "value"
+
+    with patch("cli.client_commands.click.prompt", side_effect=prompt):
+        result = _invoke(["1"])
+
+    assert result.exit_code == 0
+    assert open_at_prompt == [0, 0, 0, 0]
+    # One unit of work to read, one to write
+    assert len(sessions) == 2
+    bl_mock.update_client.assert_called_once()
+
+
+def test_failed_update_is_rolled_back(sessions, bl_mock):
+    bl_mock.update_client.side_effect = ValueError("Email déjà utilisé.")
+
+    result = _invoke(["1", "--name", "N", "--email", "e@x.fr", "--phone", "01", "--company", "C"])
+
+    assert "Erreur : Email déjà utilisé." in result.output
+    sessions[-1].rollback.assert_called()
@@ -0,0 +1,112 @@
+import io
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import click
+import pytest
+from cli.daemon import DaemonServer, _CommandHandler
+from cli.daemon_client import forward_to_daemon
+
+
+@pytest.fixture
+def root():
+    @click.group()
+    def root():
+        pass
+
+    @root.command("whoami")
+    def whoami():
+        click.echo("admin@epicevents.fr")
+
+    @root.command("login")
+    def login():
+        click.prompt("Email")
+
+    return root
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return Path(tmp_path) / "d.sock"
+
+
+@pytest.fixture
+def daemon(root, socket_path):
+    server = DaemonServer(socket_path, root)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def tty_stdin(monkeypatch):
+    stdin = io.StringIO()
+    stdin.isatty = lambda: True
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.delenv("EPICEVENTS_NO_DAEMON", raising=False)
+
+
+def test_forward_runs_command_in_daemon(daemon, socket_path, tty_stdin, capsys):
+    exit_code = forward_to_daemon(["whoami"], socket_path)
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == "admin@epicevents.fr\n"
+
+
+def test_forward_falls_back_for_interactive_commands(daemon, socket_path, tty_stdin):
+    assert forward_to_daemon(["login"], socket_path) is None
+
+
+@pytest.mark.parametrize("argv", [["whoami"], ["login"]])
+def test_forward_never_reads_piped_stdin(daemon, socket_path, monkeypatch, argv):
+    # A pipe that stays open, as under cron or in a `while read` loop
+    stdin = io.StringIO("1\n2\n")
+    stdin.isatty = lambda: False
+    stdin.read = stdin.readline = lambda *args: pytest.fail("stdin was read")
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.delenv("EPICEVENTS_NO_DAEMON", raising=False)
+
+    forward_to_daemon(argv, socket_path)
+
+    assert stdin.tell() == 0
+
+
+def test_forward_without_daemon(socket_path, tty_stdin):
+    assert forward_to_daemon(["whoami"], socket_path) is None
+
+
+def test_forward_disabled_by_environment(daemon, socket_path, tty_stdin, monkeypatch):
+    monkeypatch.setenv("EPICEVENTS_NO_DAEMON", "1")
+
+    assert forward_to_daemon(["whoami"], socket_path) is None
+
+
+def test_stale_socket_is_replaced(root, socket_path):
+    socket_path.touch()
+
+    server = DaemonServer(socket_path, root)
+    server.server_close()
+
+    assert not socket_path.exists()
+
+
+def test_second_daemon_is_refused(daemon, root, socket_path):
+    with pytest.raises(click.ClickException):
+        DaemonServer(socket_path, root)
+
+
+class _ClosedStream:
+    def write(self, data):
+        raise BrokenPipeError
+
+
+def test_disconnected_client_does_not_break_the_daemon(root):
+    # The client sent its request and left before reading the answer
+    handler = SimpleNamespace(rfile=io.BytesIO(b'{"argv": ["whoami"]}\n'), wfile=_ClosedStream(),
+                              server=SimpleNamespace(root=root))
+
+    _CommandHandler.handle(handler)
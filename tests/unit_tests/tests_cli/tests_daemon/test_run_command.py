@@ -0,0 +1,141 @@
+import os
+
+import click
+import pytest
+from click.testing import CliRunner
+from cli.daemon import _ForwardedInput, run_command
+
+
+@pytest.fixture
+def root():
+    @click.group()
+    def root():
+        pass
+
+    @root.command("hello")
+    @click.option("--name", default="world")
+    def hello(name):
+        click.echo(f"hello {name}")
+
+    @root.command("ask")
+    def ask():
+        value = click.prompt("Valeur")
+        click.echo(f"reçu {value}")
+
+    @root.command("fail")
+    def fail():
+        raise click.ClickException("Vous devez vous connecter.")
+
+    @root.group("export")
+    def export():
+        pass
+
+    @export.command("clients")
+    @click.option("--output", "-o", type=click.Path(), default=None)
+    @click.option("--compress", default=None)
+    def export_clients(output, compress):
+        with click.open_file(output or "-", "wb") as f:
+            f.write(b"\x1f\x8b\xff")
+
+    @root.command("crash")
+    def crash():
+        raise RuntimeError("boom")
+
+    return root
+
+
+def test_run_command_captures_output(root):
+    assert run_command(root, ["hello", "--name", "Ansi"]) == {
+        "output": "hello Ansi\n", "exit_code": 0, "fallback": False
+    }
+
+
+def test_run_command_falls_back_for_prompts(root):
+    assert run_command(root, ["ask"])["fallback"] is True
+
+
+def test_run_command_falls_back_when_stdin_is_read(root):
+    @root.command("cat")
+    def cat():
+        click.echo(click.get_text_stream("stdin").read())
+
+    assert run_command(root, ["cat"])["fallback"] is True
+
+
+def test_run_command_reports_click_errors(root):
+    response = run_command(root, ["fail"])
+
+    assert response["output"] == "Error: Vous devez vous connecter.\n"
+    assert response["exit_code"] == 1
+
+
+def test_run_command_reports_unexpected_errors(root, mocker):
+    mocker.patch("cli.daemon.sentry_sdk.capture_exception")
+
+    response = run_command(root, ["crash"])
+
+    assert response["output"] == "Erreur : boom\n"
+    assert response["exit_code"] == 1
+
+
+@pytest.mark.parametrize("argv", [
+    ["export", "clients"],
+    ["export", "clients", "--compress", "gzip"],
+])
+def test_run_command_falls_back_for_exports_to_stdout(root, argv):
+    assert run_command(root, argv)["fallback"] is True
+
+
+def test_run_command_runs_exports_to_a_file(root, tmp_path):
+    response = run_command(root, ["export", "clients", "-o", "clients.csv.gz"], cwd=str(tmp_path))
+
+    assert response == {"output": "", "exit_code": 0, "fallback": False}
+    assert (tmp_path / "clients.csv.gz").read_bytes() == b"\x1f\x8b\xff"
+
+
+def test_run_command_never_nests_the_daemon(root):
+    assert run_command(root, ["serve"])["fallback"] is True
+
+
+def test_run_command_falls_back_when_the_command_swallows_the_abort(root):
+    @root.command("swallow")
+    def swallow():
+        try:
+            click.prompt("Valeur")
+        except Exception as e:
+            click.echo(f"Erreur : {e}")
+
+    assert run_command(root, ["swallow"])["fallback"] is True
+
+
+def test_forwarded_event_create_falls_back_to_the_terminal(mocker):
+    from cli.event_commands import event_cli
+
+    mocker.patch("cli.auth_decorator.load_token", return_value="token")
+    mocker.patch("cli.auth_decorator.decode_access_token",
+                 return_value={"id": 2, "sub": "commercial@epicevents.fr", "role": "commercial"})
+    mocker.patch("cli.event_commands.Session")
+    root = click.Group("root", commands={"event": event_cli})
+
+    assert run_command(root, ["event", "create"]) == {"output": "", "exit_code": 1, "fallback": True}
+    # The Abort of the prompt is not swallowed by the error handler of the command
+    result = CliRunner().invoke(root, ["event", "create"], input=_ForwardedInput(b""), standalone_mode=False)
+    assert isinstance(result.exception, click.exceptions.Abort)
+
+
+def test_run_command_resolves_relative_paths_in_the_client_directory(root, tmp_path):
+    @root.command("write")
+    @click.argument("path", type=click.Path())
+    def write(path):
+        with open(path, "w") as f:
+            f.write("ok")
+
+    daemon_cwd = os.getcwd()
+
+    assert run_command(root, ["write", "out.txt"], cwd=str(tmp_path))["exit_code"] == 0
+    assert (tmp_path / "out.txt").read_text() == "ok"
+    assert os.getcwd() == daemon_cwd
+
+
+def test_run_command_falls_back_when_the_client_directory_is_missing(root, tmp_path):
+    assert run_command(root, ["hello"], cwd=str(tmp_path / "missing"))["fallback"] is True
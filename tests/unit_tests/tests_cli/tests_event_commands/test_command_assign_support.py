@@ -0,0 +1,92 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli.event_commands import assign_support
+from models import Client, Collaborator, Contract, Event, Role
+
+MANAGER = {"id": 1, "sub": "gestion@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture(autouse=True)
+def session_factory(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all(
+        [Role(id=1, name="support"),
+         Collaborator(id=7, name="Sam", email="sam@epicevents.fr", password="x", role_id=1),
+         Client(id=1, name="Client", email="c@example.com", creation_date=date(2024, 1, 1)),
+         Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1)]
+        + [Event(id=i, start_date=datetime(2024, 2, i, 9), end_date=datetime(2024, 2, i, 18), contract_id=1)
+           for i in range(1, 5)]
+    )
+    session.commit()
+    session.close()
+    with patch("cli.event_commands.Session", sqlite_session_factory):
+        yield sqlite_session_factory
+
+
+def _invoke(args, user=MANAGER):
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=user):
+        return CliRunner().invoke(assign_support, args)
+
+
+def _support_ids(factory):
+    with factory() as session:
+        return {e.id: e.support_id for e in session.query(Event)}
+
+
+def test_assign_support_updates_the_selected_events(session_factory):
+    result = _invoke(["--ids", "1,2", "--ids", "4", "--support-id", "7"])
+
+    assert result.exit_code == 0
+    assert "3 évènement(s) assigné(s) au support #7." in result.output
+    assert _support_ids(session_factory) == {1: 7, 2: 7, 3: None, 4: 7}
+
+
+def test_assign_support_without_support_id_unassigns(session_factory):
+    _invoke(["--ids", "1,2", "--support-id", "7"])
+
+    result = _invoke(["--ids", "2"])
+
+    assert "1 évènement(s) désassigné(s)." in result.output
+    assert _support_ids(session_factory)[2] is None
+
+
+def test_assign_support_reports_unknown_events(session_factory):
+    result = _invoke(["--ids", "1,42", "--support-id", "7"])
+
+    assert "Erreur : Évènements introuvables : 42." in result.output
+    assert _support_ids(session_factory)[1] is None
+
+
+def test_assign_support_is_denied_to_support(session_factory):
+    result = _invoke(["--ids", "1", "--support-id", "7"], user={"id": 7, "sub": "sam@epicevents.fr",
+                                                                "role": "support"})
+
+    assert "Accès refusé" in result.output
+
+
+def test_assign_support_rejects_malformed_ids():
+    result = _invoke(["--ids", "1,abc"])
+
+    assert result.exit_code == 2
+    assert "entiers séparés par des virgules" in result.output
+
+
+def test_assign_support_refuses_overlapping_events_unless_forced(session_factory):
+    with session_factory() as session:
+        session.add(Event(id=5, start_date=datetime(2024, 2, 1, 12), end_date=datetime(2024, 2, 1, 14),
+                          contract_id=1))
+        session.commit()
+
+    result = _invoke(["--ids", "1,5", "--support-id", "7"])
+
+    assert "Erreur : Le support #7 est déjà assigné sur ce créneau : évènement(s) #1, #5." in result.output
+    assert _support_ids(session_factory)[1] is None
+
+    result = _invoke(["--ids", "1,5", "--support-id", "7", "--force"])
+
+    assert "2 évènement(s) assigné(s) au support #7." in result.output
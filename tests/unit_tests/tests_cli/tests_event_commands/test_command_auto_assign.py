@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli.event_commands import auto_assign_support
+from dtos.assignment_dto import AutoAssignmentDTO
+
+MANAGER = {"id": 1, "sub": "gestion@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture
+def bl_mock():
+    with patch("cli.event_commands.Session", MagicMock()), patch("cli.event_commands.EventBL") as bl_cls:
+        yield bl_cls.return_value
+
+
+def _invoke(args=(), user=MANAGER):
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=user):
+        return CliRunner().invoke(auto_assign_support, list(args))
+
+
+def test_auto_assign_reports_the_assignments_per_support(bl_mock):
+    bl_mock.auto_assign_support.return_value = AutoAssignmentDTO(assignments={2: 8, 4: 7, 5: 8}, unassigned=[3])
+
+    result = _invoke()
+
+    assert result.exit_code == 0
+    bl_mock.auto_assign_support.assert_called_once_with(MANAGER, dry_run=False)
+    assert "3 évènement(s) assigné(s)." in result.output
+    assert " - Support #7 : 1 évènement(s)\n - Support #8 : 2 évènement(s)" in result.output
+    assert "1 évènement(s) sans support disponible : 3" in result.output
+
+
+def test_auto_assign_dry_run(bl_mock):
+    bl_mock.auto_assign_support.return_value = AutoAssignmentDTO(assignments={2: 8})
+
+    result = _invoke(["--dry-run"])
+
+    bl_mock.auto_assign_support.assert_called_once_with(MANAGER, dry_run=True)
+    assert "1 évènement(s) seraient assigné(s)." in result.output
+
+
+def test_auto_assign_truncates_the_unassigned_events(bl_mock):
+    bl_mock.auto_assign_support.return_value = AutoAssignmentDTO(unassigned=list(range(1, 31)))
+
+    result = _invoke()
+
+    assert "30 évènement(s) sans support disponible : 1, 2," in result.output
+    assert "20…" in result.output
+
+
+def test_auto_assign_with_nothing_to_assign(bl_mock):
+    bl_mock.auto_assign_support.return_value = AutoAssignmentDTO()
+
+    assert "Tous les événements ont un support assigné." in _invoke().output
+
+
+def test_auto_assign_is_denied_to_support(bl_mock):
+    bl_mock.auto_assign_support.side_effect = PermissionError("Seuls les gestionnaires peuvent assigner un support.")
+
+    result = _invoke(user={"id": 7, "sub": "s@e.fr", "role": "support"})
+
+    assert "Accès refusé : Seuls les gestionnaires" in result.output
@@ -0,0 +1,62 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli.event_commands import list_free_supports
+from models import Client, Collaborator, Contract, Event, Role
+
+MANAGER = {"id": 1, "sub": "gestion@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture(autouse=True)
+def session_factory(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all([
+        Role(id=1, name="support"),
+        Collaborator(id=7, name="Sam", email="sam@epicevents.fr", password="x", role_id=1),
+        Collaborator(id=8, name="Alex", email="alex@epicevents.fr", password="x", role_id=1),
+        Client(id=1, name="Client", email="c@example.com", creation_date=date(2024, 1, 1)),
+        Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1),
+        Event(id=1, start_date=datetime(2024, 2, 1, 9), end_date=datetime(2024, 2, 1, 18), contract_id=1,
+              support_id=7),
+    ])
+    session.commit()
+    session.close()
+    with patch("cli.event_commands.Session", sqlite_session_factory):
+        yield sqlite_session_factory
+
+
+def _invoke(args, user=MANAGER):
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=user):
+        return CliRunner().invoke(list_free_supports, args)
+
+
+def test_free_lists_the_supports_without_event_on_the_slot():
+    result = _invoke(["--start", "2024-02-01 10:00", "--end", "2024-02-01 12:00"])
+
+    assert result.exit_code == 0
+    assert "ID #8 | Alex" in result.output
+    assert "Sam" not in result.output
+
+
+def test_free_reports_when_nobody_is_available():
+    with patch("cli.event_commands.EventBL.find_free_supports", return_value=[]):
+        result = _invoke(["--start", "2024-02-01 10:00", "--end", "2024-02-01 12:00"])
+
+    assert "Aucun support disponible sur ce créneau." in result.output
+
+
+def test_free_is_denied_to_support():
+    result = _invoke(["--start", "2024-02-01 10:00", "--end", "2024-02-01 12:00"],
+                     user={"id": 7, "sub": "sam@epicevents.fr", "role": "support"})
+
+    assert "Accès refusé" in result.output
+
+
+def test_free_rejects_malformed_dates():
+    result = _invoke(["--start", "2024-02-01", "--end", "2024-02-01 12:00"])
+
+    assert "Erreur" in result.output
@@ -15,7 +15,7 @@ _inner_fn = _outer_cb.__wrapped__
 
 def _bypass_auth(*args, **kwargs):
     # injects a dummy current_user
-    return _inner_fn(current_user={"id": 1, "role": "admin"})
+    return _inner_fn(*args, current_user={"id": 1, "role": "admin"}, **kwargs)
 
 cc.list_all_events.callback = _bypass_auth
 
@@ -119,4 +119,23 @@ def test_list_all_events_error(runner, bl_mock):
     result = runner.invoke(cc.list_all_events, [])
 
     assert result.exit_code == 0
-    assert "Erreur : BDD down" in result.output
\ No newline at end of file
+    assert "Erreur : BDD down" in result.output
+
+def test_list_all_events_last_page(runner, bl_mock):
+    """With --after on the last page, no next cursor is displayed."""
+    e1 = SimpleNamespace(
+        id=7,
+        start_date=datetime(2025, 7, 1, 9, 0),
+        end_date=datetime(2025, 7, 1, 11, 0),
+        location="Salle 1",
+        attendees=10,
+        support_id=None
+    )
+    bl_mock.list_events_page.return_value = SimpleNamespace(items=[e1], next_cursor=None)
+
+    result = runner.invoke(cc.list_all_events, ["--after", "6"])
+
+    assert result.exit_code == 0
+    bl_mock.list_events_page.assert_called_once_with(after=6, limit=50)
+    assert "ID #7" in result.output
+    assert "Page suivante" not in result.output
@@ -256,4 +256,27 @@ def test_unauthorized_user(runner, bl_mock):
 
     assert res.exit_code == 0
     assert "Vous n'avez pas les droits" in res.output
-    bl_mock.update_event.assert_not_called()
\ No newline at end of file
+    bl_mock.update_event.assert_not_called()
+def test_management_confirms_a_scheduling_conflict(runner, bl_mock, patch_session):
+    """
+    A scheduling conflict is confirmed between two units of work: the refused
+    update wrote nothing, and the forced one runs in a new transaction.
+    """
+    evt = SimpleNamespace(id=32, contract_id=8, start_date=datetime.now(), end_date=datetime.now(),
+                          location="Z", attendees=3, note="", support_id=None)
+    bl_mock.get_event.return_value = evt
+    bl_mock.update_event.side_effect = [cc.SchedulingConflictError(5, [12]), SimpleNamespace(id=32)]
+
+    def bypass_mgmt(event_id, *args, **kwargs):
+        return _inner_fn(event_id, current_user={"id": 1, "role": "gestion"})
+    cc.update_event.callback = bypass_mgmt
+
+    with patch("cli.event_commands.click.confirm", side_effect=[True, True]), \
+         patch("cli.event_commands.click.prompt", return_value="5"):
+        res = runner.invoke(cc.update_event, ["32"])
+
+    assert "Conflit de planning : Le support #5 est déjà assigné sur ce créneau : évènement(s) #12." in res.output
+    assert "Événement mis à jour (ID #32)" in res.output
+    assert bl_mock.update_event.call_args.kwargs == {"allow_conflicts": True}
+    # Read, refused update, forced update
+    assert patch_session.call_count == 3
@@ -0,0 +1,173 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli.export_commands import export_clients, export_contracts, export_events
+from cli.export_writers import detect_format, export_rows
+from dtos.contract_batch import ContractBatch
+from dtos.contract_dto import ContractDTO
+from models import Client, Contract, Event
+
+COMMERCIAL = {"id": 1, "sub": "com@epicevents.fr", "role": "commercial"}
+SUPPORT = {"id": 2, "sub": "support@epicevents.fr", "role": "support"}
+
+
+@pytest.fixture(autouse=True)
+def session_factory(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all(
+        [Client(id=i, name=f"Client {i}", email=f"c{i}@example.com", creation_date=date(2024, 1, i))
+         for i in range(1, 6)]
+        + [Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1),
+           Contract(id=2, total_amount=100, amount_left=40, creation_date=date(2024, 1, 1), status=True, client_id=1),
+           Contract(id=3, total_amount=100, amount_left=100, creation_date=date(2024, 1, 1), status=False,
+                    client_id=2)]
+        + [Event(id=1, start_date=datetime(2024, 2, 1, 9), end_date=datetime(2024, 2, 1, 18), contract_id=1,
+                 support_id=None),
+           Event(id=2, start_date=datetime(2024, 2, 2, 9), end_date=datetime(2024, 2, 2, 18), contract_id=1,
+                 support_id=2)]
+    )
+    session.commit()
+    session.close()
+    with patch("cli.export_commands.Session", sqlite_session_factory):
+        yield sqlite_session_factory
+
+
+def _invoke(command, args, user=COMMERCIAL):
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=user):
+        return CliRunner(mix_stderr=False).invoke(command, args)
+
+
+def test_export_clients_csv_to_stdout():
+    result = _invoke(export_clients, ["--chunk-size", "2"])
+
+    rows = list(csv.DictReader(io.StringIO(result.stdout)))
+    assert [row["email"] for row in rows] == [f"c{i}@example.com" for i in range(1, 6)]
+    assert rows[0]["creation_date"] == "2024-01-01"
+    assert "5 lignes exportées." in result.stderr
+
+
+def test_export_unpaid_signed_contracts_jsonl_gzip(tmp_path):
+    output = tmp_path / "contracts.jsonl.gz"
+
+    result = _invoke(export_contracts, ["-o", str(output), "--compress", "gzip", "--signed", "--unpaid"])
+
+    assert result.exit_code == 0
+    with gzip.open(output, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert rows == [{"id": 2, "total_amount": "100.00", "amount_left": "40.00", "creation_date": "2024-01-01",
+                     "status": True, "client_id": 1, "commercial_id": None}]
+
+
+def test_export_contract_filters_keep_bl_permissions():
+    result = _invoke(export_contracts, ["--unpaid"], user=SUPPORT)
+
+    assert result.stdout == ""
+    assert "Erreur : Seuls les commerciaux peuvent filtrer les contrats." in result.stderr
+
+
+def test_export_events_without_support_zstd(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    output = tmp_path / "events.csv.zst"
+
+    _invoke(export_events, ["-o", str(output), "--compress", "zstd", "--without-support"], user=SUPPORT)
+
+    with zstandard.open(output, "rt", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [(row["id"], row["start_date"]) for row in rows] == [("1", "2024-02-01 09:00:00")]
+
+
+def test_export_clients_parquet_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "clients.parquet"
+
+    _invoke(export_clients, ["-o", str(output), "--chunk-size", "2", "--compress", "zstd"])
+
+    parquet = pq.ParquetFile(output)
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("email").to_pylist() == [f"c{i}@example.com" for i in range(1, 6)]
+    assert table.column("last_contact_date").to_pylist() == [None] * 5
+
+
+def test_export_contracts_parquet_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "contracts.parquet"
+
+    result = _invoke(export_contracts, ["-o", str(output), "--chunk-size", "2"])
+
+    assert "3 lignes exportées." in result.stderr
+    parquet = pq.ParquetFile(output)
+    assert parquet.metadata.num_row_groups == 2
+    assert parquet.read().column("amount_left").to_pylist() == [0, 40, 100]
+
+
+LARGE_AMOUNT = Decimal("12345678901234.56")
+
+
+@pytest.fixture
+def amounts():
+    contract = ContractDTO(id=1, total_amount=LARGE_AMOUNT, amount_left=Decimal("0.10"),
+                           creation_date=date(2024, 1, 1), status=True, client_id=1, commercial_id=None)
+    return [contract, ContractBatch.from_rows([contract])]
+
+
+def test_export_keeps_amounts_exact_in_text_formats(tmp_path, amounts):
+    export_rows(amounts, ContractDTO, "jsonl", tmp_path / "contracts.jsonl")
+    export_rows(amounts, ContractDTO, "csv", tmp_path / "contracts.csv")
+
+    jsonl = [json.loads(line) for line in (tmp_path / "contracts.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [(row["total_amount"], row["amount_left"]) for row in jsonl] == [("12345678901234.56", "0.10")] * 2
+    rows = list(csv.DictReader(io.StringIO((tmp_path / "contracts.csv").read_text(encoding="utf-8"))))
+    assert [(row["total_amount"], row["amount_left"]) for row in rows] == [("12345678901234.56", "0.10")] * 2
+
+
+def test_export_keeps_amounts_exact_in_parquet(tmp_path, amounts):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "contracts.parquet"
+
+    export_rows(amounts, ContractDTO, "parquet", output, model=Contract)
+
+    table = pq.read_table(output)
+    assert pa.types.is_decimal(table.schema.field("total_amount").type)
+    assert table.column("total_amount").to_pylist() == [LARGE_AMOUNT] * 2
+    assert table.column("amount_left").to_pylist() == [Decimal("0.10")] * 2
+
+
+def test_export_empty_parquet(tmp_path, session_factory):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "events.parquet"
+    with session_factory() as db:
+        db.query(Event).delete()
+        db.commit()
+
+    result = _invoke(export_events, ["-o", str(output)])
+
+    assert "0 lignes exportées." in result.stderr
+    assert pq.ParquetFile(output).schema_arrow.names[:2] == ["id", "start_date"]
+    assert pq.ParquetFile(output).metadata.num_rows == 0
+
+
+def test_export_filter_permission_is_checked_before_writing(tmp_path):
+    output = tmp_path / "events.csv"
+
+    result = _invoke(export_events, ["-o", str(output), "--without-support"], user=COMMERCIAL)
+
+    assert "Erreur : Seuls les gestionnaires peuvent acceder à cette fonction." in result.stderr
+    assert not output.exists()
+
+
+@pytest.mark.parametrize("path, expected", [
+    (None, "csv"), ("a.jsonl", "jsonl"), ("a.jsonl.gz", "jsonl"), ("a.parquet", "parquet"), ("a.csv.zst", "csv"),
+])
+def test_detect_format(path, expected, tmp_path):
+    assert detect_format(tmp_path / path if path else None) == expected
@@ -0,0 +1,96 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+from cli.import_commands import import_clients
+from cli.import_readers import chunked, detect_format, read_rows
+from dtos.import_result_dto import ImportResultDTO, RejectedRowDTO
+from pathlib import Path
+
+CURRENT_USER = {"id": 1, "sub": "com@epicevents.fr", "role": "commercial"}
+
+
+@pytest.fixture(autouse=True)
+def bypass_auth():
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=CURRENT_USER):
+        yield
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "clients.csv"
+    path.write_text("name,email\nA,a@example.com\nB,b@example.com\nC,c@example.com\n", encoding="utf-8")
+    return path
+
+
+def test_read_rows_csv(csv_file):
+    assert list(read_rows(csv_file, "csv"))[0] == (2, {"name": "A", "email": "a@example.com"})
+
+
+def test_read_rows_jsonl(tmp_path):
+    path = tmp_path / "clients.jsonl"
+    path.write_text('{"name": "A"}\n\nnot json\n', encoding="utf-8")
+
+    assert list(read_rows(path, "jsonl")) == [(1, {"name": "A"}), (3, None)]
+
+
+def test_detect_format():
+    assert detect_format(Path("x.csv")) == "csv"
+    assert detect_format(Path("x.ndjson")) == "jsonl"
+    assert detect_format(Path("x.txt"), "csv") == "csv"
+    with pytest.raises(ValueError):
+        detect_format(Path("x.txt"))
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_import_commits_each_chunk_and_reports_errors(csv_file, tmp_path):
+    errors_path = tmp_path / "errors.jsonl"
+    bl = MagicMock()
+    bl.import_clients.side_effect = [
+        ImportResultDTO(inserted=1, rejected=[RejectedRowDTO(line=3, error="Un client avec cet email existe déjà.",
+                                                             row={"name": "B"})]),
+        ImportResultDTO(inserted=1),
+    ]
+
+    with patch("cli.import_commands.ImportBL", return_value=bl), \
+         patch("cli.import_commands.unit_of_work") as mock_uow:
+        result = CliRunner().invoke(import_clients, [str(csv_file), "--chunk-size", "2", "--errors", str(errors_path)])
+
+    assert result.exit_code == 0
+    assert mock_uow.call_count == 2
+    assert [len(call.args[0]) for call in bl.import_clients.call_args_list] == [2, 1]
+    assert "Lignes importées : 2, rejetées : 1" in result.output
+    assert json.loads(errors_path.read_text()) == {
+        "line": 3, "error": "Un client avec cet email existe déjà.", "row": {"name": "B"}
+    }
+
+
+def test_import_failed_chunk_is_rejected_and_next_chunk_runs(csv_file, tmp_path):
+    bl = MagicMock()
+    bl.import_clients.side_effect = [RuntimeError("connexion perdue"), ImportResultDTO(inserted=1)]
+
+    with patch("cli.import_commands.ImportBL", return_value=bl), \
+         patch("cli.import_commands.unit_of_work"), \
+         patch("cli.import_commands.sentry_sdk.capture_exception"):
+        result = CliRunner().invoke(import_clients, [str(csv_file), "--chunk-size", "2"])
+
+    assert "Lignes importées : 1, rejetées : 2" in result.output
+    report = (tmp_path / "clients.csv.errors.jsonl").read_text().splitlines()
+    assert [json.loads(line)["error"] for line in report] == ["Lot annulé : connexion perdue"] * 2
+
+
+def test_import_stops_on_permission_error(csv_file):
+    bl = MagicMock()
+    bl.import_clients.side_effect = PermissionError("Seuls les commerciaux peuvent importer des clients.")
+
+    with patch("cli.import_commands.ImportBL", return_value=bl), patch("cli.import_commands.unit_of_work"):
+        result = CliRunner().invoke(import_clients, [str(csv_file)])
+
+    assert "Erreur : Seuls les commerciaux peuvent importer des clients." in result.output
+    assert "Lignes importées : 0, rejetées : 0" in result.output
+    assert not (csv_file.parent / "clients.csv.errors.jsonl").exists()
@@ -1,7 +1,7 @@
 import pytest
 from click.testing import CliRunner
 from unittest.mock import MagicMock, patch
-from cli.init_command import init_all
+from cli.init_command import init_all, init_calibrate, init_indexes
 
 @pytest.fixture
 def runner():
@@ -83,4 +83,53 @@ def test_init_all_general_exception_handled(runner):
         result = runner.invoke(init_all)
 
         assert result.exit_code == 0
-        mock_echo.assert_any_call("Erreur lors de l'initialisation : DB down")
\ No newline at end of file
+        mock_echo.assert_any_call("Erreur lors de l'initialisation : DB down")
+
+def test_init_indexes_creates_missing_indexes(runner):
+    with patch("cli.init_command.create_missing_indexes", return_value=["ix_a", "ix_b"]), \
+         patch("cli.init_command.click.echo") as mock_echo:
+
+        result = runner.invoke(init_indexes)
+
+        assert result.exit_code == 0
+        mock_echo.assert_any_call("Index créés : ix_a, ix_b")
+
+
+def test_init_indexes_nothing_to_create(runner):
+    with patch("cli.init_command.create_missing_indexes", return_value=[]), \
+         patch("cli.init_command.click.echo") as mock_echo:
+
+        result = runner.invoke(init_indexes)
+
+        assert result.exit_code == 0
+        mock_echo.assert_any_call("Tous les index existent déjà.")
+
+
+def test_init_indexes_error_handled(runner):
+    with patch("cli.init_command.create_missing_indexes", side_effect=Exception("DB down")), \
+         patch("cli.init_command.click.echo") as mock_echo:
+
+        result = runner.invoke(init_indexes)
+
+        assert result.exit_code == 0
+        mock_echo.assert_any_call("Erreur lors de la création des index : DB down")
+
+
+def test_init_calibrate_recommends_cost(runner):
+    with patch("cli.init_command.calibrate_rounds", return_value=(11, {10: 60.0, 11: 120.0, 12: 240.0})), \
+         patch("cli.init_command.BCRYPT_ROUNDS", 12):
+        result = runner.invoke(init_calibrate, ["--target-ms", "150"])
+
+    assert result.exit_code == 0
+    assert "Coût 12 : 240.0 ms" in result.output
+    assert "Coût recommandé : BCRYPT_ROUNDS=11 (actuel : 12)" in result.output
+    assert "re-hachés" in result.output
+
+
+def test_init_calibrate_minimum_cost_too_slow(runner):
+    with patch("cli.init_command.calibrate_rounds", return_value=(4, {4: 20.0})), \
+         patch("cli.init_command.BCRYPT_ROUNDS", 4):
+        result = runner.invoke(init_calibrate, ["--target-ms", "5"])
+
+    assert "Même le coût minimal dépasse 5 ms." in result.output
+    assert "re-hachés" not in result.output
@@ -0,0 +1,58 @@
+import click
+import pytest
+from click.testing import CliRunner
+from cli.lazy_group import LazyGroup
+
+hello = click.Command("hello", callback=lambda: click.echo("hello"))
+seed = click.Command("seed", params=[click.Option(["--workers"], type=int)])
+event = click.Group("event", commands={"list": click.Command("list")})
+not_a_command = "hello"
+
+
+@pytest.fixture
+def root():
+    return LazyGroup("root", lazy_subcommands={
+        "hello": f"{__name__}:hello",
+        "broken": f"{__name__}:not_a_command",
+        "seed": f"{__name__}:seed",
+        "event": f"{__name__}:event",
+    })
+
+
+def test_list_commands_does_not_import(root, mocker):
+    import_module = mocker.patch("cli.lazy_group.importlib.import_module")
+
+    assert root.list_commands(click.Context(root)) == ["broken", "event", "hello", "seed"]
+    import_module.assert_not_called()
+
+
+def test_get_command_imports_on_demand(root):
+    result = CliRunner().invoke(root, ["hello"])
+
+    assert result.exit_code == 0
+    assert result.output == "hello\n"
+    assert root.commands["hello"] is hello
+
+
+def test_get_command_unknown_name(root):
+    assert root.get_command(click.Context(root), "missing") is None
+
+
+def test_get_command_rejects_non_command(root):
+    with pytest.raises(ValueError):
+        root.get_command(click.Context(root), "broken")
+
+
+@pytest.mark.parametrize("args, command_path", [
+    (["seed", "--workers", "4"], ["seed"]),
+    (["event", "list"], ["event", "list"]),
+    (["missing"], []),
+])
+def test_invoke_records_the_command_path(root, args, command_path):
+    with root.make_context("root", args) as ctx:
+        try:
+            root.invoke(ctx)
+        except click.UsageError:
+            pass
+
+    assert ctx.meta["command_path"] == command_path
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+# Cumulative import time allowed for `auth whoami`, in microseconds. It takes
+# about 100 ms; the wide margin keeps slow machines and CI runners under it.
+IMPORT_TIME_BUDGET_US = 500_000
+
+HEAVY_MODULES = ("sqlalchemy", "passlib", "bl", "dal", "models", "db")
+
+
+def _import_times(*args, home):
+    env = {**os.environ, "HOME": str(home), "EPICEVENTS_NO_DAEMON": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py", *args],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules.add(name.strip())
+        # Only top-level entries: nested ones are included in their parent's time.
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return result.stdout, modules, times
+
+
+def test_whoami_does_not_import_database_layers(tmp_path):
+    output, modules, _ = _import_times("auth", "whoami", home=tmp_path)
+
+    assert "Vous devez vous connecter." in output
+    loaded = {name.split(".")[0] for name in modules}
+    assert loaded.isdisjoint(HEAVY_MODULES)
+
+
+def test_whoami_import_time_budget(tmp_path):
+    _, _, times = _import_times("auth", "whoami", home=tmp_path)
+
+    assert sum(times.values()) < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,72 @@
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from cli.report_commands import report_cli
+from dtos.report_dto import ContractSummaryDTO, InactiveClientsDTO, SupportMonthDTO
+
+MANAGER = {"id": 1, "sub": "gestion@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture
+def bl_mock():
+    with patch("cli.report_commands.Session", MagicMock()), patch("cli.report_commands.ReportBL") as bl_cls:
+        yield bl_cls.return_value
+
+
+def _invoke(args, user=MANAGER):
+    with patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=user):
+        return CliRunner().invoke(report_cli, args)
+
+
+def test_report_contracts(bl_mock):
+    bl_mock.contract_summary.return_value = (
+        [ContractSummaryDTO(1, "Camille", 2, 2, 0, Decimal(1500), Decimal(200)),
+         ContractSummaryDTO(None, None, 1, 0, 1, Decimal(100), Decimal(100))],
+        ContractSummaryDTO(None, None, 3, 2, 1, Decimal(1600), Decimal(300)),
+    )
+
+    result = _invoke(["contracts"])
+
+    assert result.exit_code == 0
+    assert " - #1 Camille | Signés : 2 | Non signés : 0 | Montant : 1500.00€ | Restant dû : 200.00€" in result.output
+    assert " - Sans commercial | Signés : 0 | Non signés : 1" in result.output
+    assert " - Total | Signés : 2 | Non signés : 1 | Montant : 1600.00€ | Restant dû : 300.00€" in result.output
+
+
+def test_report_contracts_without_contracts(bl_mock):
+    bl_mock.contract_summary.return_value = ([], ContractSummaryDTO(None, None, 0, 0, 0, Decimal(0), Decimal(0)))
+
+    assert "Aucun contrat enregistré." in _invoke(["contracts"]).output
+
+
+def test_report_events(bl_mock):
+    bl_mock.events_per_support.return_value = [SupportMonthDTO(3, "Sam", "2024-03", 2),
+                                               SupportMonthDTO(None, None, "2024-03", 1)]
+
+    result = _invoke(["events", "--year", "2024"])
+
+    bl_mock.events_per_support.assert_called_once_with(MANAGER, year=2024)
+    assert " - #3 Sam | 2024-03 | 2 évènement(s)" in result.output
+    assert " - Sans support | 2024-03 | 1 évènement(s)" in result.output
+
+
+def test_report_clients(bl_mock):
+    bl_mock.inactive_clients.return_value = [InactiveClientsDTO(1, "Camille", 4, 1)]
+
+    result = _invoke(["clients", "--days", "90"])
+
+    bl_mock.inactive_clients.assert_called_once_with(MANAGER, days=90)
+    assert "Clients sans contact depuis 90 jours :" in result.output
+    assert " - #1 Camille | 4 client(s) dont 1 jamais contacté(s)" in result.output
+
+
+def test_report_is_denied_to_commercials(bl_mock):
+    bl_mock.inactive_clients.side_effect = PermissionError("Seuls les gestionnaires peuvent consulter les rapports.")
+
+    result = _invoke(["clients"], user={"id": 2, "sub": "c@e.fr", "role": "commercial"})
+
+    assert "Accès refusé : Seuls les gestionnaires" in result.output
@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy.orm import sessionmaker
+
+from cli.seed_command import seed
+from models import Client, Collaborator
+
+
+@pytest.fixture
+def engine(sqlite_engine):
+    with patch("cli.seed_command.engine", sqlite_engine), patch("db.seed.hash_password", return_value="hashed"):
+        yield sqlite_engine
+
+
+def test_seed_command_loads_the_dataset(engine):
+    result = CliRunner().invoke(seed, ["--collaborators", "6", "--clients-per-commercial", "3",
+                                       "--password", "secret"])
+
+    assert result.exit_code == 0
+    assert "6 collaborateurs, 6 clients, 12 contrats" in result.output
+    with sessionmaker(bind=engine)() as session:
+        assert session.query(Client).count() == 6
+        assert {c.password for c in session.query(Collaborator)} == {"hashed"}
+
+
+def test_seed_command_reset_requires_confirmation(engine):
+    CliRunner().invoke(seed, ["--collaborators", "3", "--password", "secret"])
+
+    aborted = CliRunner().invoke(seed, ["--reset", "--collaborators", "3", "--password", "secret"], input="n\n")
+    confirmed = CliRunner().invoke(seed, ["--reset", "--collaborators", "3", "--clients-per-commercial", "1",
+                                          "--password", "secret"], input="y\n")
+
+    assert aborted.exit_code == 1
+    assert confirmed.exit_code == 0
+    with sessionmaker(bind=engine)() as session:
+        assert session.query(Collaborator).count() == 3
+        assert session.query(Client).count() == 1
+
+
+def test_seed_command_reports_errors(engine):
+    result = CliRunner().invoke(seed, ["--workers", "2", "--password", "secret"])
+
+    assert "Erreur lors de la génération" in result.output
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from dal.pagination import keyset_page, MAX_PAGE_SIZE
+from dtos.page_dto import PageDTO
+from models.client import Client
+
+
+@pytest.fixture
+def rows():
+    return [SimpleNamespace(id=i) for i in range(1, 5)]
+
+
+def test_keyset_page_first_page_has_next_cursor(rows):
+    query = MagicMock()
+    query.order_by.return_value.limit.return_value.all.return_value = rows
+
+    page = keyset_page(query, Client.id, lambda r: r, limit=3)
+
+    assert isinstance(page, PageDTO)
+    assert [item.id for item in page.items] == [1, 2, 3]
+    assert page.next_cursor == 3
+    query.filter.assert_not_called()
+    query.order_by.return_value.limit.assert_called_once_with(4)
+
+
+def test_keyset_page_after_cursor_filters_on_id(rows):
+    query = MagicMock()
+    filtered = query.filter.return_value
+    filtered.order_by.return_value.limit.return_value.all.return_value = rows[3:]
+
+    page = keyset_page(query, Client.id, lambda r: r, after=3, limit=3)
+
+    query.filter.assert_called_once()
+    assert [item.id for item in page.items] == [4]
+    assert page.next_cursor is None
+
+
+def test_keyset_page_empty():
+    query = MagicMock()
+    query.order_by.return_value.limit.return_value.all.return_value = []
+
+    page = keyset_page(query, Client.id, lambda r: r)
+
+    assert page.items == []
+    assert page.next_cursor is None
+
+
+def test_keyset_page_limit_is_capped():
+    query = MagicMock()
+    query.order_by.return_value.limit.return_value.all.return_value = []
+
+    keyset_page(query, Client.id, lambda r: r, limit=MAX_PAGE_SIZE * 10)
+
+    query.order_by.return_value.limit.assert_called_once_with(MAX_PAGE_SIZE + 1)
+
+
+def test_keyset_page_invalid_limit():
+    with pytest.raises(ValueError):
+        keyset_page(MagicMock(), Client.id, lambda r: r, limit=0)
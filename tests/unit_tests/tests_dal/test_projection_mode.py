@@ -0,0 +1,81 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker, joinedload
+
+from dal.client_dal import ClientDAL
+from dal.contract_dal import ContractDAL, CONTRACT_COLUMNS
+from dal.event_dal import EventDAL
+from dtos.client_dto import ClientDTO
+from dtos.contract_dto import ContractDTO
+from dtos.event_dto import EventDTO
+from models import Client, Contract, Event
+
+
+@pytest.fixture
+def engine(sqlite_engine):
+    session = sessionmaker(bind=sqlite_engine)()
+    session.add_all([
+        Client(id=1, name="Client", email="client@example.com", phone="0102", company="ACME",
+               creation_date=date(2024, 1, 1), last_contact_date=None, commercial_id=None),
+        Contract(id=1, total_amount=1000, amount_left=250, creation_date=date(2024, 1, 2), status=True,
+                 client_id=1, commercial_id=None),
+        Event(id=1, start_date=datetime(2024, 2, 1, 9), end_date=datetime(2024, 2, 1, 18), location="Paris",
+              attendees=50, note=None, contract_id=1, support_id=None),
+    ])
+    session.commit()
+    session.close()
+    yield sqlite_engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.mark.parametrize("dal_class, dto_class", [
+    (ClientDAL, ClientDTO),
+    (ContractDAL, ContractDTO),
+    (EventDAL, EventDTO),
+])
+def test_projection_returns_same_dtos_as_entities(db, dal_class, dto_class):
+    projected = dal_class(db, projection=True).get_all()
+    hydrated = dal_class(db).get_all()
+
+    assert all(isinstance(dto, dto_class) for dto in projected)
+    assert projected == hydrated
+    assert dal_class(db, projection=True).get(1) == dal_class(db).get(1)
+
+
+def test_projection_does_not_hydrate_entities(db):
+    result = EventDAL(db, projection=True).get_without_support()
+
+    assert [e.id for e in result] == [1]
+    assert len(db.identity_map) == 0
+
+
+def test_projection_selects_dto_columns():
+    mock_session = MagicMock(spec=Session)
+    mock_session.query.return_value.filter_by.return_value.first.return_value = (
+        1, 1000, 250, date(2024, 1, 2), True, 1, 2
+    )
+
+    result = ContractDAL(mock_session, projection=True).get(1)
+
+    mock_session.query.assert_called_once_with(*CONTRACT_COLUMNS)
+    assert result == ContractDTO(id=1, total_amount=1000, amount_left=250, creation_date=date(2024, 1, 2),
+                                 status=True, client_id=1, commercial_id=2)
+
+
+def test_loader_options_fall_back_to_entities():
+    mock_session = MagicMock(spec=Session)
+    mock_session.query.return_value.options.return_value.filter_by.return_value.first.return_value = None
+    option = joinedload(Contract.client)
+
+    ContractDAL(mock_session, projection=True).get(1, options=(option,))
+
+    mock_session.query.assert_called_once_with(Contract)
+    mock_session.query.return_value.options.assert_called_once_with(option)
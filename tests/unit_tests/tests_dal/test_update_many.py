@@ -0,0 +1,102 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from dal.client_dal import ClientDAL
+from dal.collaborator_dal import CollaboratorDAL
+from dal.contract_dal import ContractDAL
+from dal.event_dal import EventDAL
+from models import Client, Collaborator, Contract, Event, Role
+
+
+@pytest.fixture
+def engine(sqlite_engine):
+    session = sessionmaker(bind=sqlite_engine)()
+    session.add_all(
+        [Role(id=1, name="support")]
+        + [Collaborator(id=i, name=f"Support {i}", email=f"s{i}@epicevents.fr", password="x", role_id=1)
+           for i in range(1, 4)]
+        + [Client(id=i, name=f"Client {i}", email=f"c{i}@example.com", creation_date=date(2024, 1, 1))
+           for i in range(1, 4)]
+        + [Contract(id=i, total_amount=100, amount_left=100, creation_date=date(2024, 1, 1), status=False,
+                    client_id=1) for i in range(1, 4)]
+        + [Event(id=i, start_date=datetime(2024, 2, i, 9), end_date=datetime(2024, 2, i, 18), contract_id=1,
+                 support_id=None) for i in range(1, 4)]
+    )
+    session.commit()
+    session.close()
+    yield sqlite_engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield captured
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.parametrize("dal_class, model, updates", [
+    (ClientDAL, Client, {"company": "ACME"}),
+    (ContractDAL, Contract, {"status": True}),
+    (EventDAL, Event, {"support_id": 3}),
+    (CollaboratorDAL, Collaborator, {"name": "Renamed"}),
+])
+def test_update_many_runs_a_single_update(db, statements, dal_class, model, updates):
+    count = dal_class(db).update_many([1, 2, 99], updates)
+    db.commit()
+
+    assert count == 2
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+    assert not [s for s in statements if s.startswith("SELECT")]
+    [(column, value)] = updates.items()
+    assert {getattr(m, column) for m in db.query(model).filter(model.id.in_([1, 2]))} == {value}
+    assert getattr(db.get(model, 3), column) != value
+
+
+def test_update_many_synchronizes_loaded_entities(db):
+    event_3 = db.get(Event, 3)
+
+    EventDAL(db).update_many([3], {"support_id": 2})
+
+    assert event_3.support_id == 2
+
+
+def test_update_where_uses_the_predicate(db):
+    count = EventDAL(db).update_where(Event.start_date >= datetime(2024, 2, 2), {"support_id": 1})
+
+    assert count == 2
+    assert [e.id for e in db.query(Event).filter_by(support_id=1).order_by(Event.id)] == [2, 3]
+
+
+def test_update_many_without_ids_or_updates_is_a_no_op(db, statements):
+    assert ContractDAL(db).update_many([], {"status": True}) == 0
+    assert ContractDAL(db).update_many([1], {}) == 0
+    assert not statements
+
+
+def test_bulk_update_sets_a_value_per_row_in_one_executemany(db, statements):
+    count = EventDAL(db).bulk_update([{"id": 1, "support_id": 2}, {"id": 3, "support_id": 1}])
+    db.commit()
+
+    assert count == 2
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+    assert {e.id: e.support_id for e in db.query(Event)} == {1: 2, 2: None, 3: 1}
+
+
+def test_bulk_update_without_rows_is_a_no_op(db, statements):
+    assert EventDAL(db).bulk_update([]) == 0
+    assert not statements
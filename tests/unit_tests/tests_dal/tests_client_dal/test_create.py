@@ -57,7 +57,7 @@ def test_create(client_dal, db_session, client_data, client_dto):
     result = client_dal.create(data=client_data)
 
     db_session.add.assert_called_once()
-    db_session.commit.assert_called_once()
+    db_session.flush.assert_called_once()
     db_session.refresh.assert_called_once()
 
     refreshed_obj = db_session.refresh.call_args.args[0]
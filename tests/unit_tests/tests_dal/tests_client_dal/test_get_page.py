@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+import pytest
+from dal.client_dal import ClientDAL
+from models.client import Client
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def client_dal(mock_session):
+    return ClientDAL(db=mock_session)
+
+
+def test_get_page_returns_dtos_and_cursor(mock_session, client_dal):
+    clients = [Client(id=i, name=f"Client {i}", email=f"c{i}@example.com", commercial_id=1) for i in (1, 2, 3)]
+    mock_session.query.return_value.order_by.return_value.limit.return_value.all.return_value = clients
+
+    page = client_dal.get_page(limit=2)
+
+    mock_session.query.assert_called_once_with(Client)
+    assert [c.id for c in page.items] == [1, 2]
+    assert page.items[0].email == "c1@example.com"
+    assert page.next_cursor == 2
+
+
+def test_get_page_last_page(mock_session, client_dal):
+    clients = [Client(id=5, name="Client 5", email="c5@example.com", commercial_id=1)]
+    query = mock_session.query.return_value.filter.return_value
+    query.order_by.return_value.limit.return_value.all.return_value = clients
+
+    page = client_dal.get_page(after=4, limit=2)
+
+    assert [c.id for c in page.items] == [5]
+    assert page.next_cursor is None
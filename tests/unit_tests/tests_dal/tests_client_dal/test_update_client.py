@@ -41,7 +41,7 @@ def test_update_successful(client_dal, client_instance, mock_session):
     assert isinstance(result, ClientDTO)
     assert result.name == updates["name"]
     assert result.email == updates["email"]
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_called_once_with(client_instance)
 
 
@@ -55,7 +55,7 @@ def test_update_partial_fields(client_dal, client_instance, mock_session):
     assert isinstance(result, ClientDTO)
     assert result.phone == updates["phone"]
     assert result.name == client_instance.name
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_called_once_with(client_instance)
 
 
@@ -69,5 +69,5 @@ def test_update_no_fields(client_dal, client_instance, mock_session):
     assert isinstance(result, ClientDTO)
     assert result.name == client_instance.name
     assert result.email == client_instance.email
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_called_once_with(client_instance)
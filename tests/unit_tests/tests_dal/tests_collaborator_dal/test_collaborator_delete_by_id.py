@@ -23,7 +23,7 @@ def test_delete_by_id_existing_collaborator(collaborator_dal, db_session):
     result = collaborator_dal.delete_by_id(1)
 
     db_session.delete.assert_called_once_with(mock_collaborator)
-    db_session.commit.assert_called_once()
+    db_session.flush.assert_called_once()
     assert result is True
 
 
@@ -33,7 +33,7 @@ def test_delete_by_id_non_existing_collaborator(collaborator_dal, db_session):
     result = collaborator_dal.delete_by_id(1)
 
     db_session.delete.assert_not_called()
-    db_session.commit.assert_not_called()
+    db_session.flush.assert_not_called()
     assert result is False
 
 
@@ -0,0 +1,49 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from dal.collaborator_dal import CollaboratorDAL
+from dal.event_dal import overlapping
+from models import Client, Collaborator, Contract, Event, Role
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all([
+        Role(id=1, name="support"), Role(id=2, name="commercial"),
+        Collaborator(id=1, name="Busy", email="busy@e.fr", password="x", role_id=1),
+        Collaborator(id=2, name="Free", email="free@e.fr", password="x", role_id=1),
+        Collaborator(id=3, name="Later", email="later@e.fr", password="x", role_id=1),
+        Collaborator(id=4, name="Seller", email="seller@e.fr", password="x", role_id=2),
+        Client(id=1, name="Client", email="c@e.fr", creation_date=date(2024, 1, 1)),
+        Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1),
+        Event(id=1, start_date=datetime(2024, 3, 1, 9), end_date=datetime(2024, 3, 1, 18), contract_id=1,
+              support_id=1),
+        Event(id=2, start_date=datetime(2024, 3, 1, 18), end_date=datetime(2024, 3, 1, 22), contract_id=1,
+              support_id=3),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_get_available_excludes_supports_with_an_overlapping_event(db):
+    available = CollaboratorDAL(db).get_available("support", datetime(2024, 3, 1, 10), datetime(2024, 3, 1, 18))
+
+    assert [c.id for c in available] == [2, 3]
+
+
+def test_get_available_treats_the_periods_as_half_open(db):
+    available = CollaboratorDAL(db).get_available("support", datetime(2024, 3, 1, 17), datetime(2024, 3, 1, 19))
+
+    assert [c.id for c in available] == [2]
+
+
+def test_overlapping_uses_the_range_operator_on_postgresql():
+    clause = overlapping("postgresql", datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 18))
+
+    sql = str(clause.compile(dialect=postgresql.dialect()))
+    assert ("tsrange(least(events.start_date, events.end_date), greatest(events.start_date, events.end_date))"
+            " && tsrange(") in sql
@@ -0,0 +1,24 @@
+import pytest
+
+from dal.collaborator_dal import CollaboratorDAL
+from models import Collaborator, Role
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all([
+        Role(id=1, name="support"),
+        Collaborator(id=7, name="Sam", email="sam@e.fr", password="x", role_id=1),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_get_role_name(db):
+    assert CollaboratorDAL(db).get_role_name(7) == "support"
+
+
+def test_get_role_name_of_an_unknown_collaborator(db):
+    assert CollaboratorDAL(db).get_role_name(8) is None
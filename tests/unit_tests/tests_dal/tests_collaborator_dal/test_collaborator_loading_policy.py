@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload
+
+from dal.client_dal import ClientDAL
+from dal.collaborator_dal import CollaboratorDAL
+from models import Role, Collaborator, Client
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    roles = [Role(name=name) for name in ("gestion", "commercial", "support")]
+    session.add_all(roles)
+    session.flush()
+    for i in range(6):
+        collaborator = Collaborator(name=f"Collab {i}", email=f"c{i}@example.com", password="x",
+                                    role_id=roles[i % 3].id)
+        session.add(collaborator)
+        session.flush()
+        session.add(Client(name=f"Client {i}", email=f"client{i}@example.com",
+                           creation_date=date.today(), commercial_id=collaborator.id))
+    session.commit()
+    session.expunge_all()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(sqlite_engine):
+    executed = []
+    listener = lambda *args: executed.append(args[2])  # noqa: E731
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    yield executed
+    event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+
+def test_get_all_collaborators_issues_a_single_query(db, statements):
+    result = CollaboratorDAL(db).get_all()
+
+    assert len(result) == 6
+    assert {c.role_name for c in result} == {"gestion", "commercial", "support"}
+    assert len(statements) == 1
+
+
+def test_client_commercial_is_never_lazy_loaded(db):
+    client = ClientDAL(db).get_raw(1)
+
+    with pytest.raises(InvalidRequestError):
+        client.commercial
+
+
+def test_client_commercial_can_be_eager_loaded_per_call(db, statements):
+    client = ClientDAL(db).get_raw(1, options=(joinedload(Client.commercial),))
+
+    assert client.commercial.email == "c0@example.com"
+    assert len(statements) == 1
@@ -37,7 +37,7 @@ def test_create_new_collaborator(collaborator_dal, db_session, mocker):
     result = collaborator_dal.create(data)
 
     db_session.add.assert_called_once_with(collaborator)
-    db_session.commit.assert_called_once()
+    db_session.flush.assert_called_once()
     db_session.refresh.assert_called_once_with(collaborator)
 
     assert isinstance(result, CollaboratorDTO)
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+import pytest
+from dal.contract_dal import ContractDAL
+from dtos.contract_dto import ContractDTO
+from models.contract import Contract
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def contract_dal(mock_session):
+    return ContractDAL(mock_session)
+
+
+def test_find_applies_criteria_in_query(contract_dal, mock_session):
+    contracts = [Contract(id=1, total_amount=100, amount_left=50, creation_date="2023-01-01", status=True,
+                          client_id=1, commercial_id=1)]
+    mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = contracts
+    criterion = Contract.status.is_(True)
+
+    result = contract_dal.find(criterion)
+
+    mock_session.query.return_value.filter.assert_called_once_with(criterion)
+    assert len(result) == 1
+    assert isinstance(result[0], ContractDTO)
+    assert result[0].id == 1
+
+
+def test_filter_unpaid_filters_in_database(contract_dal, mock_session):
+    mock_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+
+    result = contract_dal.filter_unpaid()
+
+    assert result == []
+    (criterion,), _ = mock_session.query.return_value.filter.call_args
+    assert str(criterion.compile(compile_kwargs={"literal_binds": True})) == "contracts.amount_left > 0"
+
+
+def test_unpaid_partial_index_is_declared():
+    index = next(i for i in Contract.__table__.indexes if i.name == "ix_contracts_unpaid")
+    assert [c.name for c in index.columns] == ["amount_left"]
+    assert index.dialect_options["postgresql"]["where"] is not None
@@ -0,0 +1,38 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from dal.contract_dal import ContractDAL
+from dtos.contract_batch import ContractBatch
+from models import Client, Contract
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add(Client(id=1, name="Client", email="c@example.com", creation_date=date(2024, 1, 1)))
+    session.add_all([Contract(id=i, total_amount=Decimal("100.10"), amount_left=i % 2, status=i % 2 == 0,
+                              creation_date=date(2024, 1, 1), client_id=1) for i in range(1, 6)])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_stream_batches_splits_the_contracts_in_chunks(db):
+    batches = list(ContractDAL(db).stream_batches(chunk_size=2))
+
+    assert all(isinstance(batch, ContractBatch) for batch in batches)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [c.id for batch in batches for c in batch] == [1, 2, 3, 4, 5]
+    assert batches[0][0].total_amount == Decimal("100.10")
+
+
+def test_stream_batches_filters(db):
+    batches = ContractDAL(db).stream_batches(signed=False, unpaid=True, chunk_size=10)
+
+    assert [c.id for batch in batches for c in batch] == [1, 3, 5]
+
+
+def test_stream_batches_without_contracts(db):
+    assert list(ContractDAL(db).stream_batches(signed=True, unpaid=True)) == []
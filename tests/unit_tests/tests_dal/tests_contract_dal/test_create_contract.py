@@ -32,7 +32,7 @@ def test_create_contract_successful(mocker):
 
     # Mock session behavior
     mocker.patch.object(mock_session, "add")
-    mocker.patch.object(mock_session, "commit")
+    mocker.patch.object(mock_session, "flush")
     mocker.patch.object(mock_session, "refresh", side_effect=lambda obj: None)
     mock_to_dto = mocker.patch.object(ContractDAL, "_to_dto", return_value=expected_dto)
 
@@ -48,7 +48,7 @@ def test_create_contract_successful(mocker):
     assert added_contract.total_amount == 5000.0
     assert added_contract.client_id == 1
 
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_called_once_with(added_contract)
     mock_to_dto.assert_called_once_with(added_contract)
 
@@ -76,7 +76,7 @@ def test_create_contract_missing_required_field_raises_integrity_error(contract_
         "commercial_id": 2
     }
 
-    db_session.commit.side_effect = IntegrityError("INSERT", {}, Exception("NOT NULL violation"))
+    db_session.flush.side_effect = IntegrityError("INSERT", {}, Exception("NOT NULL violation"))
 
     contract_dal._to_dto = MagicMock()
 
@@ -85,7 +85,7 @@ def test_create_contract_missing_required_field_raises_integrity_error(contract_
         contract_dal.create(incomplete_data)
 
     db_session.add.assert_called_once()
-    db_session.commit.assert_called_once()
+    db_session.flush.assert_called_once()
 
 
 def test_create_contract_invalid_field(mocker):
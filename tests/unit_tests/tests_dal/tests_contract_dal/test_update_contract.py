@@ -24,7 +24,7 @@ def test_update_existing_contract(mocker):
     mock_filter = mock_query.filter_by.return_value
     mock_filter.first.return_value = mock_contract
 
-    db_session.commit = MagicMock()
+    db_session.flush = MagicMock()
     db_session.refresh = MagicMock()
 
     dal = ContractDAL(db=db_session)
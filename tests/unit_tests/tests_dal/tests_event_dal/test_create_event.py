@@ -62,7 +62,7 @@ def test_create_event(event_dal, db_session, sample_event_data, sample_event_dto
     mocker.patch.object(event_dal, "_to_dto", return_value=sample_event_dto)
     db_session.refresh.side_effect = lambda obj: None  # Evite erreur si accède à l'objet
     db_session.add.reset_mock()
-    db_session.commit.reset_mock()
+    db_session.flush.reset_mock()
 
     # Act
     result = event_dal.create(sample_event_data)
@@ -73,13 +73,13 @@ def test_create_event(event_dal, db_session, sample_event_data, sample_event_dto
     assert isinstance(added_event, Event)
     assert added_event.location == sample_event_data["location"]
 
-    db_session.commit.assert_called_once()
+    db_session.flush.assert_called_once()
     db_session.refresh.assert_called_once_with(added_event)
     event_dal._to_dto.assert_called_once_with(added_event)
     assert result == sample_event_dto
 
 
-def test_create_event_invalid_data_commit_error(event_dal, db_session, mocker):
+def test_create_event_invalid_data_flush_error(event_dal, db_session, mocker):
     # Incomplete but valid data on the Python side
     invalid_data = {
         "start_date": "2023-10-01T10:00:00",
@@ -88,7 +88,7 @@ def test_create_event_invalid_data_commit_error(event_dal, db_session, mocker):
         # Missing contract_id, which is NOT NULL
     }
 
-    db_session.commit.side_effect = IntegrityError("INSERT", {}, Exception("NOT NULL violation"))
+    db_session.flush.side_effect = IntegrityError("INSERT", {}, Exception("NOT NULL violation"))
 
     with pytest.raises(IntegrityError):
         event_dal.create(invalid_data)
\ No newline at end of file
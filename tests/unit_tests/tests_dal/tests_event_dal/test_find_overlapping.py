@@ -0,0 +1,60 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from bl.interval_index import IntervalIndex
+from dal.event_dal import EventDAL, overlapping
+from models import Client, Contract, Event
+
+# Schedule of the support #7, with an empty event at 12:00
+SCHEDULE = [(1, 9, 12), (2, 12, 12), (3, 14, 18)]
+
+
+def _at(hour):
+    return datetime(2024, 3, 1, hour)
+
+
+@pytest.fixture
+def db(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all(
+        [Client(id=1, name="Client", email="c@e.fr", creation_date=date(2024, 1, 1)),
+         Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1)]
+        + [Event(id=event_id, start_date=_at(start), end_date=_at(end), contract_id=1, support_id=7)
+           for event_id, start, end in SCHEDULE]
+        + [Event(id=4, start_date=_at(10), end_date=_at(11), contract_id=1, support_id=8)]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_find_overlapping_returns_the_events_of_the_support_by_start(db):
+    assert EventDAL(db).find_overlapping(7, _at(10), _at(15)) == [1, 3]
+    assert EventDAL(db).find_overlapping(7, _at(10), _at(15), exclude_event_id=1) == [3]
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (11, 13, [1]),
+    # The empty event covers no time, even inside the slot
+    (12, 13, []),
+    # An empty slot overlaps nothing, even inside an event
+    (10, 10, []),
+    (12, 12, []),
+    # Half-open periods: touching ends do not overlap
+    (18, 20, []),
+])
+def test_empty_periods_overlap_nothing_in_sql_and_in_memory(db, start, end, expected):
+    schedule = IntervalIndex((_at(s), _at(e), event_id) for event_id, s, e in SCHEDULE)
+
+    assert EventDAL(db).find_overlapping(7, _at(start), _at(end)) == expected
+    assert schedule.find(_at(start), _at(end)) == expected
+    assert schedule.overlaps(_at(start), _at(end)) == bool(expected)
+
+
+def test_empty_slot_is_not_sent_to_postgresql():
+    # tsrange(start, start) is empty on PostgreSQL, and a reversed one raises
+    clause = overlapping("postgresql", _at(10), _at(10))
+
+    assert str(clause.compile(dialect=postgresql.dialect())) == "false"
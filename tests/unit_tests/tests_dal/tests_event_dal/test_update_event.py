@@ -32,7 +32,7 @@ def sample_event():
 
 
 def test_update_updates_event_properties(event_dal, mock_session, sample_event):
-    mock_session.commit.return_value = None
+    mock_session.flush.return_value = None
     mock_session.refresh.return_value = None
     event_dal._to_dto = MagicMock(return_value=EventDTO(
         id=1,
@@ -60,8 +60,8 @@ def test_update_updates_event_properties(event_dal, mock_session, sample_event):
     assert updated_event.note == "Updated note"
 
 
-def test_update_commits_and_refreshes(event_dal, mock_session, sample_event):
-    mock_session.commit.return_value = None
+def test_update_flushes_and_refreshes(event_dal, mock_session, sample_event):
+    mock_session.flush.return_value = None
     mock_session.refresh.return_value = None
     event_dal._to_dto = MagicMock(return_value=EventDTO(
         id=1,
@@ -81,7 +81,7 @@ def test_update_commits_and_refreshes(event_dal, mock_session, sample_event):
 
     event_dal.update(sample_event, updates)
 
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_called_once_with(sample_event)
 
 
@@ -0,0 +1,114 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from dal.report_dal import ReportDAL, month_of
+from dtos.report_dto import ContractSummaryDTO, InactiveClientsDTO, SupportMonthDTO
+from models import Client, Collaborator, Contract, Event, Role
+
+
+@pytest.fixture
+def engine(sqlite_engine):
+    session = sessionmaker(bind=sqlite_engine)()
+    session.add_all([
+        Role(id=1, name="commercial"), Role(id=2, name="support"),
+        Collaborator(id=1, name="Camille", email="camille@e.fr", password="x", role_id=1),
+        Collaborator(id=2, name="Dominique", email="dominique@e.fr", password="x", role_id=1),
+        Collaborator(id=3, name="Sam", email="sam@e.fr", password="x", role_id=2),
+        Client(id=1, name="A", email="a@e.fr", creation_date=date(2024, 1, 1), last_contact_date=date(2024, 6, 1),
+               commercial_id=1),
+        Client(id=2, name="B", email="b@e.fr", creation_date=date(2024, 1, 1), last_contact_date=None,
+               commercial_id=1),
+        Client(id=3, name="C", email="c@e.fr", creation_date=date(2024, 1, 1), last_contact_date=date(2023, 1, 1),
+               commercial_id=2),
+        Contract(id=1, total_amount=1000, amount_left=0, creation_date=date(2024, 1, 1), status=True,
+                 client_id=1, commercial_id=1),
+        Contract(id=2, total_amount=500, amount_left=200, creation_date=date(2024, 1, 1), status=True,
+                 client_id=2, commercial_id=1),
+        Contract(id=3, total_amount=300, amount_left=300, creation_date=date(2024, 1, 1), status=False,
+                 client_id=3, commercial_id=2),
+        Contract(id=4, total_amount=100, amount_left=100, creation_date=date(2024, 1, 1), status=False,
+                 client_id=3, commercial_id=None),
+        Event(id=1, start_date=datetime(2024, 3, 1, 9), end_date=datetime(2024, 3, 1, 18), contract_id=1,
+              support_id=3),
+        Event(id=2, start_date=datetime(2024, 3, 20, 9), end_date=datetime(2024, 3, 20, 18), contract_id=2,
+              support_id=3),
+        Event(id=3, start_date=datetime(2025, 1, 5, 9), end_date=datetime(2025, 1, 5, 18), contract_id=1,
+              support_id=3),
+        Event(id=4, start_date=datetime(2024, 3, 2, 9), end_date=datetime(2024, 3, 2, 18), contract_id=2),
+    ])
+    session.commit()
+    session.close()
+    yield sqlite_engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield captured
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_contracts_by_commercial(db, statements):
+    rows = ReportDAL(db).contracts_by_commercial()
+
+    assert rows == [
+        ContractSummaryDTO(1, "Camille", 2, 2, 0, Decimal(1500), Decimal(200)),
+        ContractSummaryDTO(2, "Dominique", 1, 0, 1, Decimal(300), Decimal(300)),
+        ContractSummaryDTO(None, None, 1, 0, 1, Decimal(100), Decimal(100)),
+    ]
+    assert len(statements) == 1
+    assert "GROUP BY" in statements[0]
+
+
+def test_contract_totals(db):
+    assert ReportDAL(db).contract_totals() == ContractSummaryDTO(None, None, 4, 2, 2, Decimal(1900), Decimal(600))
+
+
+def test_contract_totals_without_contracts(db):
+    db.query(Contract).delete()
+
+    assert ReportDAL(db).contract_totals() == ContractSummaryDTO(None, None, 0, 0, 0, Decimal(0), Decimal(0))
+
+
+def test_events_by_support_month(db):
+    assert ReportDAL(db).events_by_support_month() == [
+        SupportMonthDTO(3, "Sam", "2024-03", 2),
+        SupportMonthDTO(3, "Sam", "2025-01", 1),
+        SupportMonthDTO(None, None, "2024-03", 1),
+    ]
+
+
+def test_events_by_support_month_on_a_period(db):
+    rows = ReportDAL(db).events_by_support_month(datetime(2025, 1, 1), datetime(2026, 1, 1))
+
+    assert rows == [SupportMonthDTO(3, "Sam", "2025-01", 1)]
+
+
+def test_inactive_clients_by_commercial(db):
+    assert ReportDAL(db).inactive_clients_by_commercial(date(2024, 3, 1)) == [
+        InactiveClientsDTO(1, "Camille", 1, 1),
+        InactiveClientsDTO(2, "Dominique", 1, 0),
+    ]
+
+
+def test_month_of_uses_to_char_on_postgresql():
+    sql = str(month_of("postgresql", Event.start_date).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("to_char(events.start_date")
@@ -21,7 +21,7 @@ def test_create_role_success(role_dal, db_session_mock):
     # Arrange
     role_name = "gestion"
     db_session_mock.add.return_value = None
-    db_session_mock.commit.return_value = None
+    db_session_mock.flush.return_value = None
     db_session_mock.refresh.side_effect = lambda obj: setattr(obj, "id", 1)
     role_dal._to_dto = MagicMock(return_value=RoleDTO(id=1, name=role_name))
 
@@ -30,7 +30,7 @@ def test_create_role_success(role_dal, db_session_mock):
 
     # Assert
     db_session_mock.add.assert_called_once()
-    db_session_mock.commit.assert_called_once()
+    db_session_mock.flush.assert_called_once()
     db_session_mock.refresh.assert_called_once()
 
     # Vérifie que le bon objet Role a été passé à .add()
@@ -45,14 +45,14 @@ def test_create_role_success(role_dal, db_session_mock):
 
 def test_create_role_invalid_name(role_dal, db_session_mock):
     # Arrange
-    db_session_mock.commit.side_effect = Exception("Integrity Error")
+    db_session_mock.flush.side_effect = Exception("Integrity Error")
 
     # Act & Assert
     with pytest.raises(Exception, match="Integrity Error"):
         role_dal.create_role(name="invalid")
 
     db_session_mock.add.assert_called_once()
-    db_session_mock.commit.assert_called_once()
+    db_session_mock.flush.assert_called_once()
 
 
 def test_create_role_empty_name(role_dal, db_session_mock):
@@ -60,4 +60,4 @@ def test_create_role_empty_name(role_dal, db_session_mock):
         role_dal.create_role(name="")
 
     db_session_mock.add.assert_not_called()
-    db_session_mock.commit.assert_not_called()
+    db_session_mock.flush.assert_not_called()
@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from db.async_session import async_unit_of_work, to_async_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("postgresql://ansi@localhost/epicevent", "postgresql+asyncpg://ansi@localhost/epicevent"),
+    ("postgresql+psycopg2://u:p@db/crm", "postgresql+asyncpg://u:p@db/crm"),
+    ("sqlite:///crm.db", "sqlite+aiosqlite:///crm.db"),
+    ("postgresql+asyncpg://ansi@localhost/epicevent", "postgresql+asyncpg://ansi@localhost/epicevent"),
+])
+def test_to_async_url(url, expected):
+    assert to_async_url(url) == expected
+
+
+def _session_factory(is_active=True):
+    session = AsyncMock()
+    session.is_active = is_active
+    return MagicMock(return_value=session), session
+
+
+def test_async_unit_of_work_commits():
+    factory, session = _session_factory()
+
+    async def scenario():
+        async with async_unit_of_work(factory):
+            pass
+
+    asyncio.run(scenario())
+
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+    session.close.assert_awaited_once()
+
+
+def test_async_unit_of_work_rolls_back_on_error():
+    factory, session = _session_factory()
+
+    async def scenario():
+        async with async_unit_of_work(factory):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(scenario())
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
+    session.close.assert_awaited_once()
+
+
+def test_async_unit_of_work_rolls_back_inactive_transaction():
+    factory, session = _session_factory(is_active=False)
+
+    async def scenario():
+        async with async_unit_of_work(factory):
+            pass
+
+    asyncio.run(scenario())
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from db.database_init import _invalid_indexes, create_missing_indexes
+from models import Base
+
+
+def _index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_indexes_declared_on_models(sqlite_engine):
+    assert "ix_clients_commercial_id" in _index_names(sqlite_engine, "clients")
+    assert {"ix_contracts_client_id", "ix_contracts_commercial_id",
+            "ix_contracts_status_id", "ix_contracts_unpaid"} <= _index_names(sqlite_engine, "contracts")
+    assert {"ix_events_contract_id", "ix_events_support_id_start_date",
+            "ix_events_without_support"} <= _index_names(sqlite_engine, "events")
+
+
+def test_nothing_created_when_all_indexes_exist(sqlite_engine):
+    assert create_missing_indexes(sqlite_engine) == []
+
+
+def test_missing_indexes_are_created(sqlite_engine):
+    with sqlite_engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_events_without_support"))
+        conn.execute(text("DROP INDEX ix_contracts_unpaid"))
+
+    created = create_missing_indexes(sqlite_engine)
+
+    assert created == ["ix_contracts_unpaid", "ix_events_without_support"]
+    assert "ix_events_without_support" in _index_names(sqlite_engine, "events")
+
+
+def test_model_indexes_are_left_untouched(sqlite_engine):
+    with sqlite_engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_contracts_unpaid"))
+    model_index = next(i for i in Base.metadata.tables["contracts"].indexes if i.name == "ix_contracts_unpaid")
+    executed = []
+    event.listen(sqlite_engine, "before_execute", lambda conn, statement, *args: executed.append(statement))
+
+    create_missing_indexes(sqlite_engine)
+
+    [create] = [statement for statement in executed if isinstance(statement, CreateIndex)]
+    assert create.element is not model_index
+    assert str(create.compile(dialect=postgresql.dialect())) == \
+        str(CreateIndex(model_index, if_not_exists=True).compile(dialect=postgresql.dialect()))
+    assert model_index.dialect_options["postgresql"]["concurrently"] is False
+
+
+def test_invalid_indexes_are_rebuilt(sqlite_engine, monkeypatch):
+    # As left behind on PostgreSQL by a CREATE INDEX CONCURRENTLY that failed
+    monkeypatch.setattr("db.database_init._invalid_indexes", lambda conn: {"ix_contracts_unpaid"})
+    executed = []
+    event.listen(sqlite_engine, "before_execute", lambda conn, statement, *args: executed.append(statement))
+
+    created = create_missing_indexes(sqlite_engine)
+
+    assert created == ["ix_contracts_unpaid"]
+    assert [(type(statement), statement.element.name) for statement in executed
+            if isinstance(statement, (CreateIndex, DropIndex))] == [(DropIndex, "ix_contracts_unpaid"),
+                                                                    (CreateIndex, "ix_contracts_unpaid")]
+    assert "ix_contracts_unpaid" in _index_names(sqlite_engine, "contracts")
+
+
+def test_invalid_indexes_are_only_looked_up_on_postgresql(sqlite_engine):
+    with sqlite_engine.connect() as conn:
+        assert _invalid_indexes(conn) == set()
+
+
+def test_missing_tables_are_skipped():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    assert create_missing_indexes(engine) == []
+
+
+def test_postgresql_only_indexes_are_skipped_on_other_databases(sqlite_engine):
+    assert "ix_events_support_period" not in _index_names(sqlite_engine, "events")
+    assert "ix_events_support_period" not in create_missing_indexes(sqlite_engine)
+
+
+def test_support_period_index_is_a_gist_range_index():
+    index = next(i for i in Base.metadata.tables["events"].indexes if i.name == "ix_events_support_period")
+
+    sql = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "USING gist (tsrange(least(start_date, end_date), greatest(start_date, end_date)))" in sql
+    assert "WHERE support_id IS NOT NULL" in sql
+
+
+def test_inverted_event_periods_are_refused(sqlite_engine):
+    with pytest.raises(IntegrityError, match="check_event_period"):
+        with sqlite_engine.begin() as conn:
+            conn.execute(text("INSERT INTO events (id, start_date, end_date) "
+                              "VALUES (1, '2024-03-02 09:00:00', '2024-03-01 09:00:00')"))
@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from db.session import get_engine_settings, create_engine_from_settings, get_pool_stats
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in ("DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE", "DB_POOL_PRE_PING",
+                 "DB_STATEMENT_TIMEOUT_MS", "DB_EXECUTEMANY_MODE", "DB_INSERTMANYVALUES_PAGE_SIZE"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+def test_default_settings(clean_env):
+    settings = get_engine_settings()
+
+    assert settings["pool_size"] == 5
+    assert settings["max_overflow"] == 10
+    assert settings["pool_pre_ping"] is True
+    assert settings["statement_timeout_ms"] == 0
+
+
+def test_settings_read_from_environment(clean_env):
+    clean_env.setenv("DB_POOL_SIZE", "20")
+    clean_env.setenv("DB_MAX_OVERFLOW", "5")
+    clean_env.setenv("DB_POOL_PRE_PING", "false")
+    clean_env.setenv("DB_STATEMENT_TIMEOUT_MS", "3000")
+
+    settings = get_engine_settings()
+
+    assert settings["pool_size"] == 20
+    assert settings["max_overflow"] == 5
+    assert settings["pool_pre_ping"] is False
+    assert settings["statement_timeout_ms"] == 3000
+
+
+def test_postgresql_engine_uses_pool_settings(clean_env):
+    engine = create_engine_from_settings("postgresql://user@localhost/db", pool_size=12, max_overflow=3)
+
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 12
+    assert engine.pool._max_overflow == 3
+    assert engine.dialect.insertmanyvalues_page_size == 1000
+
+
+def test_postgresql_statement_timeout(clean_env, mocker):
+    create_engine = mocker.patch("db.session.create_engine")
+
+    create_engine_from_settings("postgresql://user@localhost/db", statement_timeout_ms=5000)
+
+    _, kwargs = create_engine.call_args
+    assert kwargs["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert kwargs["executemany_mode"] == "values_plus_batch"
+
+
+def test_sqlite_engine_ignores_pool_size(clean_env):
+    engine = create_engine_from_settings("sqlite://")
+
+    with engine.connect():
+        pass
+    assert engine.dialect.name == "sqlite"
+
+
+def test_pool_stats(clean_env):
+    engine = create_engine_from_settings("postgresql://user@localhost/db")
+
+    stats = get_pool_stats(engine)
+
+    assert stats["pool"] == "QueuePool"
+    assert stats["size"] == 5
+    assert stats["checkedout"] == 0
+    assert "status" in stats
@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from db.seed import SeedSpec, _shards, seed_database
+from models import Base, Client, Collaborator, Contract, Event, Role
+
+SPEC = SeedSpec(collaborators=6, clients_per_commercial=5, contracts_per_client=3)
+
+
+@pytest.fixture(autouse=True)
+def fast_hash():
+    with patch("db.seed.hash_password", return_value="hashed"):
+        yield
+
+
+def _file_engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _rows(engine) -> dict:
+    with sessionmaker(bind=engine)() as session:
+        return {
+            model.__tablename__: [tuple(getattr(row, column.name) for column in model.__table__.columns)
+                                  for row in session.query(model).order_by(model.id)]
+            for model in (Collaborator, Client, Contract, Event)
+        }
+
+
+def test_seed_follows_the_spec_and_the_business_rules(sqlite_engine):
+    engine = sqlite_engine
+
+    result = seed_database(engine, SPEC, chunk_size=7)
+
+    assert result["counts"]["collaborators"] == 6
+    assert result["counts"]["clients"] == 2 * 5
+    assert result["counts"]["contracts"] == 2 * 5 * 3
+    with sessionmaker(bind=engine)() as session:
+        assert sorted(role.name for role in session.query(Role)) == ["commercial", "gestion", "support"]
+        events = session.query(Event).all()
+        assert len(events) == result["counts"]["events"] == len({e.contract_id for e in events})
+        for e in events:
+            contract = session.get(Contract, e.contract_id)
+            assert contract.status
+            assert e.end_date > e.start_date
+            assert e.support_id is None or session.get(Collaborator, e.support_id).role.name == "support"
+        for contract in session.query(Contract):
+            assert contract.commercial_id == session.get(Client, contract.client_id).commercial_id
+            assert 0 <= contract.amount_left <= contract.total_amount
+
+
+def test_seed_is_deterministic_and_independent_of_the_workers(tmp_path, sqlite_engine):
+    sequential = _file_engine(tmp_path / "sequential.db")
+    parallel = _file_engine(tmp_path / "parallel.db")
+    other = sqlite_engine
+
+    seed_database(sequential, SPEC, workers=1)
+    seed_database(parallel, SPEC, workers=2)
+    seed_database(other, SeedSpec(collaborators=6, clients_per_commercial=5, contracts_per_client=3, seed=1))
+
+    assert _rows(sequential) == _rows(parallel)
+    assert _rows(sequential)["events"] != _rows(other)["events"]
+
+
+def test_seed_appends_to_existing_rows_with_unique_emails(sqlite_engine):
+    engine = sqlite_engine
+
+    seed_database(engine, SPEC)
+    second = seed_database(engine, SPEC)
+
+    rows = _rows(engine)
+    assert len(rows["clients"]) == 2 * second["counts"]["clients"]
+    assert second["users"]["gestion"] == 7
+    with sessionmaker(bind=engine)() as session:
+        assert session.query(Role).count() == 3
+
+
+def test_seed_rejects_invalid_settings(sqlite_engine):
+    with pytest.raises(ValueError):
+        seed_database(sqlite_engine, SeedSpec(collaborators=2))
+    with pytest.raises(ValueError):
+        seed_database(sqlite_engine, SPEC, workers=2)
+
+
+def test_shards_split_the_commercials_evenly():
+    assert _shards(5, 2) == [range(0, 3), range(3, 5)]
+    assert _shards(1, 4) == [range(0, 1)]
+
+
+def test_seed_never_gives_a_support_overlapping_events(sqlite_engine):
+    # A single support for about a hundred events over two years, up to two days each
+    spec = SeedSpec(collaborators=3, clients_per_commercial=40, contracts_per_client=3, unassigned_ratio=0)
+
+    result = seed_database(sqlite_engine, spec)
+
+    with sessionmaker(bind=sqlite_engine)() as session:
+        events = session.query(Event).filter(Event.support_id.isnot(None)).order_by(Event.start_date).all()
+    assert {e.support_id for e in events} == {result["users"]["support"]}
+    assert 0 < len(events) < result["counts"]["events"]
+    assert all(previous.end_date <= e.start_date for previous, e in zip(events, events[1:]))
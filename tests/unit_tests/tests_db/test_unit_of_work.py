@@ -0,0 +1,88 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dal.client_dal import ClientDAL
+from db.session import unit_of_work
+from models import Base, Client
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # File database: SQLAlchemy uses a QueuePool, like on PostgreSQL
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+def _client(email):
+    return {"name": "Client", "email": email, "creation_date": date.today()}
+
+
+def _count_clients(session_factory):
+    with unit_of_work(session_factory) as db:
+        return db.query(Client).count()
+
+
+def test_commits_on_success_and_returns_connection(engine, session_factory):
+    with unit_of_work(session_factory) as db:
+        ClientDAL(db).create(_client("a@example.com"))
+        assert engine.pool.checkedout() == 1
+
+    assert engine.pool.checkedout() == 0
+    assert _count_clients(session_factory) == 1
+
+
+def test_rolls_back_on_exception_and_returns_connection(engine, session_factory):
+    with pytest.raises(RuntimeError):
+        with unit_of_work(session_factory) as db:
+            ClientDAL(db).create(_client("a@example.com"))
+            raise RuntimeError("boom")
+
+    assert engine.pool.checkedout() == 0
+    assert _count_clients(session_factory) == 0
+
+
+def test_rolls_back_after_swallowed_flush_error(engine, session_factory):
+    with unit_of_work(session_factory) as db:
+        ClientDAL(db).create(_client("a@example.com"))
+    with unit_of_work(session_factory) as db:
+        dal = ClientDAL(db)
+        dal.create(_client("b@example.com"))
+        try:
+            dal.create(_client("a@example.com"))
+        except Exception:
+            pass
+
+    assert engine.pool.checkedout() == 0
+    assert _count_clients(session_factory) == 1
+
+
+def test_no_connection_left_after_many_commands(engine, session_factory):
+    for i in range(50):
+        with unit_of_work(session_factory) as db:
+            ClientDAL(db).create(_client(f"{i}@example.com"))
+            ClientDAL(db).get_all()
+
+    assert engine.pool.checkedout() == 0
+    assert _count_clients(session_factory) == 50
+
+
+def test_commit_and_close_called_once_per_command(mocker):
+    session = mocker.MagicMock()
+    factory = mocker.MagicMock(return_value=session)
+
+    with unit_of_work(factory):
+        pass
+
+    session.commit.assert_called_once()
+    session.rollback.assert_not_called()
+    session.close.assert_called_once()
@@ -0,0 +1,82 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from dtos.contract_batch import ContractBatch
+from dtos.contract_dto import ContractDTO
+
+
+@pytest.fixture
+def rows():
+    return [
+        (1, Decimal("1000.00"), Decimal("250.10"), date(2024, 1, 2), True, 10, 20),
+        (2, 500.5, 0, date(2024, 3, 4), False, None, None),
+    ]
+
+
+def test_batch_stores_columns_in_arrays(rows):
+    batch = ContractBatch.from_rows(rows)
+
+    assert len(batch) == 2
+    assert batch.ids.typecode == "q"
+    assert list(batch.ids) == [1, 2]
+    assert batch.amounts_left.typecode == "q"
+    assert list(batch.amounts_left) == [25010, 0]
+    assert list(batch.statuses) == [1, 0]
+
+
+def test_batch_builds_dtos_on_access(rows):
+    batch = ContractBatch.from_rows(rows)
+
+    assert batch[0] == ContractDTO(id=1, total_amount=Decimal("1000.00"), amount_left=Decimal("250.10"),
+                                   creation_date=date(2024, 1, 2), status=True, client_id=10, commercial_id=20)
+    assert batch[-1].total_amount == Decimal("500.50")
+    assert batch[-1].client_id is None
+    assert batch[-1].commercial_id is None
+    assert [c.id for c in batch] == [1, 2]
+
+
+def test_batch_keeps_amounts_exact():
+    large = Decimal("123456789012345.67")
+    batch = ContractBatch.from_rows([
+        (1, large, Decimal("0.10"), date(2024, 1, 1), True, 1, 1),
+        # SQLite returns its numerics with ten decimal places
+        (2, Decimal("100.0000000000"), Decimal("0.0000000000"), date(2024, 1, 1), True, 1, 1),
+    ])
+
+    assert [str(c.total_amount) for c in batch] == ["123456789012345.67", "100.00"]
+    assert [str(c.amount_left) for c in batch] == ["0.10", "0.00"]
+
+
+def test_batch_rescales_for_finer_amounts():
+    batch = ContractBatch.from_rows([
+        (1, Decimal("10.5"), 0, date(2024, 1, 1), True, 1, 1),
+        (2, Decimal("0.125"), 0, date(2024, 1, 1), True, 1, 1),
+    ])
+
+    assert batch.amount_scale == 3
+    assert [c.total_amount for c in batch] == [Decimal("10.5"), Decimal("0.125")]
+
+
+def test_batch_columns(rows):
+    columns = ContractBatch.from_rows(rows).to_columns()
+
+    assert columns["id"] == [1, 2]
+    assert columns["amount_left"] == [Decimal("250.10"), Decimal("0")]
+    assert columns["creation_date"] == [date(2024, 1, 2), date(2024, 3, 4)]
+    assert columns["client_id"] == [10, None]
+
+
+def test_batch_accepts_dtos(rows):
+    dtos = list(ContractBatch.from_rows(rows))
+
+    assert list(ContractBatch.from_rows(dtos)) == dtos
+
+
+def test_empty_batch():
+    batch = ContractBatch()
+
+    assert len(batch) == 0
+    assert list(batch) == []
+    with pytest.raises(IndexError):
+        batch[0]
@@ -0,0 +1,36 @@
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime
+
+import pytest
+from dtos.client_dto import ClientDTO
+from dtos.collaborator_dto import CollaboratorDTO
+from dtos.contract_dto import ContractDTO
+from dtos.event_dto import EventDTO
+from dtos.role_dto import RoleDTO
+
+
+@pytest.fixture(params=["client", "collaborator", "contract", "event", "role"])
+def dto(request):
+    return {
+        "client": ClientDTO(id=1, name="Client", email="c@example.com", phone=None, company=None,
+                            creation_date=date(2024, 1, 1), last_contact_date=None, commercial_id=1),
+        "collaborator": CollaboratorDTO(id=1, name="Collab", email="co@example.com", role_name="gestion"),
+        "contract": ContractDTO(id=1, total_amount=100.0, amount_left=0.0, creation_date=date(2024, 1, 1),
+                                status=True, client_id=1, commercial_id=1),
+        "event": EventDTO(id=1, start_date=datetime(2024, 1, 1, 9), end_date=datetime(2024, 1, 1, 18),
+                          location="Paris", attendees=10, note=None, contract_id=1, support_id=None),
+        "role": RoleDTO(id=1, name="gestion"),
+    }[request.param]
+
+
+def test_dto_is_frozen(dto):
+    with pytest.raises(FrozenInstanceError):
+        dto.id = 2
+
+
+def test_dto_has_no_instance_dict(dto):
+    assert not hasattr(dto, "__dict__")
+
+
+def test_dto_is_hashable(dto):
+    assert hash(dto) == hash(type(dto)(**{f: getattr(dto, f) for f in type(dto).__slots__}))
@@ -0,0 +1,132 @@
+import json
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import monitoring.sql_profiler as sql_profiler
+from dal.event_dal import EventDAL
+from main import cli
+from models import Client, Contract, Event
+from monitoring.sql_profiler import SQLProfiler, start_sql_profiling
+
+MANAGER = {"id": 1, "sub": "gestion@epicevents.fr", "role": "gestion"}
+
+
+@pytest.fixture
+def engine(sqlite_engine):
+    session = sessionmaker(bind=sqlite_engine)()
+    session.add_all(
+        [Client(id=1, name="Client", email="c@example.com", creation_date=date(2024, 1, 1)),
+         Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1)]
+        + [Event(id=i, start_date=datetime(2024, 2, i, 9), end_date=datetime(2024, 2, i, 18), location="Paris",
+                 contract_id=1) for i in range(1, 4)]
+    )
+    session.commit()
+    session.close()
+    yield sqlite_engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_profiler_records_latency_rows_and_dal_caller(engine, db):
+    profiler = SQLProfiler(slow_query_log=None).attach(engine)
+
+    EventDAL(db).get_all()
+    EventDAL(db).update_many([1, 2], {"location": "Lyon"})
+    profiler.detach()
+
+    select, update = profiler.records
+    assert select.caller == "dal.event_dal.EventDAL.get_all"
+    assert select.statement.startswith("SELECT")
+    assert select.duration_ms >= 0
+    assert update.caller == "dal.event_dal.EventDAL.update_where"
+    assert update.rows == 2
+
+
+def test_detach_stops_recording(engine, db):
+    profiler = SQLProfiler(slow_query_log=None).attach(engine)
+    profiler.detach()
+
+    EventDAL(db).get_all()
+
+    assert profiler.records == []
+
+
+def test_failed_statements_do_not_leave_a_start_time(engine, db):
+    profiler = SQLProfiler(slow_query_log=None).attach(engine)
+
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            db.execute(text("SELECT * FROM missing_table"))
+        db.rollback()
+    profiler.detach()
+
+    assert not db.connection().info.get(sql_profiler._START_TIMES)
+    assert profiler.records == []
+
+
+def test_summary_groups_repeated_statements(engine, db):
+    profiler = SQLProfiler(slow_query_log=None).attach(engine)
+    for event_id in (1, 2, 3):
+        EventDAL(db).get(event_id)
+    profiler.detach()
+
+    [group] = profiler.summary()
+    assert group["count"] == 3
+    assert group["caller"] == "dal.event_dal.EventDAL.get"
+    assert group["total_ms"] == pytest.approx(sum(r.duration_ms for r in profiler.records))
+    assert "SQL : 3 requête(s)" in profiler.format_summary()
+
+
+def test_slow_queries_are_logged_without_parameters(engine, db, tmp_path):
+    log = tmp_path / "slow.log"
+    profiler = SQLProfiler(record=False, slow_query_ms=0, slow_query_log=str(log)).attach(engine)
+
+    EventDAL(db).update_many([1], {"location": "Secret place"})
+    profiler.detach()
+
+    [entry] = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert profiler.records == []
+    assert entry["caller"] == "dal.event_dal.EventDAL.update_where"
+    assert entry["statement"].startswith("UPDATE events")
+    assert entry["rows"] == 1
+    assert "Secret place" not in log.read_text(encoding="utf-8")
+
+
+def test_fast_queries_are_not_logged(engine, db, tmp_path):
+    log = tmp_path / "slow.log"
+    profiler = SQLProfiler(record=False, slow_query_ms=60_000, slow_query_log=str(log)).attach(engine)
+
+    EventDAL(db).get_all()
+    profiler.detach()
+
+    assert not log.exists()
+
+
+def test_profiling_is_off_by_default():
+    with patch.object(sql_profiler, "SQL_SLOW_QUERY_LOG", ""):
+        assert start_sql_profiling(False) is None
+
+
+def test_profile_sql_prints_the_command_summary(engine):
+    factory = sessionmaker(bind=engine)
+    with patch("db.session.engine", engine), patch("cli.event_commands.Session", factory), \
+         patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=MANAGER):
+        result = CliRunner(mix_stderr=False).invoke(cli, ["--profile-sql", "event", "list"])
+
+    assert result.exit_code == 0
+    assert "Tous les événements" in result.stdout
+    assert "SQL : 1 requête(s)" in result.stderr
+    assert "dal.event_dal.EventDAL.get_all" in result.stderr
+    assert not engine.dispatch.after_cursor_execute
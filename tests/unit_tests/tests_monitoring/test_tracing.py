@@ -0,0 +1,114 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+import sentry_sdk
+from click.testing import CliRunner
+from sentry_sdk.transport import Transport
+
+import monitoring.sentry_logging as sentry_logging
+import monitoring.tracing as tracing
+from bl.event_bl import EventBL
+from dtos.contract_dto import ContractDTO
+from main import cli
+from models import Client, Contract, Event
+from monitoring.tracing import enable_tracing, traced
+from security.principal import Principal
+
+MANAGER = {"id": 1, "sub": "gestion@epicevents.fr", "role": "gestion"}
+
+
+class CapturingTransport(Transport):
+    """Keeps the envelopes in memory instead of sending them to Sentry."""
+
+    def __init__(self):
+        super().__init__()
+        self.envelopes = []
+
+    def capture_envelope(self, envelope):
+        self.envelopes.append(envelope)
+
+    def transactions(self) -> list[dict]:
+        return [item.payload.json for envelope in self.envelopes for item in envelope.items
+                if item.type == "transaction"]
+
+
+def _init(sample_rate: float) -> CapturingTransport:
+    transport = CapturingTransport()
+    with patch.object(sentry_logging, "SENTRY_DSN", "https://public@sentry.example.com/1"):
+        sentry_logging.init_sentry(transport=transport, traces_sample_rate=sample_rate,
+                                   default_integrations=False, auto_enabling_integrations=False)
+    return transport
+
+
+@pytest.fixture(autouse=True)
+def reset_sentry():
+    yield
+    sentry_sdk.get_global_scope().set_client(None)
+    enable_tracing(False)
+
+
+@pytest.fixture
+def session_factory(sqlite_session_factory):
+    session = sqlite_session_factory()
+    session.add_all([
+        Client(id=1, name="Client", email="c@example.com", creation_date=date(2024, 1, 1)),
+        Contract(id=1, total_amount=100, amount_left=0, creation_date=date(2024, 1, 1), status=True, client_id=1),
+        Event(id=1, start_date=datetime(2024, 2, 1, 9), end_date=datetime(2024, 2, 1, 18), contract_id=1),
+    ])
+    session.commit()
+    session.close()
+    yield sqlite_session_factory
+
+
+def test_command_transaction_contains_bl_and_dal_spans(session_factory):
+    transport = _init(1.0)
+
+    with patch.object(sentry_logging, "SENTRY_DSN", "https://public@sentry.example.com/1"), \
+         patch("cli.event_commands.Session", session_factory), \
+         patch("cli.auth_decorator.load_token", return_value="token"), \
+         patch("cli.auth_decorator.decode_access_token", return_value=MANAGER):
+        result = CliRunner().invoke(cli, ["event", "list"])
+    sentry_sdk.flush()
+
+    assert result.exit_code == 0
+    [transaction] = transport.transactions()
+    assert transaction["transaction"] == "event list"
+    assert transaction["contexts"]["trace"]["op"] == "cli.command"
+    spans = {(span["op"], span["description"]) for span in transaction["spans"]}
+    assert ("bl", "bl.event_bl.EventBL.list_all_events") in spans
+    assert ("db.dal", "dal.event_dal.EventDAL.get_all") in spans
+
+
+def test_password_hashing_is_traced():
+    transport = _init(1.0)
+
+    with patch("security.password.pwd_context.hash", return_value="hashed"):
+        from security.password import hash_password
+        with sentry_sdk.start_transaction(name="hash"):
+            hash_password("secret")
+    sentry_sdk.flush()
+
+    [transaction] = transport.transactions()
+    assert [span["op"] for span in transaction["spans"]] == ["security.password"]
+
+
+def test_no_span_is_created_when_sampling_is_off():
+    transport = _init(0.0)
+
+    with patch.object(tracing.sentry_sdk, "start_span") as start_span:
+        assert traced("bl")(lambda value: value * 2)(21) == 42
+        EventBL.check_contract_for_event(
+            ContractDTO(id=1, total_amount=100, amount_left=0, creation_date=None, status=True, client_id=1,
+                        commercial_id=1),
+            Principal(id=1, email="com@epicevents.fr", role="commercial"))
+    sentry_sdk.flush()
+
+    assert not tracing.is_tracing_enabled()
+    start_span.assert_not_called()
+    assert transport.transactions() == []
+
+
+def test_traced_methods_keeps_static_methods():
+    assert isinstance(vars(EventBL)["check_contract_for_event"], staticmethod)
+    assert vars(EventBL)["list_all_events"].__wrapped__.__qualname__ == "EventBL.list_all_events"